@@ -0,0 +1,155 @@
+"""Бенчмарк поиска пересекающихся бронирований.
+
+Заполняет временную таблицу с той же формой, что и bookings, и сравнивает
+старый предикат из трёх OR-веток без индекса с каноническим
+`time_from < until AND time_until > from` поверх составного индекса.
+
+Запуск: python -m src.benchmarks.booking_overlap --rows 1000000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core.database import create_engine
+from src.core.settings import get_settings
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+SLOT = timedelta(hours=2)
+DURATION = timedelta(hours=1)
+
+OLD_PREDICATE = """
+    spot_id = :spot_id AND status = 'active' AND (
+        (time_from >= :time_from AND time_from < :time_until)
+        OR (time_until > :time_from AND time_until <= :time_until)
+        OR (time_from <= :time_from AND time_until >= :time_until)
+    )
+"""
+NEW_PREDICATE = """
+    spot_id = :spot_id AND status = 'active' AND time_from < :time_until AND time_until > :time_from
+"""
+
+
+def spot_id(n: int) -> UUID:
+    # совпадает с md5(n::text)::uuid на стороне Postgres
+    return UUID(hashlib.md5(str(n).encode()).hexdigest())  # noqa: S324
+
+
+async def seed(conn: AsyncConnection, rows: int, spots: int) -> None:
+    await conn.execute(
+        text(
+            """
+            CREATE TEMP TABLE bench_bookings (
+                id uuid PRIMARY KEY,
+                spot_id uuid NOT NULL,
+                status varchar NOT NULL,
+                time_from timestamptz NOT NULL,
+                time_until timestamptz NOT NULL
+            )
+            """,
+        ),
+    )
+    # каждое место получает непрерывную цепочку непересекающихся слотов, каждая десятая бронь отменена
+    await conn.execute(
+        text(
+            """
+            INSERT INTO bench_bookings
+            SELECT
+                gen_random_uuid(),
+                md5((n % :spots + 1)::text)::uuid,
+                CASE WHEN n % 10 = 0 THEN 'cancelled' ELSE 'active' END,
+                :start + (n / :spots) * :slot,
+                :start + (n / :spots) * :slot + :duration
+            FROM generate_series(0, :rows - 1) AS n
+            """,
+        ),
+        {'rows': rows, 'spots': spots, 'start': START, 'slot': SLOT, 'duration': DURATION},
+    )
+    await conn.execute(text('ANALYZE bench_bookings'))
+
+
+async def measure(conn: AsyncConnection, predicate: str, windows: list[dict], repeat: int) -> list[float]:
+    stmt = text(f'SELECT id FROM bench_bookings WHERE {predicate}')  # noqa: S608
+    latencies = []
+    for _ in range(repeat):
+        for params in windows:
+            started = time.perf_counter()
+            await conn.execute(stmt, params)
+            latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+async def explain(conn: AsyncConnection, predicate: str, params: dict) -> str:
+    result = await conn.execute(
+        text(f'EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM bench_bookings WHERE {predicate}'),  # noqa: S608
+        params,
+    )
+    return '\n'.join(row[0] for row in result)
+
+
+def report(name: str, latencies: list[float]) -> None:
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f'{name:<28} p50={statistics.median(latencies):8.3f}ms p95={p95:8.3f}ms max={latencies[-1]:8.3f}ms')
+
+
+async def main(rows: int, spots: int, queries: int, repeat: int) -> None:
+    engine = create_engine(get_settings())
+    slots = rows // spots
+    windows = []
+    for _ in range(queries):
+        time_from = START + SLOT * random.randrange(slots) + timedelta(minutes=random.randrange(120))  # noqa: S311
+        windows.append(
+            {
+                'spot_id': spot_id(random.randrange(spots) + 1),  # noqa: S311
+                'time_from': time_from,
+                'time_until': time_from + timedelta(hours=random.randint(1, 4)),  # noqa: S311
+            },
+        )
+
+    try:
+        async with engine.connect() as conn:
+            print(f'seeding {rows} bookings for {spots} spots...')
+            await seed(conn, rows, spots)
+
+            before = await measure(conn, OLD_PREDICATE, windows, repeat)
+            before_plan = await explain(conn, OLD_PREDICATE, windows[0])
+
+            await conn.execute(
+                text(
+                    'CREATE INDEX ix_bench_bookings_spot_id_status_time_from_time_until '
+                    'ON bench_bookings (spot_id, status, time_from, time_until)',
+                ),
+            )
+            await conn.execute(text('ANALYZE bench_bookings'))
+
+            after = await measure(conn, NEW_PREDICATE, windows, repeat)
+            after_plan = await explain(conn, NEW_PREDICATE, windows[0])
+
+            await conn.rollback()
+    finally:
+        await engine.dispose()
+
+    report('before (OR, no index)', before)
+    report('after (canonical, index)', after)
+    print('\nbefore plan:\n' + before_plan)
+    print('\nafter plan:\n' + after_plan)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--spots', type=int, default=500)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.spots, args.queries, args.repeat))
@@ -0,0 +1,102 @@
+"""Микробенчмарк кодирования событий.
+
+Сравнивает прежнюю схему (json.dumps по __dict__ и угадывание datetime/UUID
+при разборе) с кодеком по схеме dataclass на orjson.
+
+Запуск: python -m src.benchmarks.event_codec --iterations 100000
+"""
+
+import argparse
+import contextlib
+import json
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from typing import Any
+from uuid import UUID, uuid4
+
+from src.core.event_codec import get_codec
+from src.modules.bookings.domain.events import BookingCreated
+from src.modules.users.domain.events import UserCreated
+
+
+def legacy_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    msg = f'Object of type {obj.__class__.__name__} is not JSON serializable'
+    raise TypeError(msg)
+
+
+def legacy_encode(event: Any) -> bytes:
+    return json.dumps(event.__dict__, default=legacy_default).encode()
+
+
+def legacy_decode(event_type: type[Any], body: bytes) -> Any:
+    data = json.loads(body.decode())
+    for key, value in data.items():
+        if isinstance(value, str):
+            try:
+                data[key] = datetime.fromisoformat(value)
+            except ValueError:
+                if key.endswith('_id') or key == 'id':
+                    with contextlib.suppress(ValueError):
+                        data[key] = UUID(value)
+    return event_type(**data)
+
+
+def measure(fn: Callable[[], Any], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - started)
+
+
+def main(iterations: int) -> None:
+    now = datetime.now(UTC)
+    events = [
+        BookingCreated(
+            booking_id=uuid4(),
+            user_id=uuid4(),
+            spot_id=uuid4(),
+            time_from=now,
+            time_until=now + timedelta(hours=1),
+            timestamp=now,
+        ),
+        UserCreated(user_id=uuid4(), email='user@example.com', full_name='Иван Иванов', timestamp=now),
+    ]
+
+    for event in events:
+        event_type = type(event)
+        codec = get_codec(event_type)
+        legacy_body = legacy_encode(event)
+        body = codec.encode(event)
+
+        assert legacy_decode(event_type, legacy_body) == event  # noqa: S101
+        assert codec.decode(body) == event  # noqa: S101
+
+        rows = (
+            ('legacy encode', measure(lambda event=event: legacy_encode(event), iterations)),
+            ('codec encode', measure(lambda event=event, codec=codec: codec.encode(event), iterations)),
+            (
+                'legacy decode',
+                measure(lambda t=event_type, b=legacy_body: legacy_decode(t, b), iterations),
+            ),
+            ('codec decode', measure(lambda codec=codec, b=body: codec.decode(b), iterations)),
+        )
+
+        print(f'{event_type.__name__} ({len(legacy_body)} -> {len(body)} bytes)')
+        for label, rate in rows:
+            print(f'  {label:<14} {rate:12.0f} ops/s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=100000)
+    args = parser.parse_args()
+
+    main(args.iterations)
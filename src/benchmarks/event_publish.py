@@ -0,0 +1,93 @@
+"""Бенчмарк публикации событий через RabbitMQEventBus.
+
+Вместо брокера подставляет канал в памяти, где каждая операция стоит один
+сетевой round trip заданной длины, а подтверждения приходят конвейером.
+Сравнивает объявление обменника перед каждой публикацией (как было раньше),
+кэш обменников и пакетную публикацию с ожиданием подтверждений пачкой.
+
+Запуск: python -m src.benchmarks.event_publish --events 2000 --rtt 1 --batch 100
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+from src.core.events import RabbitMQEventBus
+from src.modules.bookings.domain.events import BookingCreated
+
+
+class FakeExchange:
+    def __init__(self, rtt: float) -> None:
+        self.rtt = rtt
+        self.published = 0
+
+    async def publish(self, message: Any, routing_key: str) -> None:
+        await asyncio.sleep(self.rtt)
+        self.published += 1
+
+
+class FakeChannel:
+    def __init__(self, rtt: float) -> None:
+        self.rtt = rtt
+        self.declared = 0
+        self.exchanges: dict[str, FakeExchange] = {}
+
+    async def declare_exchange(self, name: str, *_: Any, **__: Any) -> FakeExchange:
+        await asyncio.sleep(self.rtt)
+        self.declared += 1
+        return self.exchanges.setdefault(name, FakeExchange(self.rtt))
+
+
+def make_event() -> BookingCreated:
+    now = datetime.now(UTC)
+    return BookingCreated(
+        booking_id=uuid4(),
+        user_id=uuid4(),
+        spot_id=uuid4(),
+        time_from=now,
+        time_until=now + timedelta(hours=1),
+        timestamp=now,
+    )
+
+
+async def run(events: list[BookingCreated], rtt: float, mode: str, batch: int) -> tuple[float, int]:
+    settings = SimpleNamespace(rabbitmq=SimpleNamespace(publish_batch_size=batch, publish_batch_window=0))
+    bus = RabbitMQEventBus(settings)  # type: ignore
+    channel = FakeChannel(rtt)
+    bus._channel = channel  # type: ignore  # noqa: SLF001
+
+    started = time.perf_counter()
+    if mode == 'batched':
+        for i in range(0, len(events), batch):
+            await bus.publish_many(events[i : i + batch])
+    else:
+        for event in events:
+            if mode == 'declare each':
+                bus._forget_exchanges()  # noqa: SLF001
+            await bus.publish(event)
+    return time.perf_counter() - started, channel.declared
+
+
+async def main(count: int, rtt: float, batch: int) -> None:
+    events = [make_event() for _ in range(count)]
+
+    for mode in ('declare each', 'cached', 'batched'):
+        elapsed, declared = await run(events, rtt, mode, batch)
+        print(
+            f'{mode:<13} {count} events in {elapsed:7.2f}s ({count / elapsed:9.1f} ev/s), '
+            f'declare_exchange calls: {declared}',
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--events', type=int, default=2000)
+    parser.add_argument('--rtt', type=float, default=1, help='задержка одной операции с брокером, мс')
+    parser.add_argument('--batch', type=int, default=100)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.events, args.rtt / 1000, args.batch))
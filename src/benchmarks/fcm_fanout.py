@@ -0,0 +1,115 @@
+"""Бенчмарк рассылки уведомлений через FCMNotificationService.
+
+Поднимает локальный фейковый FCM с заданной задержкой ответа и сравнивает
+последовательную отправку (max_concurrency=1) с параллельной.
+
+Запуск: python -m src.benchmarks.fcm_fanout --users 2000 --tokens 2 --latency 20
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+import aiohttp
+from aiohttp import web
+
+from src.modules.notifications.domain.entities import DeviceToken, NotificationType
+from src.modules.notifications.infrastructure.services.fcm_service import FCMNotificationService, FcmQuota
+
+
+class InMemoryDeviceTokens:
+    def __init__(self, tokens: dict[UUID, list[DeviceToken]]) -> None:
+        self.tokens = tokens
+
+    async def get_by_user_id(self, user_id: UUID) -> list[DeviceToken]:
+        return self.tokens.get(user_id, [])
+
+    async def get_by_user_ids(self, user_ids: list[UUID]) -> dict[UUID, list[DeviceToken]]:
+        return {user_id: self.tokens.get(user_id, []) for user_id in user_ids}
+
+    async def delete_by_token(self, token: str) -> None:
+        pass
+
+
+class StaticAuth:
+    project_id = 'benchmark'
+
+    async def get_access_token(self) -> str:
+        return 'benchmark'
+
+
+async def start_fake_fcm(latency: float) -> tuple[web.AppRunner, str]:
+    async def send(_: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response({'name': f'projects/benchmark/messages/{uuid4()}'})
+
+    app = web.Application()
+    app.router.add_post('/v1/projects/{project}/messages:send', send)
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+
+    host, port = runner.addresses[0][:2]
+    return runner, f'http://{host}:{port}/v1/projects/benchmark/messages:send'
+
+
+async def run(url: str, tokens: InMemoryDeviceTokens, user_ids: list[UUID], concurrency: int) -> float:
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=60)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        service = FCMNotificationService(
+            tokens,  # type: ignore
+            StaticAuth(),  # type: ignore
+            session,
+            FcmQuota(max_concurrency=concurrency, max_retries=0),
+        )
+        service.fcm_url = url
+
+        started = time.perf_counter()
+        results = await service.send_notification_to_multiple_users(
+            user_ids,
+            NotificationType.SYSTEM,
+            'Benchmark',
+            'Benchmark',
+        )
+        elapsed = time.perf_counter() - started
+
+    assert all(results.values())  # noqa: S101
+    return elapsed
+
+
+async def main(users: int, tokens_per_user: int, latency: float, concurrency: int) -> None:
+    now = datetime.now(UTC)
+    user_ids = [uuid4() for _ in range(users)]
+    tokens = InMemoryDeviceTokens(
+        {
+            user_id: [
+                DeviceToken(id=uuid4(), user_id=user_id, token=uuid4().hex, device_type='android', created_at=now)
+                for _ in range(tokens_per_user)
+            ]
+            for user_id in user_ids
+        },
+    )
+    messages = users * tokens_per_user
+
+    runner, url = await start_fake_fcm(latency / 1000)
+    try:
+        for limit in (1, concurrency):
+            elapsed = await run(url, tokens, user_ids, limit)
+            print(f'concurrency={limit:<4} {messages} messages in {elapsed:8.2f}s ({messages / elapsed:10.1f} msg/s)')
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--tokens', type=int, default=2)
+    parser.add_argument('--latency', type=float, default=20, help='задержка фейкового FCM, мс')
+    parser.add_argument('--concurrency', type=int, default=64)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.tokens, args.latency, args.concurrency))
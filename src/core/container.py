@@ -4,6 +4,7 @@ from src.core.di import (
     ConfigProvider,
     DatabaseProvider,
     EventBusProvider,
+    HttpClientProvider,
     PasswordHasherProvider,
     S3StorageProvider,
 )
@@ -20,6 +21,7 @@ container = make_async_container(
     ConfigProvider(),
     DatabaseProvider(),
     EventBusProvider(),
+    HttpClientProvider(),
     LoggerProvider(),
     PasswordHasherProvider(),
     S3StorageProvider(),
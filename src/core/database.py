@@ -1,5 +1,10 @@
+import hashlib
+import hmac
+import time
 import uuid
-from collections.abc import AsyncGenerator, Sequence
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import (
     Any,
     Optional,
@@ -18,15 +23,76 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import ConnectionPoolEntry
 from sqlalchemy.sql import Select
 
-from src.core.settings import Settings, get_settings
+from src.core.logging import get_logger
+from src.core.metrics import DB_POOL_CHECKED_OUT, DB_POOL_CHECKOUT_SECONDS, DB_POOL_SATURATION
+from src.core.settings import Settings
 
+logger = get_logger(__name__)
+
+
+class InstrumentedQueuePool(sqlalchemy.pool.AsyncAdaptedQueuePool):
+    """Пул соединений, отдающий в Prometheus время ожидания и загрузку."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(self._orig_logging_name or 'primary').observe(
+                time.perf_counter() - started,
+            )
+            self._report_usage()
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        self._report_usage()
+
+    def _report_usage(self) -> None:
+        checked_out = self.checkedout()
+        capacity = self.size() + max(self._max_overflow, 0)
+        database = self._orig_logging_name or 'primary'
+
+        DB_POOL_CHECKED_OUT.labels(database).set(checked_out)
+        DB_POOL_SATURATION.labels(database).set(checked_out / capacity if capacity else 0)
+
+
+def create_engine(settings: Settings, replica: bool = False) -> AsyncEngine:
+    postgres = settings.postgres
+    url = postgres.replica_url if replica else postgres.url
+
+    connect_args: dict[str, Any] = {
+        'statement_cache_size': postgres.statement_cache_size,
+        'prepared_statement_cache_size': postgres.statement_cache_size,
+    }
+    if postgres.pgbouncer:
+        # pgbouncer в режиме transaction не гарантирует, что prepared statement
+        # окажется на том же серверном соединении, поэтому кэши выключены, а имена уникальны
+        connect_args = {
+            'statement_cache_size': 0,
+            'prepared_statement_cache_size': 0,
+            'prepared_statement_name_func': lambda: f'__asyncpg_{uuid.uuid4()}__',
+        }
+
+    if not postgres.use_pool:
+        return create_async_engine(
+            url,
+            poolclass=sqlalchemy.pool.NullPool,
+            connect_args=connect_args,
+        )
 
-def create_engine(settings: Settings) -> AsyncEngine:
     return create_async_engine(
-        settings.postgres.url,
-        poolclass=sqlalchemy.pool.NullPool,
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name='replica' if replica else 'primary',
+        pool_size=postgres.pool_size,
+        max_overflow=postgres.max_overflow,
+        pool_timeout=postgres.pool_timeout,
+        pool_recycle=postgres.pool_recycle,
+        pool_pre_ping=postgres.pool_pre_ping,
+        connect_args=connect_args,
     )
 
 
@@ -57,7 +123,9 @@ class AsyncSessionProtocol(Protocol):
 
     def add(self, instance: Any) -> None: ...
 
-    async def refresh(self, instance: Any) -> None: ...
+    async def flush(self) -> None: ...
+
+    async def refresh(self, instance: Any, attribute_names: Optional[Sequence[str]] = None) -> None: ...
 
     async def get(
         self,
@@ -74,11 +142,77 @@ class AsyncSessionProtocol(Protocol):
     ) -> Result[Any]: ...
 
 
+class ReadOnlySessionProtocol(AsyncSessionProtocol, Protocol):
+    """Сессия query-стороны: реплика, если она настроена, иначе основная сессия запроса."""
+
+
+_use_primary: ContextVar[bool] = ContextVar('use_primary', default=False)
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """Внутри блока query-сторона читает из основной базы, а не с реплики."""
+    token = _use_primary.set(True)
+    try:
+        yield
+    finally:
+        _use_primary.reset(token)
+
+
+def is_primary_forced() -> bool:
+    return _use_primary.get()
+
+
+class ReadYourWrites:
+    """Отметка о недавней записи клиента, чтобы его чтения не отставали от реплики.
+
+    Срок окна хранится не в памяти процесса, а в подписанной куке у клиента: её одинаково
+    проверяет любой воркер и любая реплика приложения с тем же секретом.
+    """
+
+    cookie = 'read_your_writes'
+
+    def __init__(self, window: float, secret: str) -> None:
+        self.window = window
+        self._secret = secret.encode()
+
+    def mark(self, key: str) -> str:
+        """Возвращает значение куки, действительное window секунд."""
+        deadline = f'{time.time() + self.window:.3f}'
+        return f'{deadline}.{self._sign(key, deadline)}'
+
+    def is_recent(self, key: str, token: Optional[str]) -> bool:
+        if not token:
+            return False
+
+        deadline, _, signature = token.rpartition('.')
+        if not hmac.compare_digest(signature, self._sign(key, deadline)):
+            return False
+
+        try:
+            return float(deadline) > time.time()
+        except ValueError:
+            return False
+
+    def _sign(self, key: str, deadline: str) -> str:
+        # ключ входит в подпись, чтобы куку одного пользователя нельзя было предъявить от другого
+        return hmac.new(self._secret, f'{key}:{deadline}'.encode(), hashlib.sha256).hexdigest()
+
+
+class Replica:
+    def __init__(self, engine: Optional[AsyncEngine] = None) -> None:
+        self.engine = engine
+        self.session_maker = create_async_session_maker(engine) if engine is not None else None
+
+
 class TransactionManager:
     def __init__(self, session: AsyncSessionProtocol) -> None:
         self._session = session
+        self._depth = 0
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
 
     async def __aenter__(self) -> 'TransactionManager':
+        self._depth += 1
         return self
 
     async def __aexit__(
@@ -87,19 +221,39 @@ class TransactionManager:
         exc_val: Optional[BaseException],
         exc_tb: Optional[Any],
     ) -> None:
+        self._depth -= 1
         if exc_type is not None:
+            self._after_commit.clear()
             await self._session.rollback()
-        else:
-            await self._session.commit()
+            return
+
+        callbacks, self._after_commit = self._after_commit, []
+        await self._session.commit()
+
+        # изменения уже закоммичены: сбой колбэка не должен превращать успешную запись в ошибку запроса
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                logger.exception('After-commit callback failed')
 
     @property
-    def session(self) -> AsyncSessionProtocol:
-        return self._session
+    def in_transaction(self) -> bool:
+        return self._depth > 0
 
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Откладывает вызов до успешного коммита, при откате он отбрасывается."""
+        self._after_commit.append(callback)
 
-AsyncSessionLocal = create_async_session_maker(create_engine(get_settings()))
+    @property
+    def session(self) -> AsyncSessionProtocol:
+        return self._session
 
 
 async def get_db() -> AsyncGenerator[AsyncSessionProtocol, None]:
-    async with AsyncSessionLocal() as session:
+    # движок один на приложение и принадлежит контейнеру, импорт здесь из-за цикла container -> di -> database
+    from src.core.container import container
+
+    session_maker = await container.get(async_sessionmaker[AsyncSession])
+    async with session_maker() as session:
         yield session
@@ -1,15 +1,21 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
 
+import aiohttp
 from dishka import Provider, Scope, provide  # type: ignore
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from src.core.database import (
     AsyncSessionProtocol,
+    ReadOnlySessionProtocol,
+    ReadYourWrites,
+    Replica,
     TransactionManager,
     create_async_session_maker,
     create_engine,
+    is_primary_forced,
 )
 from src.core.events import EventBus, create_event_bus
+from src.core.outbox import AfterCommitEventBus, OutboxEventBus, TransactionalEventBus
 from src.core.settings import Settings, get_settings
 from src.modules.auth.domain.services import (
     PasswordHasher,
@@ -24,14 +30,31 @@ from src.modules.storage.infrastructure.s3.repository import S3StorageRepository
 
 class EventBusProvider(Provider):
     @provide(scope=Scope.APP)
-    def get_event_bus(self, settings: Settings) -> EventBus:
-        return create_event_bus(settings)
+    async def get_event_bus(self, settings: Settings) -> AsyncGenerator[EventBus, None]:
+        event_bus = create_event_bus(settings)
+        yield event_bus
+        # доотправляет накопленные публикации и дожидается обработчиков в памяти
+        await event_bus.disconnect()
+
+    @provide(scope=Scope.REQUEST)
+    def get_transactional_event_bus(
+        self,
+        settings: Settings,
+        event_bus: EventBus,
+        transaction_manager: TransactionManager,
+    ) -> TransactionalEventBus:
+        # шина в памяти живёт внутри процесса, relay из раннера до её подписчиков не достанет
+        if not settings.rabbitmq.use or not settings.outbox.use:
+            return AfterCommitEventBus(transaction_manager, event_bus)
+        return OutboxEventBus(transaction_manager, event_bus)
 
 
 class DatabaseProvider(Provider):
     @provide(scope=Scope.APP)
-    def get_engine(self, settings: Settings) -> AsyncEngine:
-        return create_engine(settings)
+    async def get_engine(self, settings: Settings) -> AsyncGenerator[AsyncEngine, None]:
+        engine = create_engine(settings)
+        yield engine
+        await engine.dispose()
 
     @provide(scope=Scope.APP)
     def get_session_maker(
@@ -48,6 +71,33 @@ class DatabaseProvider(Provider):
         async with session_maker() as session:
             yield session
 
+    @provide(scope=Scope.APP)
+    async def get_replica(self, settings: Settings) -> AsyncGenerator[Replica, None]:
+        if settings.postgres.replica_url is None:
+            yield Replica()
+            return
+
+        engine = create_engine(settings, replica=True)
+        yield Replica(engine)
+        await engine.dispose()
+
+    @provide(scope=Scope.APP)
+    def get_read_your_writes(self, settings: Settings) -> ReadYourWrites:
+        return ReadYourWrites(settings.postgres.read_your_writes_window, settings.jwt.secret)
+
+    @provide(scope=Scope.REQUEST)
+    async def get_read_session(
+        self,
+        replica: Replica,
+        session: AsyncSessionProtocol,
+    ) -> AsyncGenerator[ReadOnlySessionProtocol, None]:
+        if replica.session_maker is None or is_primary_forced():
+            yield session
+            return
+
+        async with replica.session_maker() as read_session:
+            yield read_session
+
     @provide(scope=Scope.REQUEST)
     def get_transaction_manager(
         self,
@@ -56,10 +106,29 @@ class DatabaseProvider(Provider):
         return TransactionManager(session)
 
 
+class HttpClientProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def get_http_session(self, settings: Settings) -> AsyncGenerator[aiohttp.ClientSession, None]:
+        connector = aiohttp.TCPConnector(
+            limit=settings.http.limit,
+            limit_per_host=settings.http.limit_per_host,
+            keepalive_timeout=settings.http.keepalive_timeout,
+            ttl_dns_cache=settings.http.dns_cache_ttl,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=settings.http.timeout),
+        )
+        yield session
+        await session.close()
+
+
 class PasswordHasherProvider(Provider):
     @provide(scope=Scope.APP)
-    def get_password_hasher(self) -> PasswordHasher:
-        return ArgonPasswordHasher()
+    def get_password_hasher(self, settings: Settings) -> Iterator[PasswordHasher]:
+        hasher = ArgonPasswordHasher(settings)
+        yield hasher
+        hasher.close()
 
 
 class ConfigProvider(Provider):
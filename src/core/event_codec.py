@@ -0,0 +1,85 @@
+import dataclasses
+import types
+import typing
+from collections.abc import Callable
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional, Union
+from uuid import UUID
+
+import orjson
+
+# версия формата в content-type сообщения: несовместимое изменение кодека заводит новый тип
+EVENT_CONTENT_TYPE = 'application/vnd.event.v1+json'
+# так помечены сообщения, опубликованные до кодека, их схема та же
+LEGACY_CONTENT_TYPE = 'application/json'
+
+FieldDecoder = Callable[[Any], Any]
+
+
+def _field_decoder(hint: Any) -> Optional[FieldDecoder]:
+    """Возвращает преобразование JSON-значения в тип поля или None, если значение подходит как есть."""
+    if typing.get_origin(hint) in (Union, types.UnionType):
+        args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        inner = _field_decoder(args[0]) if len(args) == 1 else None
+        if inner is None:
+            return None
+        return lambda value: None if value is None else inner(value)
+
+    if hint is datetime:
+        return datetime.fromisoformat
+    if hint is UUID:
+        return UUID
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return hint
+    return None
+
+
+class EventCodec:
+    """Кодек одного класса событий, схема берётся из аннотаций полей dataclass."""
+
+    def __init__(self, event_type: type[Any]) -> None:
+        if not dataclasses.is_dataclass(event_type):
+            msg = f'Event {event_type.__name__} must be a dataclass'
+            raise TypeError(msg)
+
+        hints = typing.get_type_hints(event_type)
+        self.event_type = event_type
+        self._decoders = [
+            (field.name, decoder)
+            for field in dataclasses.fields(event_type)
+            if (decoder := _field_decoder(hints[field.name])) is not None
+        ]
+
+    def encode(self, event: Any) -> bytes:
+        # orjson сам раскладывает dataclass, datetime, UUID и Enum
+        return orjson.dumps(event)
+
+    def decode(self, body: bytes) -> Any:
+        data = orjson.loads(body)
+        for name, decoder in self._decoders:
+            if name in data:
+                data[name] = decoder(data[name])
+        return self.event_type(**data)
+
+
+_codecs: dict[type[Any], EventCodec] = {}
+
+
+def get_codec(event_type: type[Any]) -> EventCodec:
+    """Возвращает кодек класса события, разбирая его схему при первом обращении."""
+    codec = _codecs.get(event_type)
+    if codec is None:
+        codec = _codecs[event_type] = EventCodec(event_type)
+    return codec
+
+
+def encode_event(event: Any) -> bytes:
+    return get_codec(type(event)).encode(event)
+
+
+def decode_event(event_type: type[Any], body: bytes, content_type: Optional[str] = None) -> Any:
+    if content_type not in (None, EVENT_CONTENT_TYPE, LEGACY_CONTENT_TYPE):
+        msg = f'Unsupported event content type: {content_type}'
+        raise ValueError(msg)
+    return get_codec(event_type).decode(body)
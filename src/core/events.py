@@ -1,70 +1,87 @@
-import contextlib
-import json
+import asyncio
+import time
 import typing
 from asyncio import create_task, gather
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import datetime
-from enum import Enum
 from typing import (
     Any,
+    Optional,
     Protocol,
     runtime_checkable,
 )
-from uuid import UUID
 
 import aio_pika
 from aio_pika.abc import (
     AbstractChannel,
-    AbstractConnection,
+    AbstractExchange,
     AbstractIncomingMessage,
     AbstractQueue,
+    AbstractRobustConnection,
 )
 from aio_pika.exchange import ExchangeType
 
+from src.core.event_codec import EVENT_CONTENT_TYPE, decode_event, encode_event
 from src.core.logging import get_logger, log_extra
-from src.core.settings import Settings
+from src.core.metrics import (
+    EVENT_BUS_DROPPED,
+    EVENT_BUS_HANDLER_SECONDS,
+    EVENT_BUS_QUEUE_DEPTH,
+    EVENTS_DEAD_LETTERED,
+    EVENTS_RETRIED,
+)
+from src.core.settings import DispatchOverflow, Settings
 
 logger = get_logger(__name__)
 
 # Тип для обработчиков событий
 EventHandler = Callable[[Any], Awaitable[None]]
 
+# номер попытки доставки, первая доставка идёт без заголовка
+ATTEMPT_HEADER = 'x-attempt'
+ERROR_HEADER = 'x-error'
+# обработчики, уже успешно обработавшие сообщение: при повторе их не вызывают второй раз
+HANDLED_HEADER = 'x-handled'
 
-def serialize_datetime(obj: Any) -> Any:
-    """Сериализует объекты datetime в ISO формат и UUID в строки для JSON."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    if isinstance(obj, UUID):
-        return str(obj)
-    if isinstance(obj, Enum):
-        return obj.value
-    msg = f'Object of type {obj.__class__.__name__} is not JSON serializable'
-    raise TypeError(msg)
 
+def serialize_event(event: Any) -> bytes:
+    """Сериализует событие в тело сообщения для брокера."""
+    try:
+        return encode_event(event)
+    except TypeError as e:
+        event_name = event.__class__.__name__
+        logger.exception(
+            'Event serialization failed',
+            **log_extra(
+                event_type=event_name,
+                event=str(event),
+                error=str(e),
+                error_type=e.__class__.__name__,
+            ),
+        )
+        raise
 
-def deserialize_datetime(data: dict[str, Any]) -> dict[str, Any]:
-    """Десериализует ISO формат строк обратно в объекты datetime и строки UUID в объекты UUID."""
-    for key, value in data.items():
-        if isinstance(value, str):
-            try:
-                data[key] = datetime.fromisoformat(value)
-            except ValueError:
-                # Try to convert to UUID if it looks like a UUID
-                if key.endswith('_id') or key == 'id':
-                    with contextlib.suppress(ValueError):
-                        data[key] = UUID(value)
-                # If the string is not in ISO format, leave it as is
-    return data
-
-
-async def handle_event_safely(handler: EventHandler, event: Any) -> None:
-    """Вызывает асинхронный обработчик события с обработкой исключений."""
+
+async def handle_event_safely(handler: EventHandler, event: Any) -> Optional[Exception]:
+    """Вызывает асинхронный обработчик события с обработкой исключений. Возвращает ошибку обработчика."""
     try:
         await handler(event)
-    except Exception:
+    except Exception as e:
         logger.exception('Error in event handler')
+        return e
+    return None
+
+
+def handler_name(handler: EventHandler) -> str:
+    """Имя обработчика, одинаковое во всех процессах: по нему повтор узнаёт уже отработавших."""
+    owner = getattr(handler, '__self__', None)
+    if owner is not None:
+        # у метода берём класс экземпляра: унаследованный метод иначе назывался бы по базовому классу
+        return f'{type(owner).__module__}.{type(owner).__qualname__}.{handler.__name__}'
+    module = getattr(handler, '__module__', None) or type(handler).__module__
+    qualname = getattr(handler, '__qualname__', None) or type(handler).__qualname__
+    return f'{module}.{qualname}'
 
 
 @dataclass
@@ -79,33 +96,110 @@ class EventSubscription:
 class EventBus(Protocol):
     """Протокол для шины событий."""
 
-    async def subscribe(self, event_type: type[Any], handler: EventHandler) -> None: ...
+    async def subscribe(self, event_type: type[Any], handler: EventHandler, broadcast: bool = False) -> None: ...  # noqa
     async def unsubscribe(
         self,
         event_type: type[Any],
         handler: EventHandler,
     ) -> None: ...
     async def publish(self, event: Any) -> None: ...
+    async def publish_many(self, events: Sequence[Any]) -> None: ...
     async def connect(self) -> None: ...
     async def disconnect(self) -> None: ...
 
 
 class InMemoryEventBus:
-    """Реализация шины событий в памяти."""
+    """Реализация шины событий в памяти.
 
-    def __init__(self, raise_exceptions: bool = False) -> None:  # noqa
+    При workers > 0 publish только ставит пары (подписка, событие) в ограниченную очередь,
+    а обработчики выполняют фоновые диспетчеры, и медленный обработчик не задерживает запрос.
+    При workers = 0 обработчики вызываются прямо в publish.
+    """
+
+    def __init__(
+        self,
+        raise_exceptions: bool = False,  # noqa
+        workers: int = 0,
+        max_queue: int = 10000,
+        overflow: DispatchOverflow = DispatchOverflow.BLOCK,
+        drain_timeout: float = 10,
+    ) -> None:
         self._subscriptions: dict[str, list[EventSubscription]] = {}
         self._active = True
         self._raise_exceptions = raise_exceptions
+        self._workers_count = workers
+        self._max_queue = max_queue
+        self._overflow = overflow
+        self._drain_timeout = drain_timeout
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[EventSubscription, Any]] | None = None
+        self._workers: list[asyncio.Task[None]] = []
 
     async def connect(self) -> None:
-        """Заглушка для метода подключения."""
+        """Запускает диспетчеры в текущем event loop."""
+        self._ensure_dispatcher()
 
     async def disconnect(self) -> None:
-        """Заглушка для метода отключения."""
+        """Дожидается обработки уже принятых событий, но не дольше drain_timeout, и останавливает диспетчеры."""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return
 
-    async def subscribe(self, event_type: type[Any], handler: EventHandler) -> None:
-        """Подписывает обработчик на событие."""
+        try:
+            await asyncio.wait_for(self._queue.join(), self._drain_timeout)
+        except TimeoutError:
+            logger.warning('Event queue was not drained in time', **log_extra(left=self._queue.qsize()))
+
+        for worker in self._workers:
+            worker.cancel()
+        await gather(*self._workers, return_exceptions=True)
+
+        self._loop = None
+        self._queue = None
+        self._workers = []
+        EVENT_BUS_QUEUE_DEPTH.set(0)
+
+    def _ensure_dispatcher(self) -> asyncio.Queue[tuple[EventSubscription, Any]] | None:
+        if self._workers_count <= 0:
+            return None
+
+        # очередь и задачи привязаны к event loop: в новом loop (например, в тестах) запускаем их заново
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            previous = self._queue
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+            self._workers = [loop.create_task(self._dispatch(self._queue)) for _ in range(self._workers_count)]
+            if previous is not None:
+                self._carry_over(previous, self._queue)
+        return self._queue
+
+    @staticmethod
+    def _carry_over(
+        previous: asyncio.Queue[tuple[EventSubscription, Any]],
+        queue: asyncio.Queue[tuple[EventSubscription, Any]],
+    ) -> None:
+        """Переносит в новую очередь события, которые диспетчеры прежнего loop уже не обработают."""
+        moved = 0
+        # размер очередей одинаковый, поэтому всё перенесённое помещается
+        while not previous.empty():
+            queue.put_nowait(previous.get_nowait())
+            moved += 1
+
+        if moved:
+            logger.warning('Event loop changed, pending events moved to the new dispatchers', **log_extra(moved=moved))
+            EVENT_BUS_QUEUE_DEPTH.set(queue.qsize())
+
+    async def _dispatch(self, queue: asyncio.Queue[tuple[EventSubscription, Any]]) -> None:
+        while True:
+            subscription, event = await queue.get()
+            EVENT_BUS_QUEUE_DEPTH.set(queue.qsize())
+            try:
+                await self._process_event(subscription, event)
+            finally:
+                queue.task_done()
+
+    async def subscribe(self, event_type: type[Any], handler: EventHandler, broadcast: bool = False) -> None:  # noqa
+        """Подписывает обработчик на событие. В памяти каждое событие и так видят все подписчики процесса."""
         event_name = event_type.__name__
         if event_name not in self._subscriptions:
             self._subscriptions[event_name] = []
@@ -120,18 +214,57 @@ class InMemoryEventBus:
             ]
 
     async def publish(self, event: Any) -> None:
-        """Публикует событие, вызывая все подписанные обработчики асинхронно."""
+        """Публикует событие: ставит его в очередь диспетчеров или, без них, сразу вызывает обработчики."""
         if not self._active:
             return
         event_name = event.__class__.__name__
         if event_name not in self._subscriptions:
             return
+
+        queue = self._ensure_dispatcher()
         for subscription in self._subscriptions[event_name]:
-            await create_task(self._process_event(subscription, event))
+            if queue is None:
+                await self._process_event(subscription, event)
+            else:
+                await self._enqueue(queue, subscription, event)
+
+    async def _enqueue(
+        self,
+        queue: asyncio.Queue[tuple[EventSubscription, Any]],
+        subscription: EventSubscription,
+        event: Any,
+    ) -> None:
+        item = (subscription, event)
+        if self._overflow == DispatchOverflow.BLOCK:
+            # backpressure: при полной очереди publish ждёт, пока диспетчеры освободят место
+            await queue.put(item)
+        else:
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                dropped = item
+                if self._overflow == DispatchOverflow.DROP_OLDEST:
+                    dropped = queue.get_nowait()
+                    queue.task_done()
+                    queue.put_nowait(item)
+                EVENT_BUS_DROPPED.labels(dropped[1].__class__.__name__).inc()
+                logger.warning(
+                    'Event queue is full, event dropped',
+                    **log_extra(event_type=dropped[1].__class__.__name__, policy=self._overflow.value),
+                )
+
+        EVENT_BUS_QUEUE_DEPTH.set(queue.qsize())
+
+    async def publish_many(self, events: Sequence[Any]) -> None:
+        """Публикует события по очереди, в памяти пакетировать нечего."""
+        for event in events:
+            await self.publish(event)
 
     async def _process_event(self, subscription: EventSubscription, event: Any) -> None:
         """Обрабатывает событие, вызывая соответствующий обработчик."""
+        started = time.perf_counter()
         await handle_event_safely(subscription.handler, event)
+        EVENT_BUS_HANDLER_SECONDS.labels(event.__class__.__name__).observe(time.perf_counter() - started)
         # Если raise_exceptions=True, исключения уже залогированы в handle_event_safely,
         # но здесь мы их не пробрасываем дальше, чтобы не прерывать другие обработчики
 
@@ -151,7 +284,7 @@ class RabbitMQEventBus:
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self._connection: AbstractConnection | None = None
+        self._connection: AbstractRobustConnection | None = None
         self._channel: AbstractChannel | None = None
         self._subscriptions: dict[str, list[EventSubscription]] = {}
         self._consumer_tags: dict[
@@ -160,6 +293,11 @@ class RabbitMQEventBus:
         ] = {}  # Хранит теги потребителей для каждого события
         self._active = True
         self._queues: dict[str, AbstractQueue] = {}
+        self._consumer_channels: dict[str, AbstractChannel] = {}
+        self._exchanges: dict[str, AbstractExchange] = {}
+        self._pending: list[tuple[str, bytes, asyncio.Future[None]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._in_flight: set[asyncio.Task[None]] = set()
 
     async def connect(self) -> None:
         """Устанавливает соединение с RabbitMQ."""
@@ -171,16 +309,41 @@ class RabbitMQEventBus:
                 password=self.settings.rabbitmq.password,
                 virtualhost=self.settings.rabbitmq.vhost,
             )
-            self._channel = await self._connection.channel()
-            await self._channel.set_qos(prefetch_count=1)
+            self._connection.reconnect_callbacks.add(self._forget_exchanges)
+            # канал для публикаций, у каждой очереди-подписки свой канал со своим prefetch
+            self._channel = await self._connection.channel(publisher_confirms=True)
 
     async def disconnect(self) -> None:
-        """Закрывает соединение с RabbitMQ."""
+        """Закрывает соединение с RabbitMQ, дождавшись подтверждений уже принятых публикаций."""
+        if self._pending:
+            self._flush()
+        if self._in_flight:
+            await gather(*self._in_flight, return_exceptions=True)
+
         if self._connection:
             await self._connection.close()
             self._connection = None
             self._channel = None
             self._queues = {}
+            self._consumer_channels = {}
+            self._exchanges = {}
+
+    def _forget_exchanges(self, *_: Any) -> None:
+        # после переподключения объявленные ранее обменники могли пропасть вместе с брокером
+        self._exchanges = {}
+
+    async def _get_exchange(self, event_name: str) -> AbstractExchange:
+        """Возвращает обменник события, объявляя его в брокере только при первом обращении."""
+        exchange = self._exchanges.get(event_name)
+        if exchange is None:
+            channel = await self._ensure_connection()
+            exchange = await channel.declare_exchange(
+                f'{event_name}_exchange',
+                ExchangeType.FANOUT,
+                durable=True,
+            )
+            self._exchanges[event_name] = exchange
+        return exchange
 
     async def _ensure_connection(self) -> AbstractChannel:
         if self._channel is None:
@@ -194,101 +357,329 @@ class RabbitMQEventBus:
         self,
         event_type: type[Any],
         event_name: str,
+        concurrency: int,
+        dead_letters: Optional[str] = None,
+        retry_queues: Sequence[str] = (),
     ) -> typing.Coroutine:
-        async def process_message(message: AbstractIncomingMessage) -> None:
-            async with message.process():
-                event_data = json.loads(message.body.decode())
-                event_data = deserialize_datetime(event_data)
-                event = event_type(**event_data)
+        # prefetch держит сообщения наготове, а семафор ограничивает, сколько из них обрабатывается сразу
+        semaphore = asyncio.Semaphore(concurrency)
 
-                await gather(
-                    *[handle_event_safely(sub.handler, event) for sub in self._subscriptions[event_name]],
+        async def process_message(message: AbstractIncomingMessage) -> None:
+            # исходное сообщение подтверждается на выходе из process, то есть после подтверждения копии брокером;
+            # если переотправить копию не удалось, оно вернётся в очередь, а не пропадёт
+            async with semaphore, message.process(requeue=True):
+                try:
+                    event = decode_event(event_type, message.body, message.content_type)
+                except (TypeError, ValueError) as e:
+                    logger.exception('Event decoding failed', **log_extra(event_type=event_type.__name__))
+                    if dead_letters is not None:
+                        await self._dead_letter(message, event_type.__name__, dead_letters, e, {})
+                    return
+
+                headers = message.headers or {}
+                handled = {str(name) for name in headers.get(HANDLED_HEADER) or ()}
+                pending = [sub for sub in self._subscriptions[event_name] if handler_name(sub.handler) not in handled]
+
+                errors = await gather(*[handle_event_safely(sub.handler, event) for sub in pending])
+                error = next((error for error in errors if error is not None), None)
+                if error is None or dead_letters is None:
+                    return
+
+                handled |= {
+                    handler_name(sub.handler) for sub, result in zip(pending, errors, strict=True) if result is None
+                }
+                progress = {HANDLED_HEADER: sorted(handled)}
+
+                attempt = int(headers.get(ATTEMPT_HEADER, 1))
+                if attempt > len(retry_queues):
+                    await self._dead_letter(message, event_type.__name__, dead_letters, error, progress)
+                    return
+
+                channel = await self._ensure_connection()
+                await channel.default_exchange.publish(
+                    self._copy_message(message, {**progress, ATTEMPT_HEADER: attempt + 1}),
+                    routing_key=retry_queues[attempt - 1],
                 )
+                EVENTS_RETRIED.labels(event_type.__name__).inc()
 
         return process_message
 
-    async def subscribe(self, event_type: type[Any], handler: EventHandler) -> None:
-        """Подписывает обработчик на событие и управляет потреблением из очереди."""
+    @staticmethod
+    def _copy_message(message: AbstractIncomingMessage, headers: dict[str, Any]) -> aio_pika.Message:
+        return aio_pika.Message(
+            body=message.body,
+            headers={**(message.headers or {}), **headers},
+            content_type=message.content_type,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        )
+
+    async def _dead_letter(
+        self,
+        message: AbstractIncomingMessage,
+        event_name: str,
+        dead_letters: str,
+        error: Exception,
+        headers: dict[str, Any],
+    ) -> None:
+        logger.error(
+            'Event moved to dead-letter queue',
+            **log_extra(event_type=event_name, error=str(error), error_type=error.__class__.__name__),
+        )
+        # публикация идёт через канал с подтверждениями, обменник уже объявлен при подписке
         channel = await self._ensure_connection()
+        exchange = await channel.get_exchange(dead_letters, ensure=False)
+        await exchange.publish(
+            self._copy_message(message, {**headers, ERROR_HEADER: f'{error.__class__.__name__}: {error}'}),
+            routing_key='',
+        )
+        EVENTS_DEAD_LETTERED.labels(event_name).inc()
 
-        event_name = event_type.__name__
-        if event_name not in self._subscriptions:
-            self._subscriptions[event_name] = []
+    async def _declare_dead_letters(
+        self,
+        channel: AbstractChannel,
+        event_name: str,
+    ) -> tuple[str, list[str]]:
+        """Объявляет обменник и очередь мёртвых писем и очереди задержки для повторов.
+
+        Очередь задержки на каждую попытку своя, с TTL в имени: сообщение в ней дожидается срока
+        и через dead-letter возвращается в основную очередь. Общая очередь с разным TTL у сообщений
+        задерживала бы короткие повторы за длинными.
+        """
+        rabbitmq = self.settings.rabbitmq
+        queue_name = f'{event_name}_queue'
+
+        dead_letters = await channel.declare_exchange(f'{event_name}_dlx', ExchangeType.FANOUT, durable=True)
+        dead_letter_queue = await channel.declare_queue(f'{event_name}_dlq', durable=True)
+        await dead_letter_queue.bind(dead_letters)
+
+        retry_queues = []
+        for attempt in range(1, rabbitmq.max_attempts):
+            delay = int(min(rabbitmq.retry_delay * 2 ** (attempt - 1), rabbitmq.retry_max_delay) * 1000)
+            retry_queue = await channel.declare_queue(
+                f'{queue_name}.retry.{delay}ms',
+                durable=True,
+                arguments={
+                    'x-message-ttl': delay,
+                    'x-dead-letter-exchange': '',
+                    'x-dead-letter-routing-key': queue_name,
+                },
+            )
+            retry_queues.append(retry_queue.name)
 
-        # Если это первая подписка, настраиваем обменник, очередь и начинаем потребление
-        if not self._subscriptions[event_name]:
-            exchange_name = f'{event_name}_exchange'
-            queue_name = f'{event_name}_queue'
+        return dead_letters.name, retry_queues
 
-            exchange = await channel.declare_exchange(
-                exchange_name,
-                ExchangeType.FANOUT,
-                durable=True,
+    async def redrive(self, event_name: str, limit: Optional[int] = None) -> int:
+        """Возвращает сообщения из очереди мёртвых писем события в основную очередь со сброшенным счётчиком попыток.
+
+        Список отработавших обработчиков сохраняется, так что повторно вызываются только упавшие.
+        """
+        channel = await self._ensure_connection()
+        dead_letter_queue = await channel.declare_queue(f'{event_name}_dlq', durable=True)
+
+        moved = 0
+        while limit is None or moved < limit:
+            batch_size = self.settings.rabbitmq.publish_batch_size
+            if limit is not None:
+                batch_size = min(batch_size, limit - moved)
+
+            batch = []
+            for _ in range(batch_size):
+                message = await dead_letter_queue.get(fail=False)
+                if message is None:
+                    break
+                batch.append(message)
+            if not batch:
+                break
+
+            await gather(
+                *[
+                    channel.default_exchange.publish(
+                        aio_pika.Message(
+                            body=message.body,
+                            headers={
+                                key: value
+                                for key, value in (message.headers or {}).items()
+                                if key not in (ATTEMPT_HEADER, ERROR_HEADER)
+                            },
+                            content_type=message.content_type,
+                            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                        ),
+                        routing_key=f'{event_name}_queue',
+                    )
+                    for message in batch
+                ],
             )
-            queue = await channel.declare_queue(queue_name, durable=True)
-            await queue.bind(exchange)
-            self._queues[event_name] = queue
+            # подтверждаем только после того, как брокер принял копии, иначе сообщение можно потерять
+            for message in batch:
+                await message.ack()
+            moved += len(batch)
+
+        return moved
+
+    async def subscribe(self, event_type: type[Any], handler: EventHandler, broadcast: bool = False) -> None:  # noqa
+        """Подписывает обработчик на событие и управляет потреблением из очереди.
+
+        Обычные подписки делят общую очередь, и событие получает один из процессов.
+        При broadcast=True процесс получает собственную временную очередь и видит каждое событие.
+        """
+        await self._ensure_connection()
+
+        event_name = event_type.__name__
+        key = f'{event_name}:broadcast' if broadcast else event_name
+        if key not in self._subscriptions:
+            self._subscriptions[key] = []
+
+        # Если это первая подписка, настраиваем обменник, очередь и начинаем потребление
+        if not self._subscriptions[key]:
+            exchange = await self._get_exchange(event_name)
+            prefetch, concurrency = self._consumer_limits(event_name)
+
+            channel = await self._connection.channel()
+            await channel.set_qos(prefetch_count=prefetch)
+            self._consumer_channels[key] = channel
+
+            # повторы и мёртвые письма только у общих очередей: временная очередь broadcast умирает вместе с процессом
+            dead_letters, retry_queues = None, []
+            if broadcast:
+                queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+            else:
+                queue = await channel.declare_queue(f'{event_name}_queue', durable=True)
+                dead_letters, retry_queues = await self._declare_dead_letters(channel, event_name)
+            await queue.bind(exchange.name)
+            self._queues[key] = queue
 
             process_message = await self._create_message_processor(
                 event_type,
-                event_name,
+                key,
+                concurrency,
+                dead_letters,
+                retry_queues,
             )
             consumer_tag = await queue.consume(process_message)
-            self._consumer_tags[event_name] = consumer_tag
+            self._consumer_tags[key] = consumer_tag
 
-        self._subscriptions[event_name].append(EventSubscription(event_type, handler))
+        self._subscriptions[key].append(EventSubscription(event_type, handler))
 
     async def unsubscribe(self, event_type: type[Any], handler: EventHandler) -> None:
         """Отписывает обработчик от события и останавливает потребление, если подписчиков больше нет."""
         event_name = event_type.__name__
-        if event_name not in self._subscriptions:
-            return
-        self._subscriptions[event_name] = [
-            sub for sub in self._subscriptions[event_name] if sub.handler != handler
-        ]
-        if not self._subscriptions[event_name] and event_name in self._consumer_tags:
-            consumer_tag = self._consumer_tags.pop(event_name)
-            if event_name in self._queues:
-                queue = self._queues[event_name]
-                await queue.cancel(consumer_tag)
-                del self._queues[event_name]
-
-    async def _serialize_event(self, event: Any) -> bytes:
-        try:
-            return json.dumps(event.__dict__, default=serialize_datetime).encode()
-        except (AttributeError, TypeError) as e:
-            event_name = event.__class__.__name__
-            logger.exception(
-                'Event serialization failed',
-                **log_extra(
-                    event_type=event_name,
-                    event=str(event),
-                    error=str(e),
-                    error_type=e.__class__.__name__,
-                ),
-            )
-            raise
+        for key in (event_name, f'{event_name}:broadcast'):
+            if key not in self._subscriptions:
+                continue
+            self._subscriptions[key] = [sub for sub in self._subscriptions[key] if sub.handler != handler]
+            if not self._subscriptions[key] and key in self._consumer_tags:
+                consumer_tag = self._consumer_tags.pop(key)
+                if key in self._queues:
+                    queue = self._queues[key]
+                    await queue.cancel(consumer_tag)
+                    del self._queues[key]
+                if key in self._consumer_channels:
+                    await self._consumer_channels.pop(key).close()
+
+    def _consumer_limits(self, event_name: str) -> tuple[int, int]:
+        """Возвращает prefetch и число одновременно обрабатываемых сообщений для очереди события."""
+        rabbitmq = self.settings.rabbitmq
+        consumer = rabbitmq.consumers.get(event_name) or rabbitmq.consumers.get(event_name.lower())
+
+        prefetch = (consumer and consumer.prefetch) or rabbitmq.prefetch
+        concurrency = (consumer and consumer.concurrency) or rabbitmq.concurrency or prefetch
+        return prefetch, concurrency
 
     async def publish(self, event: Any) -> None:
-        """Публикует событие в RabbitMQ."""
+        """Публикует событие в RabbitMQ и ждёт подтверждения брокера."""
         if not self._active:
             return
-        channel = await self._ensure_connection()
+        await self.publish_serialized(event.__class__.__name__, serialize_event(event))
 
-        event_name = event.__class__.__name__
-        exchange_name = f'{event_name}_exchange'
-        exchange = await channel.declare_exchange(
-            exchange_name,
-            ExchangeType.FANOUT,
-            durable=True,
-        )
+    async def publish_many(self, events: Sequence[Any]) -> None:
+        """Публикует события одной пачкой и ждёт подтверждений всех сообщений."""
+        if not self._active:
+            return
+        await self.publish_serialized_many([(event.__class__.__name__, serialize_event(event)) for event in events])
+
+    async def publish_serialized(self, event_name: str, body: bytes) -> None:
+        """Ставит сериализованное событие в текущую пачку и ждёт, пока брокер её подтвердит.
+
+        Пачка уходит, когда набирается publish_batch_size сообщений или истекает publish_batch_window,
+        так что одновременные публикации из разных запросов делят ожидание подтверждений.
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending.append((event_name, body, future))
+
+        if len(self._pending) >= self.settings.rabbitmq.publish_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.settings.rabbitmq.publish_batch_window,
+                self._flush,
+            )
 
-        message_body = await self._serialize_event(event)
-        message = aio_pika.Message(
-            body=message_body,
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        await future
+
+    async def publish_serialized_many(self, messages: Sequence[tuple[str, bytes]]) -> None:
+        """Публикует пары (имя события, тело) без ожидания окна, например пачку из outbox."""
+        errors = [error for error in await self._publish_batch(messages) if error is not None]
+        if errors:
+            raise errors[0]
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = create_task(self._complete(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _complete(self, batch: list[tuple[str, bytes, asyncio.Future[None]]]) -> None:
+        try:
+            errors = await self._publish_batch([(event_name, body) for event_name, body, _ in batch])
+        except Exception as e:  # noqa: BLE001
+            errors = [e] * len(batch)
+
+        for (_, _, future), error in zip(batch, errors, strict=True):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+    async def _publish_batch(self, messages: Sequence[tuple[str, bytes]]) -> list[BaseException | None]:
+        """Отправляет сообщения без ожидания друг друга, подтверждения канал собирает пачкой.
+
+        Возвращает ошибку для каждого сообщения: None, если брокер его подтвердил.
+        """
+
+        # обменники объявляются до рассылки, иначе первая пачка объявит один и тот же много раз
+        exchanges = {event_name: await self._get_exchange(event_name) for event_name, _ in messages}
+
+        async def publish_one(event_name: str, body: bytes) -> None:
+            exchange = exchanges[event_name]
+            message = aio_pika.Message(
+                body=body,
+                content_type=EVENT_CONTENT_TYPE,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            )
+            await exchange.publish(message, routing_key='')
+
+        results = await gather(
+            *[publish_one(event_name, body) for event_name, body in messages],
+            return_exceptions=True,
         )
-        await exchange.publish(message, routing_key='')
+
+        errors = [result if isinstance(result, BaseException) else None for result in results]
+        failed = sum(error is not None for error in errors)
+        if failed:
+            logger.error(
+                'Event batch was not confirmed',
+                **log_extra(total=len(messages), failed=failed, error=str(next(e for e in errors if e))),
+            )
+        return errors
 
     @asynccontextmanager
     async def pause(self) -> None:
@@ -305,4 +696,10 @@ def create_event_bus(settings: Settings) -> EventBus:
     """Фабричная функция для создания подходящей шины событий на основе настроек."""
     if settings.rabbitmq.use:
         return RabbitMQEventBus(settings)
-    return InMemoryEventBus(settings.bus_exceptions)
+    return InMemoryEventBus(
+        settings.bus_exceptions,
+        workers=settings.dispatcher.workers,
+        max_queue=settings.dispatcher.max_queue,
+        overflow=settings.dispatcher.overflow,
+        drain_timeout=settings.dispatcher.drain_timeout,
+    )
@@ -17,6 +17,7 @@ class ErrorCode(StrEnum):
     INTERNAL_SERVER_ERROR = 'INTERNAL_SERVER_ERROR'
     BAD_REQUEST = 'BAD_REQUEST'
     FORBIDDEN = 'FORBIDDEN'
+    SERVICE_UNAVAILABLE = 'SERVICE_UNAVAILABLE'
 
 
 T = TypeVar('T')
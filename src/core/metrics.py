@@ -0,0 +1,70 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    'db_pool_checkout_seconds',
+    'Time spent waiting for a connection from the database pool',
+    ['database'],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out',
+    'Connections currently checked out from the database pool',
+    ['database'],
+)
+DB_POOL_SATURATION = Gauge(
+    'db_pool_saturation',
+    'Checked out connections relative to pool_size + max_overflow',
+    ['database'],
+)
+
+JWT_CACHE_HITS = Counter(
+    'jwt_cache_hits',
+    'Verified tokens served from the JWT cache',
+)
+JWT_CACHE_MISSES = Counter(
+    'jwt_cache_misses',
+    'Tokens that had to be decoded and verified',
+)
+
+PASSWORD_HASH_SECONDS = Histogram(
+    'password_hash_seconds',
+    'Time to hash or verify a password, including the wait for a free worker',
+    ['operation'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+PASSWORD_HASH_SATURATION = Gauge(
+    'password_hash_saturation',
+    'In-flight hashing jobs relative to workers + max_queue',
+)
+PASSWORD_HASH_REJECTED = Counter(
+    'password_hash_rejected',
+    'Hashing jobs rejected because the queue was full',
+    ['operation'],
+)
+
+EVENTS_RETRIED = Counter(
+    'events_retried',
+    'Events sent to a delay queue after a handler failed',
+    ['event'],
+)
+EVENTS_DEAD_LETTERED = Counter(
+    'events_dead_lettered',
+    'Events moved to the dead-letter queue after the last attempt or a decoding error',
+    ['event'],
+)
+
+EVENT_BUS_QUEUE_DEPTH = Gauge(
+    'event_bus_queue_depth',
+    'Events waiting for an in-memory dispatcher',
+)
+EVENT_BUS_HANDLER_SECONDS = Histogram(
+    'event_bus_handler_seconds',
+    'Time spent in an in-memory event handler',
+    ['event'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+EVENT_BUS_DROPPED = Counter(
+    'event_bus_dropped',
+    'Events dropped because the in-memory dispatch queue was full',
+    ['event'],
+)
@@ -0,0 +1,113 @@
+import functools
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, Optional, Protocol
+
+from sqlalchemy import BigInteger, DateTime, Identity, Index, LargeBinary, String, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import BaseModel, TransactionManager
+from src.core.events import EventBus, EventHandler, serialize_event
+
+
+class OutboxModel(BaseModel):
+    __tablename__ = 'outbox'
+
+    # порядок вставки: created_at одинаков у всех событий одной транзакции, а id случайный
+    position: Mapped[int] = mapped_column(BigInteger, Identity(), nullable=False, unique=True)
+    event_type: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index('ix_outbox_pending_position', 'position', postgresql_where=text('sent_at IS NULL')),
+        Index('ix_outbox_sent_at', 'sent_at', postgresql_where=text('sent_at IS NOT NULL')),
+    )
+
+
+class TransactionalEventBus(EventBus, Protocol):
+    """Шина для команд: события из транзакции доходят до подписчиков, только если она закоммитилась.
+
+    При настроенном брокере они пишутся в outbox в транзакции запроса, без него публикуются после коммита.
+    """
+
+
+class OutboxEventBus:
+    """Складывает события в outbox той же сессии, в брокер их отправляет relay раннера."""
+
+    def __init__(self, transaction_manager: TransactionManager, event_bus: EventBus) -> None:
+        self.transaction_manager = transaction_manager
+        self.event_bus = event_bus
+
+    async def connect(self) -> None:
+        await self.event_bus.connect()
+
+    async def disconnect(self) -> None:
+        await self.event_bus.disconnect()
+
+    async def subscribe(self, event_type: type[Any], handler: EventHandler, broadcast: bool = False) -> None:  # noqa
+        await self.event_bus.subscribe(event_type, handler, broadcast)
+
+    async def unsubscribe(self, event_type: type[Any], handler: EventHandler) -> None:
+        await self.event_bus.unsubscribe(event_type, handler)
+
+    async def publish(self, event: Any) -> None:
+        """Добавляет событие в outbox. Строка закоммитится или откатится вместе с остальными изменениями."""
+        await self.publish_many([event])
+
+    async def publish_many(self, events: Sequence[Any]) -> None:
+        if not self.transaction_manager.in_transaction:
+            # вне транзакции строку никто бы не закоммитил, поэтому событие пишется в собственной
+            async with self.transaction_manager:
+                self._add(events)
+            return
+        self._add(events)
+
+    def _add(self, events: Sequence[Any]) -> None:
+        for event in events:
+            self.transaction_manager.session.add(
+                OutboxModel(
+                    event_type=event.__class__.__name__,
+                    payload=serialize_event(event),
+                ),
+            )
+
+
+class AfterCommitEventBus:
+    """Шина без outbox: события, опубликованные в транзакции, уходят только после её коммита.
+
+    Иначе подписчики узнали бы об изменениях, которые затем откатятся.
+    """
+
+    def __init__(self, transaction_manager: TransactionManager, event_bus: EventBus) -> None:
+        self.transaction_manager = transaction_manager
+        self.event_bus = event_bus
+
+    async def connect(self) -> None:
+        await self.event_bus.connect()
+
+    async def disconnect(self) -> None:
+        await self.event_bus.disconnect()
+
+    async def subscribe(self, event_type: type[Any], handler: EventHandler, broadcast: bool = False) -> None:  # noqa
+        await self.event_bus.subscribe(event_type, handler, broadcast)
+
+    async def unsubscribe(self, event_type: type[Any], handler: EventHandler) -> None:
+        await self.event_bus.unsubscribe(event_type, handler)
+
+    async def publish(self, event: Any) -> None:
+        if not self.transaction_manager.in_transaction:
+            await self.event_bus.publish(event)
+            return
+        self.transaction_manager.after_commit(functools.partial(self.event_bus.publish, event))
+
+    async def publish_many(self, events: Sequence[Any]) -> None:
+        if not self.transaction_manager.in_transaction:
+            await self.event_bus.publish_many(events)
+            return
+        self.transaction_manager.after_commit(functools.partial(self.event_bus.publish_many, list(events)))
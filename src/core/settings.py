@@ -12,6 +12,12 @@ class Environment(StrEnum):
     PRODUCTION = 'production'
 
 
+class DispatchOverflow(StrEnum):
+    BLOCK = 'block'
+    DROP_NEW = 'drop_new'
+    DROP_OLDEST = 'drop_oldest'
+
+
 class S3(BaseModel):
     access_key_id: str
     access_key: str
@@ -20,6 +26,7 @@ class S3(BaseModel):
 
 class Runner(BaseModel):
     workers: int
+    processes: int = Field(default=1)
 
 
 class Server(BaseModel):
@@ -37,6 +44,18 @@ class Postgres(BaseModel):
 
     provider: str = 'postgresql+asyncpg'
 
+    use_pool: bool = Field(default=True)
+    pool_size: int = Field(default=10)
+    max_overflow: int = Field(default=10)
+    pool_timeout: float = Field(default=30)
+    pool_recycle: int = Field(default=1800)
+    pool_pre_ping: bool = Field(default=True)
+    statement_cache_size: int = Field(default=100)
+    pgbouncer: bool = Field(default=False)
+
+    replica_url: typing.Optional[str] = Field(default=None)
+    read_your_writes_window: float = Field(default=5)
+
     @property
     def url(self) -> str:
         return f'{self.provider}://{self.user}:{self.password}@{self.host}:{self.port}/{self.db}'
@@ -50,6 +69,16 @@ class Jwt(BaseModel):
     secret: str
     algorithm: str = Field(default='HS256')
     expire: int = Field(default=12000)
+    cache_size: int = Field(default=10000)
+
+
+class Argon2(BaseModel):
+    workers: int = Field(default=4)
+    max_queue: int = Field(default=64)
+    # None оставляет значения passlib по умолчанию
+    time_cost: typing.Optional[int] = Field(default=None)
+    memory_cost: typing.Optional[int] = Field(default=None)
+    parallelism: typing.Optional[int] = Field(default=None)
 
 
 class Firebase(BaseModel):
@@ -57,6 +86,8 @@ class Firebase(BaseModel):
     credentials_file: str
     type: str = Field(default='service_account')
     database_url: str = Field(default='')
+    max_concurrency: int = Field(default=64)
+    max_retries: int = Field(default=3)
 
     def model_post_init(self, _: typing.Any) -> None:
         if not pathlib.Path(self.credentials_file).exists():
@@ -66,6 +97,11 @@ class Firebase(BaseModel):
             )
 
 
+class Consumer(BaseModel):
+    prefetch: typing.Optional[int] = Field(default=None)
+    concurrency: typing.Optional[int] = Field(default=None)
+
+
 class Rabbitmq(BaseModel):
     host: str = Field(default='rabbitmq')
     port: int = Field(default=5672)
@@ -73,6 +109,52 @@ class Rabbitmq(BaseModel):
     password: str = Field(default='guest')
     vhost: str = Field(default='/')
     use: bool = Field(default=False)
+    publish_batch_size: int = Field(default=100)
+    publish_batch_window: float = Field(default=0.005)
+    prefetch: int = Field(default=10)
+    concurrency: typing.Optional[int] = Field(default=None)
+    # настройки отдельных событий, ключ — имя класса события
+    consumers: dict[str, Consumer] = Field(default_factory=dict)
+    max_attempts: int = Field(default=5)
+    retry_delay: float = Field(default=1)
+    retry_max_delay: float = Field(default=300)
+
+
+class Outbox(BaseModel):
+    use: bool = Field(default=True)
+    batch_size: int = Field(default=500)
+    poll_interval: float = Field(default=0.5)
+    retention: int = Field(default=86400)
+
+
+class Dispatcher(BaseModel):
+    workers: int = Field(default=8)
+    max_queue: int = Field(default=10000)
+    overflow: DispatchOverflow = Field(default=DispatchOverflow.BLOCK)
+    drain_timeout: float = Field(default=10)
+
+
+class Reminders(BaseModel):
+    use: bool = Field(default=True)
+    # за сколько минут до начала и до конца брони присылать напоминание
+    before_start: int = Field(default=15)
+    before_end: int = Field(default=10)
+    # на сколько секунд вперёд напоминания держатся в памяти
+    horizon: int = Field(default=3600)
+    batch_size: int = Field(default=100)
+    # одновременных отправок: каждая держит соединение из пула, общего с relay outbox
+    concurrency: int = Field(default=5)
+    # неудачную отправку повторяем с удвоением паузы, начиная с retry_delay секунд
+    max_attempts: int = Field(default=3)
+    retry_delay: float = Field(default=30)
+
+
+class Http(BaseModel):
+    limit: int = Field(default=100)
+    limit_per_host: int = Field(default=50)
+    keepalive_timeout: float = Field(default=60)
+    dns_cache_ttl: int = Field(default=300)
+    timeout: float = Field(default=10)
 
 
 class Log(BaseModel):
@@ -86,11 +168,16 @@ class Settings(BaseSettings):
     runner: Runner
     server: Server
     bus_exceptions: bool = Field(default=False)
+    dispatcher: Dispatcher = Field(default_factory=Dispatcher)
     postgres: Postgres
     jwt: Jwt
+    argon2: Argon2 = Field(default_factory=Argon2)
     firebase: Firebase
 
     rabbitmq: Rabbitmq
+    outbox: Outbox = Field(default_factory=Outbox)
+    reminders: Reminders = Field(default_factory=Reminders)
+    http: Http = Field(default_factory=Http)
     log: Log
 
     s3: S3
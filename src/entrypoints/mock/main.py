@@ -8,6 +8,7 @@ from dishka import AsyncContainer
 from faker import Faker
 
 from src.core.container import container
+from src.core.database import TransactionManager, use_primary
 from src.core.exceptions import NotFoundError
 from src.modules.bookings.application.services import BookingService
 from src.modules.coworkings.domain.entities import Coworking
@@ -98,24 +99,26 @@ async def mock_bookings(spot_service: SpotService, booking_service: BookingServi
 
 
 async def db_mock(cont: AsyncContainer) -> None:
+    with use_primary():
+        await _db_mock(cont)
+
+
+async def _db_mock(cont: AsyncContainer) -> None:
     async with cont() as request_container:
         coworking_repo = await request_container.get(CoworkingRepository)
         spot_repo = await request_container.get(SpotRepository)
         user_repo = await request_container.get(UserRepository)
         spot_serv = await request_container.get(SpotService)
         booking_serv = await request_container.get(BookingService)
+        transaction_manager = await request_container.get(TransactionManager)
 
         try:
             await coworking_repo.get_by_id(coworkings[0].id)
         except NotFoundError:
-            for obj in coworkings:
-                await coworking_repo.create(obj)
-
-            for obj in spots:
-                await spot_repo.create(obj)
-
-            for obj in users:
-                await user_repo.create(obj)
+            async with transaction_manager:
+                await coworking_repo.create_many(list(coworkings))
+                await spot_repo.create_many(spots)
+                await user_repo.create_many(users)
 
             await mock_bookings(spot_serv, booking_serv)
 
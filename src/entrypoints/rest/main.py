@@ -2,20 +2,23 @@ import logging
 import typing
 from contextlib import asynccontextmanager
 
+import aiohttp
 import fastapi
 import uvicorn
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 from prometheus_fastapi_instrumentator import Instrumentator
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from src.core.container import container
-from src.core.database import BaseModel, create_engine
+from src.core.database import BaseModel, ReadYourWrites, use_primary
 from src.core.error_handlers import setup_error_handlers
 from src.core.logging import get_logger
 from src.core.settings import Settings, get_settings
 from src.entrypoints.mock.main import db_mock
 from src.modules.auth.adapters.api.router import router as auth_router
-from src.modules.auth.application.services import AuthService
+from src.modules.auth.application.queries import VerifyTokenQuery
+from src.modules.auth.domain.services import TokenService
 from src.modules.bookings.adapters.api.router import router as bookings_router
 from src.modules.coworkings.adapters.api.router import router as coworkings_router
 from src.modules.healthcheck.adapters.api.router import router as healthcheck_router
@@ -24,7 +27,7 @@ from src.modules.options.adapters.api.router import router as options_router
 from src.modules.spots.adapters.api.router import router as spots_router
 from src.modules.storage.adapters.api.router import router as storage_router
 from src.modules.users.adapters.api.router import router as users_router
-from src.modules.users.application.services import UserService
+from src.modules.users.infrastructure.ban_list import BanList
 
 logger = get_logger(__name__)
 
@@ -42,12 +45,14 @@ async def lifespan(app: FastAPI) -> None:
         },
     )
 
-    engine = create_engine(settings)
+    engine = await container.get(AsyncEngine)
 
     async with engine.begin() as conn:
         await conn.run_sync(BaseModel.metadata.create_all)
 
     await db_mock(container)
+    await container.get(BanList)
+    await container.get(aiohttp.ClientSession)
 
     yield
 
@@ -78,35 +83,71 @@ def create_app() -> FastAPI:
     for router in routers:
         app.include_router(router)
 
+    app.middleware('http')(read_your_writes_middleware)
     app.middleware('http')(banlist_middleware)
 
     return app
 
 
+SAFE_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+async def read_your_writes_middleware(request: fastapi.Request, call_next: typing.Callable) -> fastapi.Response:
+    user_id = getattr(request.state, 'user_id', None)
+    is_write = request.method not in SAFE_METHODS
+
+    if user_id is None:
+        if not is_write:
+            return await call_next(request)
+
+        with use_primary():
+            return await call_next(request)
+
+    read_your_writes = await container.get(ReadYourWrites)
+    key = str(user_id)
+
+    if not is_write and not read_your_writes.is_recent(key, request.cookies.get(read_your_writes.cookie)):
+        return await call_next(request)
+
+    with use_primary():
+        response = await call_next(request)
+
+    if is_write and response.status_code < fastapi.status.HTTP_400_BAD_REQUEST:
+        response.set_cookie(
+            read_your_writes.cookie,
+            read_your_writes.mark(key),
+            max_age=max(int(read_your_writes.window), 1),
+            httponly=True,
+            samesite='lax',
+        )
+
+    return response
+
+
 async def banlist_middleware(request: fastapi.Request, call_next: typing.Callable) -> fastapi.Response:
     auth_header = request.headers.get('Authorization')
 
     if not auth_header:
         return await call_next(request)
 
-    async with container() as request_container:
-        auth_service = await request_container.get(AuthService)
-        user_service = await request_container.get(UserService)
+    try:
+        _, token = auth_header.split()
 
-        try:
-            _, token = auth_header.split()
+        token_service = await container.get(TokenService)
+        user_id = await VerifyTokenQuery(token_service=token_service, token=token)()
 
-            user_id = await auth_service.verify_token(token)
-            user = await user_service.get_user(user_id)
+    except Exception as e:  # noqa
+        return await call_next(request)
 
-        except Exception as e:  # noqa
-            return await call_next(request)
+    # роуты берут проверенный id отсюда, а не декодируют токен второй раз
+    request.state.user_id = user_id
 
-        if user and user.is_banned:
-            return fastapi.responses.JSONResponse(
-                status_code=fastapi.status.HTTP_403_FORBIDDEN,
-                content={'detail': 'User is banned.'},
-            )
+    ban_list = await container.get(BanList)
+    if user_id in ban_list:
+        return fastapi.responses.JSONResponse(
+            status_code=fastapi.status.HTTP_403_FORBIDDEN,
+            content={'detail': 'User is banned.'},
+        )
 
     return await call_next(request)
 
@@ -1,15 +1,21 @@
 import asyncio
 import logging
+import multiprocessing
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.core.container import container
-from src.core.events import EventBus
+from src.core.events import EventBus, RabbitMQEventBus, create_event_bus
 from src.core.logging import get_logger
-from src.core.settings import Settings
+from src.core.settings import Settings, get_settings
+from src.entrypoints.runner.outbox_relay import OutboxRelay
+from src.entrypoints.runner.reminders import BookingReminderScheduler
 from src.modules.auth.domain.events import (
     InvalidAuthenticationAttempt,
     UserAuthenticated,
 )
 from src.modules.auth.infrastructure.event_handlers import AuthEventLogger
+from src.modules.bookings.domain.events import BookingCancelled, BookingCreated, BookingRescheduled
 from src.modules.users.domain.events import (
     UserCreated,
     UserEmailChanged,
@@ -20,7 +26,11 @@ from src.modules.users.infrastructure.event_handlers import UserEventLogger
 logger = get_logger(__name__)
 
 
-async def worker(worker_id: int, event_bus: EventBus) -> None:
+async def worker(worker_id: int, settings: Settings) -> None:
+    # у каждого воркера своё соединение, и RabbitMQ раздаёт сообщения очереди между ними по очереди
+    event_bus = create_event_bus(settings)
+    await event_bus.connect()
+
     auth_logger = AuthEventLogger()
     user_logger = UserEventLogger()
 
@@ -35,15 +45,19 @@ async def worker(worker_id: int, event_bus: EventBus) -> None:
         await event.wait()
     except asyncio.CancelledError:
         logger.info(f'Worker ID: {worker_id} was stopped')
+    finally:
+        await event_bus.disconnect()
 
 
-async def create_runner() -> None:
+async def create_runner(process_id: int = 0) -> None:
     settings = await container.get(Settings)
     await container.get(logging.Logger)
 
     logger.info(
         'Starting runner',
         extra={
+            'process_id': process_id,
+            'workers': settings.runner.workers,
             'environment': settings.environment,
             'log_level': settings.environment_log_level,
         },
@@ -51,9 +65,55 @@ async def create_runner() -> None:
 
     event_bus = await container.get(EventBus)
 
-    workers = [asyncio.create_task(worker(i, event_bus)) for i in range(1)]
-    await asyncio.gather(*workers)
+    workers = [asyncio.create_task(worker(i, settings)) for i in range(settings.runner.workers)]
+
+    # relay один на все процессы, чтобы события из outbox уходили в порядке записи
+    if process_id == 0 and isinstance(event_bus, RabbitMQEventBus) and settings.outbox.use:
+        session_maker = await container.get(async_sessionmaker[AsyncSession])
+        relay = OutboxRelay(session_maker, event_bus, settings)
+        workers.append(asyncio.create_task(relay.run()))
+
+    # планировщик тоже один: broadcast-подписка отдаёт ему все события, не отнимая их у воркеров
+    if process_id == 0 and settings.reminders.use:
+        scheduler = BookingReminderScheduler(container, settings)
+        await event_bus.subscribe(BookingCreated, scheduler.handle, broadcast=True)
+        await event_bus.subscribe(BookingRescheduled, scheduler.handle, broadcast=True)
+        await event_bus.subscribe(BookingCancelled, scheduler.handle, broadcast=True)
+        workers.append(asyncio.create_task(scheduler.run()))
+
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        await container.close()
+
+
+def run_process(process_id: int) -> None:
+    asyncio.run(create_runner(process_id))
+
+
+def main() -> None:
+    settings = get_settings()
+    if settings.runner.processes <= 1:
+        run_process(0)
+        return
+
+    # spawn, а не fork: каждый процесс заново собирает контейнер и свой event loop
+    context = multiprocessing.get_context('spawn')
+    processes = [
+        context.Process(target=run_process, args=(i,), name=f'runner-{i}') for i in range(settings.runner.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
 
 
 if __name__ == '__main__':
-    asyncio.run(create_runner())
+    main()
@@ -0,0 +1,86 @@
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.database import TransactionManager
+from src.core.events import RabbitMQEventBus
+from src.core.logging import get_logger, log_extra
+from src.core.outbox import OutboxModel
+from src.core.settings import Settings
+
+logger = get_logger(__name__)
+
+PURGE_INTERVAL = 60
+
+
+class OutboxRelay:
+    """Переносит события из outbox в RabbitMQ пачками и отмечает их отправленными.
+
+    Строки берутся через SKIP LOCKED, поэтому несколько раннеров не отправят одну пачку дважды.
+    Если брокер упал посреди пачки, транзакция откатывается и пачка уйдёт повторно: доставка at-least-once.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        event_bus: RabbitMQEventBus,
+        settings: Settings,
+    ) -> None:
+        self.session_maker = session_maker
+        self.event_bus = event_bus
+        self.batch_size = settings.outbox.batch_size
+        self.poll_interval = settings.outbox.poll_interval
+        self.retention = timedelta(seconds=settings.outbox.retention)
+        self._purged_at = 0.0
+
+    async def run(self) -> None:
+        while True:
+            try:
+                sent = await self.relay_batch()
+                if sent < self.batch_size:
+                    await self.purge_sent()
+                    await asyncio.sleep(self.poll_interval)
+            except asyncio.CancelledError:
+                logger.info('Outbox relay was stopped')
+                raise
+            except Exception:
+                logger.exception('Outbox relay failed, retrying')
+                await asyncio.sleep(self.poll_interval)
+
+    async def relay_batch(self) -> int:
+        async with self.session_maker() as session, TransactionManager(session):
+            rows = (
+                await session.execute(
+                    select(OutboxModel.id, OutboxModel.event_type, OutboxModel.payload)
+                    .where(OutboxModel.sent_at.is_(None))
+                    .order_by(OutboxModel.position)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True),
+                )
+            ).all()
+
+            await self.event_bus.publish_serialized_many([(row.event_type, row.payload) for row in rows])
+
+            if rows:
+                await session.execute(
+                    update(OutboxModel)
+                    .where(OutboxModel.id.in_([row.id for row in rows]))
+                    .values(sent_at=func.now()),
+                )
+                logger.debug('Outbox batch relayed', **log_extra(count=len(rows)))
+
+        return len(rows)
+
+    async def purge_sent(self) -> None:
+        now = time.monotonic()
+        if now - self._purged_at < PURGE_INTERVAL:
+            return
+        self._purged_at = now
+
+        async with self.session_maker() as session, TransactionManager(session):
+            await session.execute(
+                delete(OutboxModel).where(OutboxModel.sent_at < datetime.now(UTC) - self.retention),
+            )
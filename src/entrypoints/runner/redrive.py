@@ -0,0 +1,39 @@
+"""Возвращает события из очередей мёртвых писем обратно в обработку.
+
+Запуск: python -m src.entrypoints.runner.redrive BookingCreated UserCreated --limit 1000
+"""
+
+import argparse
+import asyncio
+import logging
+from typing import Optional
+
+from src.core.container import container
+from src.core.events import RabbitMQEventBus
+from src.core.logging import get_logger, log_extra
+from src.core.settings import Settings
+
+logger = get_logger(__name__)
+
+
+async def redrive(event_names: list[str], limit: Optional[int]) -> None:
+    settings = await container.get(Settings)
+    await container.get(logging.Logger)
+
+    event_bus = RabbitMQEventBus(settings)
+    try:
+        for event_name in event_names:
+            moved = await event_bus.redrive(event_name, limit)
+            logger.info('Dead-letter queue redriven', **log_extra(event_type=event_name, count=moved))
+    finally:
+        await event_bus.disconnect()
+        await container.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Re-drive messages from event dead-letter queues')
+    parser.add_argument('events', nargs='+', help='имена классов событий, например BookingCreated')
+    parser.add_argument('--limit', type=int, default=None, help='не больше стольких сообщений на очередь')
+    args = parser.parse_args()
+
+    asyncio.run(redrive(args.events, args.limit))
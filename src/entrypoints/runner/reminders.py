@@ -0,0 +1,248 @@
+import asyncio
+import contextlib
+import heapq
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from typing import Any, Optional
+from uuid import UUID
+
+from dishka import AsyncContainer
+
+from src.core.logging import get_logger, log_extra
+from src.core.settings import Settings
+from src.modules.bookings.domain.entities import Booking
+from src.modules.bookings.domain.events import BookingCancelled, BookingCreated, BookingRescheduled
+from src.modules.bookings.domain.repositories import BookingRepository
+from src.modules.notifications.application.services import NotificationsService
+from src.modules.notifications.domain.entities import NotificationType
+
+logger = get_logger(__name__)
+
+
+class ReminderKind(StrEnum):
+    STARTS = 'booking_starts'
+    ENDS = 'booking_ends'
+
+
+REMINDER_TEXTS = {
+    ReminderKind.STARTS: ('Booking starts soon', 'Your booking starts at {at:%H:%M} UTC'),
+    ReminderKind.ENDS: ('Booking ends soon', 'Your booking ends at {at:%H:%M} UTC'),
+}
+
+
+@dataclass(order=True, frozen=True)
+class Reminder:
+    fire_at: datetime
+    booking_id: UUID = field(compare=False)
+    user_id: UUID = field(compare=False)
+    kind: ReminderKind = field(compare=False)
+    # начало или конец брони, на которые рассчитано напоминание: при переносе брони оно устаревает
+    at: datetime = field(compare=False)
+    attempt: int = field(default=1, compare=False)
+
+
+class BookingReminderScheduler:
+    """Напоминает о начале и конце броней.
+
+    В памяти лежит только окно ближайших horizon секунд: min-куча напоминаний, которую
+    подгружают запросы по индексам на time_from и time_until, а между подгрузками дополняют
+    события BookingCreated, BookingRescheduled и BookingCancelled. Поэтому размер кучи не зависит от того,
+    сколько броней запланировано на будущее. Перед отправкой брони каждой пачки
+    перечитываются по id, чтобы не напоминать об отменённых и перенесённых.
+    """
+
+    def __init__(self, container: AsyncContainer, settings: Settings) -> None:
+        self.container = container
+        self.leads = {
+            ReminderKind.STARTS: timedelta(minutes=settings.reminders.before_start),
+            ReminderKind.ENDS: timedelta(minutes=settings.reminders.before_end),
+        }
+        self.horizon = timedelta(seconds=settings.reminders.horizon)
+        self.batch_size = settings.reminders.batch_size
+        self.max_attempts = settings.reminders.max_attempts
+        self.retry_delay = timedelta(seconds=settings.reminders.retry_delay)
+        self._sending = asyncio.Semaphore(settings.reminders.concurrency)
+
+        self._heap: list[Reminder] = []
+        # в ключе и время брони: напоминание о перенесённой брони не должно теряться за устаревшим
+        self._scheduled: set[tuple[UUID, ReminderKind, datetime]] = set()
+        self._loaded_until: Optional[datetime] = None
+        # граница окна, которое грузится прямо сейчас: бронь, созданную во время запроса, он может не увидеть
+        self._accept_until: Optional[datetime] = None
+        self._wakeup = asyncio.Event()
+
+    async def handle(self, event: Any) -> None:
+        if isinstance(event, (BookingCreated, BookingRescheduled)):
+            # прежние напоминания перенесённой брони остаются в куче, их отсеет проверка перед отправкой
+            now = datetime.now(UTC)
+            for kind in ReminderKind:
+                reminder = self._reminder(kind, event.booking_id, event.user_id, event.time_from, event.time_until)
+                # дальше загруженного окна бронь найдёт следующая подгрузка из базы
+                if self._accept_until is not None and now < reminder.fire_at < self._accept_until:
+                    self._push(reminder)
+        elif isinstance(event, BookingCancelled):
+            # из кучи не удаляем: запись без ключа в _scheduled просто пропускается при извлечении
+            self._scheduled.discard((event.booking_id, ReminderKind.STARTS, event.time_from))
+            self._scheduled.discard((event.booking_id, ReminderKind.ENDS, event.time_until))
+
+    def _reminder(
+        self,
+        kind: ReminderKind,
+        booking_id: UUID,
+        user_id: UUID,
+        time_from: datetime,
+        time_until: datetime,
+    ) -> Reminder:
+        at = time_from if kind == ReminderKind.STARTS else time_until
+        return Reminder(fire_at=at - self.leads[kind], booking_id=booking_id, user_id=user_id, kind=kind, at=at)
+
+    def _push(self, reminder: Reminder) -> None:
+        key = (reminder.booking_id, reminder.kind, reminder.at)
+        if key in self._scheduled:
+            return
+
+        self._scheduled.add(key)
+        heapq.heappush(self._heap, reminder)
+        if self._heap[0] is reminder:
+            self._wakeup.set()
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self._tick()
+            except asyncio.CancelledError:
+                logger.info('Reminder scheduler was stopped')
+                raise
+            except Exception:
+                logger.exception('Reminder scheduler failed, retrying')
+                await asyncio.sleep(1)
+
+    async def _tick(self) -> None:
+        now = datetime.now(UTC)
+        if self._loaded_until is None or self._loaded_until - now < self.horizon / 2:
+            await self._load_window(now)
+
+        due = self._pop_due(now)
+        if due:
+            await self._fire(due)
+            return
+
+        timeout = self._loaded_until - self.horizon / 2 - now
+        if self._heap:
+            timeout = min(timeout, self._heap[0].fire_at - now)
+
+        self._wakeup.clear()
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), max(timeout.total_seconds(), 0))
+
+    async def _load_window(self, now: datetime) -> None:
+        start = self._loaded_until or now
+        end = now + self.horizon
+        self._accept_until = max(end, self._accept_until or end)
+
+        async with self.container() as request_container:
+            repo = await request_container.get(BookingRepository)
+            starting = await repo.get_active_starting_between(
+                start + self.leads[ReminderKind.STARTS],
+                end + self.leads[ReminderKind.STARTS],
+            )
+            ending = await repo.get_active_ending_between(
+                start + self.leads[ReminderKind.ENDS],
+                end + self.leads[ReminderKind.ENDS],
+            )
+
+        late, missed = [], []
+        for kind, bookings in ((ReminderKind.STARTS, starting), (ReminderKind.ENDS, ending)):
+            for booking in bookings:
+                reminder = self._reminder(kind, booking.id, booking.user_id, booking.time_from, booking.time_until)
+                if reminder.fire_at <= now:
+                    # окно подгрузилось с опозданием, например после зависшей базы:
+                    # пока начало или конец брони не наступили, напоминание ещё полезно, отправляем сразу
+                    if reminder.at <= now:
+                        missed.append(str(booking.id))
+                        continue
+                    late.append(str(booking.id))
+                    reminder = replace(reminder, fire_at=now)
+                self._push(reminder)
+
+        if late or missed:
+            logger.warning('Reminder window loaded late', **log_extra(late=late, missed=missed))
+
+        self._loaded_until = end
+        logger.debug(
+            'Reminder window loaded',
+            **log_extra(until=end.isoformat(), loaded=len(starting) + len(ending), pending=len(self._heap)),
+        )
+
+    def _pop_due(self, now: datetime) -> list[Reminder]:
+        due = []
+        while self._heap and self._heap[0].fire_at <= now and len(due) < self.batch_size:
+            reminder = heapq.heappop(self._heap)
+            key = (reminder.booking_id, reminder.kind, reminder.at)
+            if key in self._scheduled:
+                self._scheduled.discard(key)
+                due.append(reminder)
+        return due
+
+    async def _fire(self, due: list[Reminder]) -> None:
+        async with self.container() as request_container:
+            repo = await request_container.get(BookingRepository)
+            bookings = {booking.id: booking for booking in await repo.get_by_ids([r.booking_id for r in due])}
+
+        actual = [reminder for reminder in due if self._is_actual(reminder, bookings.get(reminder.booking_id))]
+        results = await asyncio.gather(*[self._send(reminder) for reminder in actual], return_exceptions=True)
+
+        failed = [
+            (reminder, result)
+            for reminder, result in zip(actual, results, strict=True)
+            if isinstance(result, BaseException)
+        ]
+        logger.info(
+            'Booking reminders sent',
+            **log_extra(due=len(due), sent=len(actual) - len(failed), failed=len(failed)),
+        )
+
+        now = datetime.now(UTC)
+        for reminder, error in failed:
+            self._retry(reminder, error, now)
+
+    def _retry(self, reminder: Reminder, error: BaseException, now: datetime) -> None:
+        extra = log_extra(
+            booking_id=str(reminder.booking_id),
+            kind=reminder.kind.value,
+            attempt=reminder.attempt,
+            error=str(error),
+            error_type=error.__class__.__name__,
+        )
+        fire_at = now + self.retry_delay * 2 ** (reminder.attempt - 1)
+        # после начала или конца брони напоминать о них уже поздно
+        if reminder.attempt >= self.max_attempts or fire_at >= reminder.at:
+            logger.error('Booking reminder was not sent', **extra)
+            return
+
+        logger.warning('Booking reminder failed, retrying', **extra)
+        # перед повтором бронь перечитается вместе с пачкой, так что отменённую мы не напомним
+        self._push(replace(reminder, fire_at=fire_at, attempt=reminder.attempt + 1))
+
+    @staticmethod
+    def _is_actual(reminder: Reminder, booking: Optional[Booking]) -> bool:
+        if booking is None or booking.status != 'active':
+            return False
+        at = booking.time_from if reminder.kind == ReminderKind.STARTS else booking.time_until
+        return at == reminder.at
+
+    async def _send(self, reminder: Reminder) -> None:
+        title, body = REMINDER_TEXTS[reminder.kind]
+
+        # у каждой отправки своя сессия: одну AsyncSession нельзя делить между конкурентными задачами,
+        # а семафор не даёт пачке занять весь пул соединений на время запросов к FCM
+        async with self._sending, self.container() as request_container:
+            service = await request_container.get(NotificationsService)
+            await service.send_notification(
+                reminder.user_id,
+                NotificationType.SYSTEM,
+                title,
+                body.format(at=reminder.at.astimezone(UTC)),
+                {'kind': reminder.kind.value, 'booking_id': str(reminder.booking_id)},
+            )
@@ -2,7 +2,7 @@ import typing
 from uuid import UUID
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.core.exceptions import handle_exceptions
@@ -14,7 +14,13 @@ security = HTTPBearer()
 @inject
 @handle_exceptions
 async def get_current_user_id(
+    request: Request,
     auth_service: FromDishka[AuthService],
     credentials: typing.Annotated[HTTPAuthorizationCredentials, Depends(security)],
 ) -> UUID:
+    # banlist_middleware уже проверил этот токен
+    user_id = getattr(request.state, 'user_id', None)
+    if user_id is not None:
+        return user_id
+
     return await auth_service.verify_token(credentials.credentials)
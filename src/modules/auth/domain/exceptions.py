@@ -11,6 +11,10 @@ class TokenValidationError(Exception):
     pass
 
 
+class PasswordHasherOverloadedError(Exception):
+    pass
+
+
 register_domain_exception(
     InvalidCredentialsError,
     ErrorCode.AUTHENTICATION_ERROR,
@@ -24,3 +28,10 @@ register_domain_exception(
     status.HTTP_401_UNAUTHORIZED,
     include_headers={'WWW-Authenticate': 'Bearer'},
 )
+
+register_domain_exception(
+    PasswordHasherOverloadedError,
+    ErrorCode.SERVICE_UNAVAILABLE,
+    status.HTTP_503_SERVICE_UNAVAILABLE,
+    include_headers={'Retry-After': '1'},
+)
@@ -1,8 +1,12 @@
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from jose import JWTError, jwt
 
+from src.core.metrics import JWT_CACHE_HITS, JWT_CACHE_MISSES
 from src.core.settings import Settings
 from src.modules.auth.domain.entities import Token
 from src.modules.auth.domain.exceptions import TokenValidationError
@@ -12,6 +16,8 @@ from src.modules.auth.domain.services import TokenService
 class JWTTokenService(TokenService):
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        # sha256 токена -> (exp, claims), порядок ключей задаёт LRU
+        self._cache: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
 
     async def create_token(
         self,
@@ -34,6 +40,30 @@ class JWTTokenService(TokenService):
         return Token(access_token=encoded_jwt, expires_at=expire)
 
     async def verify_token(self, token: str) -> dict[str, Any]:
+        key = hashlib.sha256(token.encode()).digest()
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            expires_at, claims = cached
+            if expires_at > time.time():
+                self._cache.move_to_end(key)
+                JWT_CACHE_HITS.inc()
+                return dict(claims)
+            del self._cache[key]
+
+        JWT_CACHE_MISSES.inc()
+        claims = self._decode(token)
+
+        # без exp запись нечем ограничить по времени, такие токены не кэшируем
+        expires_at = claims.get('exp')
+        if self.settings.jwt.cache_size > 0 and isinstance(expires_at, int | float):
+            self._cache[key] = (float(expires_at), claims)
+            if len(self._cache) > self.settings.jwt.cache_size:
+                self._cache.popitem(last=False)
+
+        return dict(claims)
+
+    def _decode(self, token: str) -> dict[str, Any]:
         try:
             return jwt.decode(
                 token,
@@ -1,13 +1,62 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
 from passlib.context import CryptContext
 
+from src.core.metrics import PASSWORD_HASH_REJECTED, PASSWORD_HASH_SATURATION, PASSWORD_HASH_SECONDS
+from src.core.settings import Settings
+from src.modules.auth.domain.exceptions import PasswordHasherOverloadedError
 from src.modules.auth.domain.services import PasswordHasher
 
-pwd_context = CryptContext(schemes=['argon2'], deprecated='auto')
+T = TypeVar('T')
 
 
 class ArgonPasswordHasher(PasswordHasher):
+    """Argon2 в отдельном пуле потоков, чтобы хэширование не блокировало event loop.
+
+    argon2-cffi отпускает GIL на время вычисления, поэтому потоки работают параллельно.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        config = settings.argon2
+        costs = {
+            'argon2__rounds': config.time_cost,
+            'argon2__memory_cost': config.memory_cost,
+            'argon2__parallelism': config.parallelism,
+        }
+        self._context = CryptContext(
+            schemes=['argon2'],
+            deprecated='auto',
+            **{name: value for name, value in costs.items() if value is not None},
+        )
+        self._executor = ThreadPoolExecutor(max_workers=config.workers, thread_name_prefix='argon2')
+        self._capacity = config.workers + config.max_queue
+        self._in_flight = 0
+
     async def hash_password(self, password: str) -> str:
-        return pwd_context.hash(password)
+        return await self._run('hash', self._context.hash, password)
 
     async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+        return await self._run('verify', self._context.verify, plain_password, hashed_password)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, operation: str, func: Callable[..., T], *args: Any) -> T:
+        if self._in_flight >= self._capacity:
+            PASSWORD_HASH_REJECTED.labels(operation).inc()
+            msg = 'Too many password hashing requests, try again later'
+            raise PasswordHasherOverloadedError(msg)
+
+        self._in_flight += 1
+        PASSWORD_HASH_SATURATION.set(self._in_flight / self._capacity)
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+            PASSWORD_HASH_SATURATION.set(self._in_flight / self._capacity)
+            PASSWORD_HASH_SECONDS.labels(operation).observe(time.perf_counter() - started)
@@ -8,13 +8,13 @@ from src.modules.auth.domain.entities import YandexOAuthPayload, YandexUserData
 class YandexOIDCService:
     oidc_url = 'https://login.yandex.ru/info'
 
+    def __init__(self, http_session: aiohttp.ClientSession) -> None:
+        self.http_session = http_session
+
     async def get_oidc_data(self, payload: YandexOAuthPayload) -> YandexUserData | None:
         headers = {'Authorization': f'Bearer {payload.token}'}
 
-        async with (
-            aiohttp.ClientSession() as session,
-            session.get(self.oidc_url, headers=headers) as response,
-        ):
+        async with self.http_session.get(self.oidc_url, headers=headers) as response:
             if response.status != http.HTTPStatus.OK:
                 return None
             data = await response.json()
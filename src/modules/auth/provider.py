@@ -1,3 +1,4 @@
+import aiohttp
 from dishka import Provider, Scope, provide  # type: ignore
 
 from src.core.database import (
@@ -24,8 +25,8 @@ class AuthProvider(Provider):
         return JWTTokenService(settings)
 
     @provide(scope=Scope.APP)
-    def get_yandex_oidc_service(self) -> YandexOIDCService:
-        return YandexOIDCServiceImpl()
+    def get_yandex_oidc_service(self, http_session: aiohttp.ClientSession) -> YandexOIDCService:
+        return YandexOIDCServiceImpl(http_session)
 
     @provide(scope=Scope.REQUEST)
     def get_auth_service(
@@ -1,8 +1,43 @@
+import base64
+import json
+from typing import Optional
+
+from src.core.exceptions import ValidationError
 from src.modules.base.api.schemas import PaginationSchema
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import Cursor, KeysetPagination, Pagination
 
 
 class PaginationMapper:
     @staticmethod
     def to_domain(schema: PaginationSchema) -> Pagination:
         return Pagination(limit=schema.count, offset=schema.count * schema.page)
+
+    @staticmethod
+    def to_keyset(schema: PaginationSchema) -> KeysetPagination:
+        return KeysetPagination(limit=schema.count, cursor=CursorMapper.to_domain(schema.cursor or ''))
+
+
+class CursorMapper:
+    @staticmethod
+    def to_domain(token: str) -> Optional[Cursor]:
+        if not token:
+            return None
+
+        try:
+            values = json.loads(base64.urlsafe_b64decode(token.encode()))
+        except ValueError as e:
+            msg = 'Invalid cursor'
+            raise ValidationError(msg) from e
+
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            msg = 'Invalid cursor'
+            raise ValidationError(msg)
+
+        return Cursor(values=tuple(values))
+
+    @staticmethod
+    def to_schema(cursor: Optional[Cursor]) -> Optional[str]:
+        if cursor is None:
+            return None
+
+        return base64.urlsafe_b64encode(json.dumps(list(cursor.values)).encode()).decode()
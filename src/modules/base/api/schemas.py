@@ -1,6 +1,12 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
 class PaginationSchema(BaseModel):
     count: int = Field(default=10, gt=0)
     page: int = Field(default=0, ge=0)
+    cursor: Optional[str] = Field(
+        default=None,
+        description='Курсор следующей страницы, пустое значение — первая страница в режиме курсора',
+    )
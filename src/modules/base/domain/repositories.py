@@ -1,19 +1,27 @@
-from typing import Protocol
+from typing import Any, Protocol
 from uuid import UUID
 
 from src.core.domain import BaseDomain
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import KeysetPagination, Page, Pagination
 
 
 class BaseRepository[D: BaseDomain](Protocol):  # type: ignore
     async def get_by_id(self, obj_id: UUID) -> D: ...
 
+    async def get_by_ids(self, obj_ids: list[UUID]) -> list[D]: ...
+
     async def get_all(self) -> list[D]: ...
 
     async def get_all_paginated(self, pagination: Pagination) -> list[D]: ...
 
+    async def get_page(self, pagination: KeysetPagination) -> Page[D]: ...
+
     async def create(self, obj: D) -> D: ...
 
+    async def create_many(self, objs: list[D]) -> list[D]: ...
+
     async def update(self, obj: D) -> D: ...
 
+    async def update_fields(self, obj_id: UUID, **values: Any) -> D: ...
+
     async def delete(self, obj_id: UUID) -> bool: ...
@@ -1,7 +1,32 @@
 from dataclasses import dataclass
+from enum import StrEnum
+from typing import Optional
 
 
 @dataclass
 class Pagination:
     limit: int
     offset: int
+
+
+@dataclass
+class Cursor:
+    values: tuple[str, ...]
+
+
+@dataclass
+class KeysetPagination:
+    limit: int
+    cursor: Optional[Cursor] = None
+
+
+@dataclass
+class Page[T]:
+    items: list[T]
+    next_cursor: Optional[Cursor] = None
+
+
+class CountMode(StrEnum):
+    NONE = 'none'
+    EXACT = 'exact'
+    ESTIMATE = 'estimate'
@@ -1,19 +1,25 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, ClassVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, insert, inspect, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import AsyncSessionProtocol, BaseModel
 from src.core.domain import BaseDomain
-from src.core.exceptions import NotFoundError
+from src.core.exceptions import NotFoundError, ValidationError
 from src.modules.base.domain.repositories import BaseRepository
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import Cursor, KeysetPagination, Page, Pagination
 
 
 class BaseRepositoryImpl[D: BaseDomain, M: BaseModel](ABC, BaseRepository[D]):
     model_type: M
 
+    # Колонки сортировки для пагинации по курсору, последняя должна быть уникальной
+    cursor_columns: ClassVar[tuple[str, ...]] = ('id',)
+    cursor_descending: ClassVar[bool] = False
+
     def __init__(self, db: AsyncSession | AsyncSessionProtocol) -> None:
         self.db = db
 
@@ -33,6 +39,14 @@ class BaseRepositoryImpl[D: BaseDomain, M: BaseModel](ABC, BaseRepository[D]):
 
         return self._map_to_domain(result)
 
+    async def get_by_ids(self, obj_ids: list[UUID]) -> list[D]:
+        if not obj_ids:
+            return []
+
+        stmt = select(self.model_type).where(self.model_type.id.in_(set(obj_ids)))
+        result = (await self.db.execute(stmt)).scalars().all()
+        return [self._map_to_domain(model) for model in result]
+
     async def get_all(self) -> list[D]:
         stmt = select(self.model_type)
         result = (await self.db.execute(stmt)).scalars().all()
@@ -43,18 +57,109 @@ class BaseRepositoryImpl[D: BaseDomain, M: BaseModel](ABC, BaseRepository[D]):
         result = (await self.db.execute(stmt)).scalars().all()
         return [self._map_to_domain(model) for model in result]  # type: ignore
 
+    async def get_page(self, pagination: KeysetPagination) -> Page[D]:
+        return await self._get_keyset_page(select(self.model_type), pagination)
+
+    async def _get_keyset_page(self, stmt: Select[Any], pagination: KeysetPagination) -> Page[D]:
+        columns = [getattr(self.model_type, name) for name in self.cursor_columns]
+
+        if pagination.cursor is not None:
+            key = tuple_(*columns)
+            values = self._decode_cursor(columns, pagination.cursor)
+            stmt = stmt.where(key < values if self.cursor_descending else key > values)
+
+        order = [column.desc() if self.cursor_descending else column.asc() for column in columns]
+        stmt = stmt.order_by(*order).limit(pagination.limit + 1)
+
+        models = list((await self.db.execute(stmt)).scalars().all())
+
+        next_cursor = None
+        if len(models) > pagination.limit:
+            models = models[: pagination.limit]
+            next_cursor = Cursor(
+                values=tuple(self._encode_cursor_value(getattr(models[-1], name)) for name in self.cursor_columns),
+            )
+
+        return Page(items=[self._map_to_domain(model) for model in models], next_cursor=next_cursor)
+
+    @staticmethod
+    def _encode_cursor_value(value: Any) -> str:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return str(value)
+
+    @staticmethod
+    def _decode_cursor(columns: list[Any], cursor: Cursor) -> tuple[Any, ...]:
+        if len(cursor.values) != len(columns):
+            msg = 'Invalid cursor'
+            raise ValidationError(msg)
+
+        try:
+            return tuple(
+                datetime.fromisoformat(value) if column.type.python_type is datetime else column.type.python_type(value)
+                for column, value in zip(columns, cursor.values, strict=True)
+            )
+        except ValueError as e:
+            msg = 'Invalid cursor'
+            raise ValidationError(msg) from e
+
     async def create(self, obj: D) -> D:
         model = self._map_to_orm(obj)
         self.db.add(model)
-        await self.db.commit()
-        await self.db.refresh(model)
+        await self.db.flush()
+        await self._refresh_server_values(model)
         return self._map_to_domain(model)
 
+    async def create_many(self, objs: list[D]) -> list[D]:
+        """Вставляет все объекты одним многострочным INSERT ... RETURNING."""
+        if not objs:
+            return []
+
+        # None для колонок с default или вычисляемых пропускаем, чтобы значение подставила база
+        columns = inspect(self.model_type).column_attrs
+        defaulted = {
+            column.key
+            for column in columns
+            if any(
+                c.default is not None or c.server_default is not None or c.computed is not None
+                for c in column.columns
+            )
+        }
+        rows = [
+            {
+                column.key: value
+                for column in columns
+                if (value := getattr(model, column.key)) is not None or column.key not in defaulted
+            }
+            for model in map(self._map_to_orm, objs)
+        ]
+
+        stmt = insert(self.model_type).returning(self.model_type, sort_by_parameter_order=True)
+        models = (await self.db.execute(stmt, rows)).scalars().all()
+        return [self._map_to_domain(model) for model in models]
+
     async def update(self, obj: D) -> D:
         model = self._map_to_orm(obj)
         model = await self.db.merge(model)  # type: ignore
-        await self.db.commit()
-        await self.db.refresh(model)
+        await self.db.flush()
+        await self._refresh_server_values(model)
+        return self._map_to_domain(model)
+
+    async def update_fields(self, obj_id: UUID, **values: Any) -> D:
+        """Обновляет только переданные колонки одним UPDATE ... RETURNING."""
+        stmt = (
+            update(self.model_type)
+            .where(self.model_type.id == obj_id)
+            .values(**values)
+            .returning(self.model_type)
+            .execution_options(populate_existing=True)
+        )
+        model = (await self.db.execute(stmt)).scalar_one_or_none()
+
+        if model is None:
+            msg = f'Model {self.model_type.__name__} with ID {obj_id} not found'
+            raise NotFoundError(msg)
+
         return self._map_to_domain(model)
 
     async def delete(self, obj_id: UUID) -> None:
@@ -65,4 +170,11 @@ class BaseRepositoryImpl[D: BaseDomain, M: BaseModel](ABC, BaseRepository[D]):
             raise NotFoundError
 
         await self.db.delete(result)
-        await self.db.commit()
+        await self.db.flush()
+
+    async def _refresh_server_values(self, model: M) -> None:
+        # Коммитом владеет TransactionManager. После flush устаревшими остаются
+        # только колонки, которые посчитала сама база (onupdate, Computed), их и перечитываем
+        expired = inspect(model).expired_attributes
+        if expired:
+            await self.db.refresh(model, attribute_names=list(expired))
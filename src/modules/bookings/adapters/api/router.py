@@ -1,14 +1,15 @@
-from typing import Annotated, Union
+from typing import Annotated, Optional, Union
 from uuid import UUID
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from fastapi.responses import JSONResponse
 
 from src.core.exceptions import handle_exceptions
 from src.modules.auth.adapters.api.dependencies import get_current_user_id
-from src.modules.base.api.mappers import PaginationMapper
+from src.modules.base.api.mappers import CursorMapper, PaginationMapper
 from src.modules.base.api.schemas import PaginationSchema
+from src.modules.base.domain.value_objects import CountMode
 from src.modules.bookings.adapters.api.schemas import (
     AddOptionSchema,
     AvailableTimeSlotsResponseSchema,
@@ -139,13 +140,35 @@ async def cancel_booking(
 @handle_exceptions
 async def get_all_bookings(
     service: FromDishka[BookingService],
+    response: Response,
     current_user_id: Annotated[UUID, Depends(get_current_user_id)],
     count: Annotated[int, Query(gt=0)] = 10,
     page: Annotated[int, Query(ge=0)] = 0,
+    total: Annotated[CountMode, Query(description='Режим подсчета X-Total-Count')] = CountMode.NONE,
+    cursor: Annotated[Optional[str], Query()] = None,
 ) -> list[BookingListResponseSchema]:
     """Получить все брони пользователя."""
-    pagination = PaginationMapper.to_domain(PaginationSchema(count=count, page=page))
-    bookings, _ = await service.get_all_bookings_paginated(current_user_id, pagination)
+    schema = PaginationSchema(count=count, page=page, cursor=cursor)
+
+    if schema.cursor is not None:
+        bookings_page, total_count = await service.get_all_bookings_page(
+            current_user_id,
+            PaginationMapper.to_keyset(schema),
+            total,
+        )
+        bookings = bookings_page.items
+        next_cursor = CursorMapper.to_schema(bookings_page.next_cursor)
+        if next_cursor is not None:
+            response.headers['X-Next-Cursor'] = next_cursor
+    else:
+        bookings, total_count = await service.get_all_bookings_paginated(
+            current_user_id,
+            PaginationMapper.to_domain(schema),
+            total,
+        )
+
+    if total_count is not None:
+        response.headers['X-Total-Count'] = str(total_count)
     return [BookingListResponseSchema.model_validate(booking) for booking in bookings]
 
 
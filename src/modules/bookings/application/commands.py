@@ -27,13 +27,6 @@ class CreateBookingCommand:
 
         _ = await self.spot_repo.get_by_id(self.spot_id)
 
-        await BookingValidator.check_for_overlapping_bookings(
-            self.spot_id,
-            self.time_from,
-            self.time_until,
-            self.booking_repo,
-        )
-
         booking = Booking(
             id=uuid4(),
             user_id=self.user_id,
@@ -43,6 +36,7 @@ class CreateBookingCommand:
             status='active',
         )
 
+        # Пересечения отсекает exclusion-ограничение, create выбросит BookingOverlapError
         await self.booking_repo.create(booking)
 
         await self.event_bus.publish(
@@ -74,9 +68,7 @@ class CancelBookingCommand:
             msg = 'User is not authorized to cancel this booking'
             raise PermissionError(msg)
 
-        booking.status = 'cancelled'
-
-        updated_booking = await self.booking_repo.update(booking)
+        updated_booking = await self.booking_repo.update_fields(booking.id, status='cancelled')
 
         await self.event_bus.publish(
             BookingCancelled(
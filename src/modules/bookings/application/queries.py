@@ -25,12 +25,18 @@ class GetUserBookingsQuery:
         for booking in bookings:
             booking.status = booking.get_effective_status(current_time)
 
+        spots = {spot.id: spot for spot in await self.spot_repo.get_by_ids([b.spot_id for b in bookings])}
+        coworkings = {
+            coworking.id: coworking
+            for coworking in await self.coworking_repo.get_by_ids([s.coworking_id for s in spots.values()])
+        }
+
         result: list[dict[str, Any]] = []
 
         for booking in bookings:
-            spot = await self.spot_repo.get_by_id(booking.spot_id)
+            spot = spots[booking.spot_id]
 
-            coworking = await self.coworking_repo.get_by_id(spot.coworking_id)
+            coworking = coworkings[spot.coworking_id]
 
             booking_data: dict[str, Any] = {
                 'id': booking.id,
@@ -5,13 +5,13 @@ from uuid import UUID
 from src.core.database import TransactionManager
 from src.core.events import EventBus
 from src.core.timezone_utils import DEFAULT_TIMEZONE_OFFSET, to_client_timezone, to_utc
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import CountMode, KeysetPagination, Page, Pagination
 from src.modules.bookings.application.commands import CancelBookingCommand, CreateBookingCommand
 from src.modules.bookings.application.queries import GetUserBookingsQuery
 from src.modules.bookings.domain.entities import Booking
+from src.modules.bookings.domain.events import BookingRescheduled
 from src.modules.bookings.domain.exceptions import (
     BookingAccessDeniedError,
-    BookingOverlapError,
     SpotHasNoCurrentBookingError,
 )
 from src.modules.bookings.domain.repositories import BookingRepository
@@ -35,6 +35,10 @@ class BookingService:
         transaction_manager: TransactionManager,
         user_repo: Optional[UserRepository] = None,
         option_repo: Optional[OptionRepository] = None,
+        read_booking_repo: Optional[BookingRepository] = None,
+        read_spot_repo: Optional[SpotRepository] = None,
+        read_coworking_repo: Optional[CoworkingRepository] = None,
+        read_user_repo: Optional[UserRepository] = None,
     ) -> None:
         self.booking_repo = booking_repo
         self.spot_repo = spot_repo
@@ -43,6 +47,10 @@ class BookingService:
         self.transaction_manager = transaction_manager
         self.user_repo = user_repo
         self.option_repo = option_repo
+        self.read_booking_repo = read_booking_repo or booking_repo
+        self.read_spot_repo = read_spot_repo or spot_repo
+        self.read_coworking_repo = read_coworking_repo or coworking_repo
+        self.read_user_repo = read_user_repo or user_repo
 
     async def create_booking(
         self,
@@ -66,7 +74,13 @@ class BookingService:
             )
             booking = await command()
 
-            bookings = await self.get_user_bookings(user_id)
+            # только что созданная бронь есть лишь в основной базе, поэтому читаем из неё
+            query = GetUserBookingsQuery(
+                booking_repo=self.booking_repo,
+                spot_repo=self.spot_repo,
+                coworking_repo=self.coworking_repo,
+            )
+            bookings = await self._get_user_bookings(query, user_id)
             for b in bookings:
                 if b['id'] == booking.id:
                     return b
@@ -81,10 +95,13 @@ class BookingService:
 
     async def get_user_bookings(self, user_id: UUID) -> list[dict[str, Any]]:
         query = GetUserBookingsQuery(
-            booking_repo=self.booking_repo,
-            spot_repo=self.spot_repo,
-            coworking_repo=self.coworking_repo,
+            booking_repo=self.read_booking_repo,
+            spot_repo=self.read_spot_repo,
+            coworking_repo=self.read_coworking_repo,
         )
+        return await self._get_user_bookings(query, user_id)
+
+    async def _get_user_bookings(self, query: GetUserBookingsQuery, user_id: UUID) -> list[dict[str, Any]]:
         bookings = await query(user_id)
 
         for booking in bookings:
@@ -176,23 +193,22 @@ class BookingService:
         time_until: datetime,
     ) -> Booking:
         async with self.transaction_manager:
-            booking = await self._check_permission(booking_id, user_id)
-
-            active_bookings = await self.booking_repo.get_active_bookings_in_time_range(
-                booking.spot_id,
-                time_from,
-                time_until,
+            await self._check_permission(booking_id, user_id)
+
+            booking = await self.booking_repo.update_fields(booking_id, time_from=time_from, time_until=time_until)
+
+            await self.event_bus.publish(
+                BookingRescheduled(
+                    booking_id=booking.id,
+                    user_id=booking.user_id,
+                    spot_id=booking.spot_id,
+                    time_from=booking.time_from,
+                    time_until=booking.time_until,
+                    timestamp=datetime.now(UTC),
+                ),
             )
 
-            conflicts = [b for b in active_bookings if b.id != booking_id]
-
-            if conflicts:
-                raise BookingOverlapError
-
-            booking.time_from = time_from
-            booking.time_until = time_until
-
-            return await self.booking_repo.update(booking)
+            return booking
 
     async def get_current_booking_for_spot(self, spot_id: UUID, user_id: UUID) -> dict[str, Any]:
         if not self.user_repo:
@@ -242,27 +258,60 @@ class BookingService:
         self,
         user_id: UUID,
         pagination: Pagination,
-    ) -> tuple[list[dict[str, Any]], int]:
+        count_mode: CountMode = CountMode.NONE,
+    ) -> tuple[list[dict[str, Any]], Optional[int]]:
         if not self.user_repo:
             return [], 0
 
-        user = await self.user_repo.get_by_id(user_id)
+        user = await self.read_user_repo.get_by_id(user_id)
         if not user.is_business:
             raise BookingAccessDeniedError
 
-        total_count = await self.booking_repo.count_all()
+        total_count = await self._count_bookings(count_mode)
 
-        bookings = await self.booking_repo.get_all_paginated(pagination)
+        bookings = await self.read_booking_repo.get_all_paginated(pagination)
 
+        return await self._build_booking_list(bookings), total_count
+
+    async def get_all_bookings_page(
+        self,
+        user_id: UUID,
+        pagination: KeysetPagination,
+        count_mode: CountMode = CountMode.NONE,
+    ) -> tuple[Page[dict[str, Any]], Optional[int]]:
+        if not self.user_repo:
+            return Page(items=[]), 0
+
+        user = await self.read_user_repo.get_by_id(user_id)
+        if not user.is_business:
+            raise BookingAccessDeniedError
+
+        total_count = await self._count_bookings(count_mode)
+
+        page = await self.read_booking_repo.get_page(pagination)
+
+        return Page(items=await self._build_booking_list(page.items), next_cursor=page.next_cursor), total_count
+
+    async def _count_bookings(self, count_mode: CountMode) -> Optional[int]:
+        if count_mode == CountMode.EXACT:
+            return await self.read_booking_repo.count_all()
+        if count_mode == CountMode.ESTIMATE:
+            return await self.read_booking_repo.estimate_count()
+        return None
+
+    async def _build_booking_list(self, bookings: list[Booking]) -> list[dict[str, Any]]:
         current_time = datetime.now(UTC)
         for booking in bookings:
             booking.status = booking.get_effective_status(current_time)
 
+        users = {u.id: u for u in await self.read_user_repo.get_by_ids([b.user_id for b in bookings])}
+        spots = {s.id: s for s in await self.read_spot_repo.get_by_ids([b.spot_id for b in bookings])}
+
         result: list[dict[str, Any]] = []
         for booking in bookings:
-            booking_user = await self.user_repo.get_by_id(booking.user_id)
+            booking_user = users[booking.user_id]
 
-            spot = await self.spot_repo.get_by_id(booking.spot_id)
+            spot = spots[booking.spot_id]
 
             booking_info: dict[str, Any] = {
                 'id': booking.id,
@@ -284,7 +333,7 @@ class BookingService:
 
             result.append(booking_info)
 
-        return result, total_count
+        return result
 
     async def suggest_alternative_spot(
         self,
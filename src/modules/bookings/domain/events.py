@@ -13,6 +13,16 @@ class BookingCreated:
     timestamp: datetime
 
 
+@dataclass(frozen=True)
+class BookingRescheduled:
+    booking_id: UUID
+    user_id: UUID
+    spot_id: UUID
+    time_from: datetime
+    time_until: datetime
+    timestamp: datetime
+
+
 @dataclass(frozen=True)
 class BookingCancelled:
     booking_id: UUID
@@ -13,6 +13,8 @@ class BookingRepository(BaseRepository[Booking]):
 
     async def count_all(self) -> int: ...
 
+    async def estimate_count(self) -> int: ...
+
     async def get_all_paginated(self, pagination: Pagination) -> list[Booking]: ...
 
     async def get_active_bookings_in_time_range(
@@ -28,3 +30,7 @@ class BookingRepository(BaseRepository[Booking]):
         time_from: datetime,
         time_until: datetime,
     ) -> list[Booking]: ...
+
+    async def get_active_starting_between(self, start: datetime, end: datetime) -> list[Booking]: ...
+
+    async def get_active_ending_between(self, start: datetime, end: datetime) -> list[Booking]: ...
@@ -1,11 +1,6 @@
 from datetime import datetime
-from uuid import UUID
 
-from src.modules.bookings.domain.exceptions import (
-    BookingOverlapError,
-    InvalidBookingTimeError,
-)
-from src.modules.bookings.domain.repositories import BookingRepository
+from src.modules.bookings.domain.exceptions import InvalidBookingTimeError
 
 
 class BookingValidator:
@@ -17,20 +12,3 @@ class BookingValidator:
         if time_from >= time_until:
             msg = 'Start time must be before end time'
             raise InvalidBookingTimeError(msg)
-
-    @staticmethod
-    async def check_for_overlapping_bookings(
-        spot_id: UUID,
-        time_from: datetime,
-        time_until: datetime,
-        repo: BookingRepository,
-    ) -> None:
-        existing_bookings = await repo.get_active_bookings_in_time_range(
-            spot_id,
-            time_from,
-            time_until,
-        )
-
-        if existing_bookings:
-            msg = 'Spot is already booked during this time'
-            raise BookingOverlapError(msg)
@@ -1,7 +1,7 @@
 from typing import Any
 
 from src.core.logging import get_logger, log_extra
-from src.modules.bookings.domain.events import BookingCancelled, BookingCreated
+from src.modules.bookings.domain.events import BookingCancelled, BookingCreated, BookingRescheduled
 
 logger = get_logger(__name__)
 
@@ -20,6 +20,18 @@ class BookingEventLogger:
                     timestamp=event.timestamp.isoformat(),
                 ),
             )
+        elif isinstance(event, BookingRescheduled):
+            logger.info(
+                'Booking rescheduled',
+                **log_extra(
+                    booking_id=event.booking_id,
+                    user_id=event.user_id,
+                    spot_id=event.spot_id,
+                    time_from=event.time_from.isoformat(),
+                    time_until=event.time_until.isoformat(),
+                    timestamp=event.timestamp.isoformat(),
+                ),
+            )
         elif isinstance(event, BookingCancelled):
             logger.info(
                 'Booking cancelled',
@@ -1,8 +1,8 @@
 import datetime
 import uuid
 
-from sqlalchemy import DateTime, ForeignKey, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DDL, Computed, DateTime, ForeignKey, Index, String, event, text
+from sqlalchemy.dialects.postgresql import TSTZRANGE, UUID, ExcludeConstraint, Range
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import BaseModel
@@ -39,3 +39,28 @@ class BookingModel(BaseModel):
         nullable=False,
         default='active',
     )
+    period: Mapped[Range[datetime.datetime]] = mapped_column(
+        TSTZRANGE,
+        Computed("tstzrange(time_from, time_until, '[)')", persisted=True),
+    )
+
+    __table_args__ = (
+        Index('ix_bookings_time_from_id', 'time_from', 'id'),
+        Index('ix_bookings_spot_id_status_time_from_time_until', 'spot_id', 'status', 'time_from', 'time_until'),
+        Index('ix_bookings_active_time_until', 'time_until', postgresql_where=text("status = 'active'")),
+        ExcludeConstraint(
+            ('spot_id', '='),
+            ('period', '&&'),
+            name='ex_bookings_spot_id_period',
+            using='gist',
+            where=text("status = 'active'"),
+        ),
+    )
+
+
+# btree_gist нужен для оператора = по uuid внутри GiST-ограничения
+event.listen(
+    BookingModel.__table__,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS btree_gist'),
+)
@@ -1,16 +1,24 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import ColumnElement, and_, func, select, text
+from sqlalchemy.exc import IntegrityError
 
 from src.modules.base.infrastructure.repositories.base_repository import BaseRepositoryImpl
 from src.modules.bookings.domain.entities import Booking
+from src.modules.bookings.domain.exceptions import BookingOverlapError
 from src.modules.bookings.domain.repositories import BookingRepository
 from src.modules.bookings.infrastructure.orm.models import BookingModel
 
+EXCLUSION_VIOLATION = '23P01'
+
 
 class BookingRepositoryImpl(BaseRepositoryImpl[Booking, BookingModel], BookingRepository):
     model_type: type[BookingModel] = BookingModel
+    cursor_columns = ('time_from', 'id')
 
     def _map_to_domain(self, obj: BookingModel) -> Booking:
         return Booking(
@@ -32,6 +40,32 @@ class BookingRepositoryImpl(BaseRepositoryImpl[Booking, BookingModel], BookingRe
             status=obj.status,
         )
 
+    @contextmanager
+    def _overlap_guard(self) -> Iterator[None]:
+        try:
+            yield
+        except IntegrityError as e:
+            if getattr(e.orig, 'sqlstate', None) == EXCLUSION_VIOLATION:
+                msg = 'Spot is already booked during this time'
+                raise BookingOverlapError(msg) from e
+            raise
+
+    async def create(self, obj: Booking) -> Booking:
+        with self._overlap_guard():
+            return await super().create(obj)
+
+    async def create_many(self, objs: list[Booking]) -> list[Booking]:
+        with self._overlap_guard():
+            return await super().create_many(objs)
+
+    async def update(self, obj: Booking) -> Booking:
+        with self._overlap_guard():
+            return await super().update(obj)
+
+    async def update_fields(self, obj_id: UUID, **values: Any) -> Booking:
+        with self._overlap_guard():
+            return await super().update_fields(obj_id, **values)
+
     async def get_by_user_id(self, user_id: UUID) -> list[Booking]:
         stmt = select(self.model_type).where(self.model_type.user_id == user_id)
         result = await self.db.execute(stmt)
@@ -42,6 +76,26 @@ class BookingRepositoryImpl(BaseRepositoryImpl[Booking, BookingModel], BookingRe
         result = await self.db.execute(stmt)
         return [self._map_to_domain(obj) for obj in result.scalars().all()]
 
+    async def count_all(self) -> int:
+        stmt = select(func.count()).select_from(self.model_type)
+        return (await self.db.execute(stmt)).scalar_one()
+
+    async def estimate_count(self) -> int:
+        stmt = text('SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)')
+        estimate = (await self.db.execute(stmt, {'table': self.model_type.__tablename__})).scalar_one()
+
+        # reltuples равен -1, пока таблица ни разу не анализировалась
+        if estimate < 0:
+            return await self.count_all()
+
+        return estimate
+
+    def _overlaps(self, time_from: datetime, time_until: datetime) -> ColumnElement[bool]:
+        return and_(
+            self.model_type.time_from < time_until,
+            self.model_type.time_until > time_from,
+        )
+
     async def get_active_bookings_in_time_range(
         self,
         spot_id: UUID,
@@ -49,24 +103,9 @@ class BookingRepositoryImpl(BaseRepositoryImpl[Booking, BookingModel], BookingRe
         time_until: datetime,
     ) -> list[Booking]:
         stmt = select(self.model_type).where(
-            and_(
-                self.model_type.spot_id == spot_id,
-                self.model_type.status == 'active',
-                or_(
-                    and_(
-                        self.model_type.time_from >= time_from,
-                        self.model_type.time_from < time_until,
-                    ),
-                    and_(
-                        self.model_type.time_until > time_from,
-                        self.model_type.time_until <= time_until,
-                    ),
-                    and_(
-                        self.model_type.time_from <= time_from,
-                        self.model_type.time_until >= time_until,
-                    ),
-                ),
-            ),
+            self.model_type.spot_id == spot_id,
+            self.model_type.status == 'active',
+            self._overlaps(time_from, time_until),
         )
 
         result = await self.db.execute(stmt)
@@ -82,24 +121,26 @@ class BookingRepositoryImpl(BaseRepositoryImpl[Booking, BookingModel], BookingRe
             return []
 
         stmt = select(self.model_type).where(
-            and_(
-                self.model_type.spot_id.in_(spot_ids),
-                self.model_type.status == 'active',
-                or_(
-                    and_(
-                        self.model_type.time_from >= time_from,
-                        self.model_type.time_from < time_until,
-                    ),
-                    and_(
-                        self.model_type.time_until > time_from,
-                        self.model_type.time_until <= time_until,
-                    ),
-                    and_(
-                        self.model_type.time_from <= time_from,
-                        self.model_type.time_until >= time_until,
-                    ),
-                ),
-            ),
+            self.model_type.spot_id.in_(spot_ids),
+            self.model_type.status == 'active',
+            self._overlaps(time_from, time_until),
+        )
+
+        result = await self.db.execute(stmt)
+        return [self._map_to_domain(obj) for obj in result.scalars().all()]
+
+    async def get_active_starting_between(self, start: datetime, end: datetime) -> list[Booking]:
+        return await self._get_active_between(self.model_type.time_from, start, end)
+
+    async def get_active_ending_between(self, start: datetime, end: datetime) -> list[Booking]:
+        return await self._get_active_between(self.model_type.time_until, start, end)
+
+    async def _get_active_between(self, column: Any, start: datetime, end: datetime) -> list[Booking]:
+        # диапазон по индексу на колонку времени, без прохода по всем будущим броням
+        stmt = (
+            select(self.model_type)
+            .where(self.model_type.status == 'active', column >= start, column < end)
+            .order_by(column)
         )
 
         result = await self.db.execute(stmt)
@@ -1,14 +1,17 @@
 from dishka import Provider, Scope, provide
 
-from src.core.database import AsyncSessionProtocol, TransactionManager
-from src.core.events import EventBus
+from src.core.database import AsyncSessionProtocol, ReadOnlySessionProtocol, TransactionManager
+from src.core.outbox import TransactionalEventBus
 from src.modules.bookings.application.services import BookingService
 from src.modules.bookings.domain.repositories import BookingRepository
 from src.modules.bookings.infrastructure.repositories.booking_repository import BookingRepositoryImpl
 from src.modules.coworkings.domain.repositories import CoworkingRepository
+from src.modules.coworkings.infrastructure.repositories.coworking_repository import CoworkingRepositoryImpl
 from src.modules.options.domain.repositories import OptionRepository
 from src.modules.spots.domain.repositories import SpotRepository
+from src.modules.spots.infrastructure.repositories.spot_repository import SpotRepositoryImpl
 from src.modules.users.domain.repositories import UserRepository
+from src.modules.users.infrastructure.repositories.user_repository import UserRepositoryImpl
 
 
 class BookingProvider(Provider):
@@ -22,10 +25,11 @@ class BookingProvider(Provider):
         booking_repo: BookingRepository,
         spot_repo: SpotRepository,
         coworking_repo: CoworkingRepository,
-        event_bus: EventBus,
+        event_bus: TransactionalEventBus,
         transaction_manager: TransactionManager,
         user_repo: UserRepository,
         option_repo: OptionRepository,
+        read_session: ReadOnlySessionProtocol,
     ) -> BookingService:
         return BookingService(
             booking_repo=booking_repo,
@@ -35,4 +39,8 @@ class BookingProvider(Provider):
             transaction_manager=transaction_manager,
             user_repo=user_repo,
             option_repo=option_repo,
+            read_booking_repo=BookingRepositoryImpl(read_session),
+            read_spot_repo=SpotRepositoryImpl(read_session),
+            read_coworking_repo=CoworkingRepositoryImpl(read_session),
+            read_user_repo=UserRepositoryImpl(read_session),
         )
@@ -1,10 +1,11 @@
+from typing import Optional
 from uuid import UUID
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 
 from src.core.exceptions import handle_exceptions
-from src.modules.base.api.mappers import PaginationMapper
+from src.modules.base.api.mappers import CursorMapper, PaginationMapper
 from src.modules.base.api.schemas import PaginationSchema
 from src.modules.coworkings.adapters.api.schemas import (
     CoworkingCreateSchema,
@@ -23,12 +24,22 @@ router = APIRouter(prefix='/coworkings', tags=['coworkings'])
 @handle_exceptions
 async def list_coworkings(
     service: FromDishka[CoworkingService],
+    response: Response,
     count: int = Query(default=10, gt=0),
     page: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None),
 ) -> list[CoworkingListResponseSchema]:
     """Получить список коворкингов."""
-    pagination = PaginationMapper.to_domain(PaginationSchema(count=count, page=page))
-    coworkings = await service.list_coworkings(pagination)
+    schema = PaginationSchema(count=count, page=page, cursor=cursor)
+
+    if schema.cursor is not None:
+        coworkings_page = await service.list_coworkings_page(PaginationMapper.to_keyset(schema))
+        next_cursor = CursorMapper.to_schema(coworkings_page.next_cursor)
+        if next_cursor is not None:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return [CoworkingListResponseSchema.model_validate(coworking) for coworking in coworkings_page.items]
+
+    coworkings = await service.list_coworkings(PaginationMapper.to_domain(schema))
     return [CoworkingListResponseSchema.model_validate(coworking) for coworking in coworkings]
 
 
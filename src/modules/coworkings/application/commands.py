@@ -46,9 +46,7 @@ class UploadCoworkingImageCommand:
 
         file_id = await self.storage_service.upload_file(image_bytes, self.content_type)
 
-        coworking.images.append(file_id)
-
-        updated_coworking = await self.repo.update(coworking)
+        updated_coworking = await self.repo.update_fields(coworking.id, images=[*coworking.images, file_id])
 
         return updated_coworking, file_id
 
@@ -62,7 +60,9 @@ class DeleteCoworkingImageCommand:
     async def __call__(self) -> Coworking:
         coworking = await self.repo.get_by_id(self.coworking_id)
 
-        if self.image_url in coworking.images:
-            coworking.images.remove(self.image_url)
+        if self.image_url not in coworking.images:
+            return coworking
 
-        return await self.repo.update(coworking)
+        images = list(coworking.images)
+        images.remove(self.image_url)
+        return await self.repo.update_fields(coworking.id, images=images)
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import KeysetPagination, Page, Pagination
 from src.modules.coworkings.domain.entities import Coworking
 from src.modules.coworkings.domain.repositories import CoworkingRepository
 
@@ -19,3 +19,11 @@ class ListCoworkingsQuery:
 
     async def __call__(self, pagination: Pagination) -> list[Coworking]:
         return await self.repo.get_all_paginated(pagination)
+
+
+class ListCoworkingsPageQuery:
+    def __init__(self, repo: CoworkingRepository) -> None:
+        self.repo = repo
+
+    async def __call__(self, pagination: KeysetPagination) -> Page[Coworking]:
+        return await self.repo.get_page(pagination)
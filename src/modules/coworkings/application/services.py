@@ -3,13 +3,17 @@ from typing import Optional
 from uuid import UUID
 
 from src.core.database import TransactionManager
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import KeysetPagination, Page, Pagination
 from src.modules.coworkings.application.commands import (
     CreateCoworkingCommand,
     DeleteCoworkingImageCommand,
     UploadCoworkingImageCommand,
 )
-from src.modules.coworkings.application.queries import GetCoworkingByIdQuery, ListCoworkingsQuery
+from src.modules.coworkings.application.queries import (
+    GetCoworkingByIdQuery,
+    ListCoworkingsPageQuery,
+    ListCoworkingsQuery,
+)
 from src.modules.coworkings.domain.entities import Coworking
 from src.modules.coworkings.domain.repositories import CoworkingRepository
 from src.modules.storage.application.services import StorageService
@@ -21,10 +25,12 @@ class CoworkingService:
         repo: CoworkingRepository,
         transaction_manager: TransactionManager,
         storage_service: StorageService,
+        read_repo: Optional[CoworkingRepository] = None,
     ) -> None:
         self.repo = repo
         self.transaction_manager = transaction_manager
         self.storage_service = storage_service
+        self.read_repo = read_repo or repo
 
     async def create_coworking(
         self,
@@ -48,11 +54,15 @@ class CoworkingService:
             return await command()
 
     async def get_coworking(self, coworking_id: UUID) -> Coworking:
-        query = GetCoworkingByIdQuery(repo=self.repo)
+        query = GetCoworkingByIdQuery(repo=self.read_repo)
         return await query(coworking_id)
 
     async def list_coworkings(self, pagination: Pagination) -> list[Coworking]:
-        query = ListCoworkingsQuery(repo=self.repo)
+        query = ListCoworkingsQuery(repo=self.read_repo)
+        return await query(pagination)
+
+    async def list_coworkings_page(self, pagination: KeysetPagination) -> Page[Coworking]:
+        query = ListCoworkingsPageQuery(repo=self.read_repo)
         return await query(pagination)
 
     async def upload_coworking_image(
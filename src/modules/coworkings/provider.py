@@ -1,6 +1,6 @@
 from dishka import Provider, Scope, provide
 
-from src.core.database import AsyncSessionProtocol, TransactionManager
+from src.core.database import AsyncSessionProtocol, ReadOnlySessionProtocol, TransactionManager
 from src.modules.coworkings.application.services import CoworkingService
 from src.modules.coworkings.domain.repositories import CoworkingRepository
 from src.modules.coworkings.infrastructure.repositories.coworking_repository import CoworkingRepositoryImpl
@@ -21,5 +21,11 @@ class CoworkingProvider(Provider):
         repo: CoworkingRepository,
         transaction_manager: TransactionManager,
         storage_service: StorageService,
+        read_session: ReadOnlySessionProtocol,
     ) -> CoworkingService:
-        return CoworkingService(repo, transaction_manager, storage_service)
+        return CoworkingService(
+            repo,
+            transaction_manager,
+            storage_service,
+            read_repo=CoworkingRepositoryImpl(read_session),
+        )
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, Query, status
 
 from src.core.exceptions import handle_exceptions
 from src.modules.auth.adapters.api.dependencies import get_current_user_id
-from src.modules.base.api.mappers import PaginationMapper
+from src.modules.base.api.mappers import CursorMapper, PaginationMapper
 from src.modules.base.api.schemas import PaginationSchema
 from src.modules.notifications.adapters.api.schemas import (
     DeviceTokenResponseSchema,
@@ -71,6 +71,16 @@ async def get_notifications(
     pagination: Annotated[PaginationSchema, Query(...)],
 ) -> NotificationsListResponseSchema:
     """Получить уведомления."""
+    if pagination.cursor is not None:
+        page = await service.get_notifications_page(
+            current_user_id,
+            PaginationMapper.to_keyset(pagination),
+        )
+        return NotificationsListResponseSchema(
+            items=[NotificationResponseSchema.model_validate(n, from_attributes=True) for n in page.items],
+            next_cursor=CursorMapper.to_schema(page.next_cursor),
+        )
+
     notifications = await service.get_notifications(
         current_user_id,
         PaginationMapper.to_domain(pagination),
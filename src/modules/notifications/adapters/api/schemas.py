@@ -81,7 +81,9 @@ class NotificationResponseSchema(BaseModel):
 
 class NotificationsListResponseSchema(BaseModel):
     items: list[NotificationResponseSchema]
-    total: int
+    # в режиме курсора общее число не считается
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class SendTestNotificationSchema(BaseModel):
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import KeysetPagination, Page, Pagination
 from src.modules.notifications.domain.entities import DeviceToken, Notification
 from src.modules.notifications.domain.repositories import (
     DeviceTokenRepository,
@@ -33,6 +33,14 @@ class GetNotificationsQuery:
         return await self.repo.get_paginated_by_user_id(user_id, pagination)
 
 
+@dataclass
+class GetNotificationsPageQuery:
+    repo: NotificationRepository
+
+    async def __call__(self, user_id: UUID, pagination: KeysetPagination) -> Page[Notification]:
+        return await self.repo.get_page_by_user_id(user_id, pagination)
+
+
 @dataclass
 class GetNotificationByIdQuery:
     repo: NotificationRepository
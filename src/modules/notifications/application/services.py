@@ -3,7 +3,7 @@ from uuid import UUID
 
 from src.core.database import TransactionManager
 from src.core.events import EventBus
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import KeysetPagination, Page, Pagination
 from src.modules.notifications.application.commands import (
     RegisterDeviceTokenCommand,
     RemoveDeviceTokenCommand,
@@ -13,6 +13,7 @@ from src.modules.notifications.application.queries import (
     GetDeviceTokenByIdQuery,
     GetDeviceTokensQuery,
     GetNotificationByIdQuery,
+    GetNotificationsPageQuery,
     GetNotificationsQuery,
 )
 from src.modules.notifications.domain.entities import (
@@ -35,9 +36,13 @@ class NotificationsService:
         fcm_notification_service: FcmNotificationService,
         event_bus: EventBus,
         transaction_manager: TransactionManager,
+        read_device_token_repo: Optional[DeviceTokenRepository] = None,
+        read_notification_repo: Optional[NotificationRepository] = None,
     ) -> None:
         self.device_token_repo = device_token_repo
         self.notification_repo = notification_repo
+        self.read_device_token_repo = read_device_token_repo or device_token_repo
+        self.read_notification_repo = read_notification_repo or notification_repo
         self.fcm_notification_service = fcm_notification_service
         self.event_bus = event_bus
         self.transaction_manager = transaction_manager
@@ -68,11 +73,11 @@ class NotificationsService:
             await command()
 
     async def get_device_tokens(self, user_id: UUID) -> list[DeviceToken]:
-        query = GetDeviceTokensQuery(repo=self.device_token_repo)
+        query = GetDeviceTokensQuery(repo=self.read_device_token_repo)
         return await query(user_id)
 
     async def get_device_token(self, token_id: UUID) -> DeviceToken:
-        query = GetDeviceTokenByIdQuery(repo=self.device_token_repo)
+        query = GetDeviceTokenByIdQuery(repo=self.read_device_token_repo)
         return await query(token_id)
 
     async def send_notification(
@@ -96,20 +101,48 @@ class NotificationsService:
             )
             return await command()
 
+    async def send_notification_to_users(
+        self,
+        user_ids: list[UUID],
+        notification_type: NotificationType,
+        title: str,
+        body: str,
+        data: Optional[dict[str, str]] = None,
+    ) -> dict[UUID, bool]:
+        # рассылка удаляет недействительные токены, зафиксировать удаление должна транзакция
+        async with self.transaction_manager:
+            return await self.fcm_notification_service.send_notification_to_multiple_users(
+                user_ids,
+                notification_type,
+                title,
+                body,
+                data,
+            )
+
     async def get_notifications(
         self,
         user_id: UUID,
         pagination: Pagination,
     ) -> list[Notification]:
-        query = GetNotificationsQuery(repo=self.notification_repo)
+        query = GetNotificationsQuery(repo=self.read_notification_repo)
+        return await query(user_id, pagination)
+
+    async def get_notifications_page(
+        self,
+        user_id: UUID,
+        pagination: KeysetPagination,
+    ) -> Page[Notification]:
+        query = GetNotificationsPageQuery(repo=self.read_notification_repo)
         return await query(user_id, pagination)
 
     async def get_notification(self, notification_id: UUID) -> Notification:
-        query = GetNotificationByIdQuery(repo=self.notification_repo)
+        query = GetNotificationByIdQuery(repo=self.read_notification_repo)
         return await query(notification_id)
 
     async def mark_notification_as_read(self, notification_id: UUID) -> None:
-        await self.notification_repo.mark_as_read(notification_id)
+        async with self.transaction_manager:
+            await self.notification_repo.mark_as_read(notification_id)
 
     async def mark_all_notifications_as_read(self, user_id: UUID) -> None:
-        await self.notification_repo.mark_all_as_read_by_user_id(user_id)
+        async with self.transaction_manager:
+            await self.notification_repo.mark_all_as_read_by_user_id(user_id)
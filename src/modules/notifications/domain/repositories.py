@@ -1,13 +1,15 @@
 from uuid import UUID
 
 from src.modules.base.domain.repositories import BaseRepository
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import KeysetPagination, Page, Pagination
 from src.modules.notifications.domain.entities import DeviceToken, Notification
 
 
 class DeviceTokenRepository(BaseRepository[DeviceToken]):
     async def get_by_user_id(self, user_id: UUID) -> list[DeviceToken]: ...
 
+    async def get_by_user_ids(self, user_ids: list[UUID]) -> dict[UUID, list[DeviceToken]]: ...
+
     async def get_by_token(self, token: str) -> DeviceToken: ...
 
     async def delete_by_token(self, token: str) -> None: ...
@@ -20,6 +22,12 @@ class NotificationRepository(BaseRepository[Notification]):
         pagination: Pagination,
     ) -> list[Notification]: ...
 
+    async def get_page_by_user_id(
+        self,
+        user_id: UUID,
+        pagination: KeysetPagination,
+    ) -> Page[Notification]: ...
+
     async def mark_as_read(self, notification_id: UUID) -> None: ...
 
     async def mark_all_as_read_by_user_id(self, user_id: UUID) -> None: ...
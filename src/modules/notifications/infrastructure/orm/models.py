@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy import JSON, DateTime, Enum, ForeignKey, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -23,7 +23,10 @@ class DeviceTokenModel(BaseModel):
     )
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True, onupdate=func.now())
 
-    __table_args__ = ({'sqlite_autoincrement': True},)
+    __table_args__ = (
+        Index('ix_device_tokens_user_id', 'user_id'),
+        {'sqlite_autoincrement': True},
+    )
 
 
 class NotificationModel(BaseModel):
@@ -41,4 +44,7 @@ class NotificationModel(BaseModel):
     )
     read_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    __table_args__ = ({'sqlite_autoincrement': True},)
+    __table_args__ = (
+        Index('ix_notifications_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        {'sqlite_autoincrement': True},
+    )
@@ -41,6 +41,16 @@ class DeviceTokenRepositoryImpl(BaseRepositoryImpl[DeviceToken, DeviceTokenModel
         db_tokens = result.scalars().all()
         return [token for token in (self._map_to_domain(t) for t in db_tokens) if token is not None]
 
+    async def get_by_user_ids(self, user_ids: list[UUID]) -> dict[UUID, list[DeviceToken]]:
+        tokens: dict[UUID, list[DeviceToken]] = {user_id: [] for user_id in user_ids}
+        if not tokens:
+            return tokens
+
+        stmt = select(DeviceTokenModel).where(DeviceTokenModel.user_id.in_(tokens))
+        for model in (await self.db.execute(stmt)).scalars():
+            tokens[model.user_id].append(self._map_to_domain(model))
+        return tokens
+
     async def get_by_token(self, token: str) -> DeviceToken:
         stmt = select(DeviceTokenModel).where(DeviceTokenModel.token == token)
         result = (await self.db.execute(stmt)).scalar_one_or_none()
@@ -51,4 +61,3 @@ class DeviceTokenRepositoryImpl(BaseRepositoryImpl[DeviceToken, DeviceTokenModel
     async def delete_by_token(self, token: str) -> None:
         stmt = delete(DeviceTokenModel).where(DeviceTokenModel.token == token)
         await self.db.execute(stmt)
-        await self.db.commit()
@@ -3,7 +3,7 @@ from uuid import UUID
 
 from sqlalchemy import delete, select, update
 
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import KeysetPagination, Page, Pagination
 from src.modules.base.infrastructure.repositories.base_repository import BaseRepositoryImpl
 from src.modules.notifications.domain.entities import Notification
 from src.modules.notifications.domain.exceptions import NotificationNotFoundError
@@ -13,6 +13,8 @@ from src.modules.notifications.infrastructure.orm.models import NotificationMode
 
 class NotificationRepositoryImpl(BaseRepositoryImpl[Notification, NotificationModel], NotificationRepository):
     model_type = NotificationModel
+    cursor_columns = ('created_at', 'id')
+    cursor_descending = True
 
     def _map_to_domain(
         self,
@@ -56,6 +58,14 @@ class NotificationRepositoryImpl(BaseRepositoryImpl[Notification, NotificationMo
         result = (await self.db.execute(stmt)).scalars().all()
         return [self._map_to_domain(n) for n in result]
 
+    async def get_page_by_user_id(
+        self,
+        user_id: UUID,
+        pagination: KeysetPagination,
+    ) -> Page[Notification]:
+        stmt = select(NotificationModel).where(NotificationModel.user_id == user_id)
+        return await self._get_keyset_page(stmt, pagination)
+
     async def mark_as_read(self, notification_id: UUID) -> None:
         notification = await self.db.get(NotificationModel, notification_id)
         if not notification:
@@ -70,7 +80,6 @@ class NotificationRepositoryImpl(BaseRepositoryImpl[Notification, NotificationMo
             .values(read_at=datetime.now())
         )
         await self.db.execute(stmt)
-        await self.db.commit()
 
     async def mark_all_as_read(self, user_id: UUID) -> None:
         stmt = (
@@ -82,9 +91,7 @@ class NotificationRepositoryImpl(BaseRepositoryImpl[Notification, NotificationMo
             .values(read_at=datetime.now())
         )
         await self.db.execute(stmt)
-        await self.db.commit()
 
     async def delete_all_for_user(self, user_id: UUID) -> None:
         stmt = delete(NotificationModel).where(NotificationModel.user_id == user_id)
         await self.db.execute(stmt)
-        await self.db.commit()
@@ -1,8 +1,9 @@
+import asyncio
 import http
 import json
 import pathlib
 from datetime import UTC, datetime, timedelta
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
 import aiohttp
@@ -17,48 +18,71 @@ from src.modules.notifications.domain.services import FcmNotificationService
 logger = get_logger(__name__)
 
 
-class FCMNotificationService(FcmNotificationService):
-    FCM_URL = 'https://fcm.googleapis.com/v1/projects/{}/messages:send'
+RETRYABLE_STATUSES = frozenset({http.HTTPStatus.TOO_MANY_REQUESTS, http.HTTPStatus.SERVICE_UNAVAILABLE})
+
+
+class FcmQuota:
+    """Общий на приложение лимит одновременных запросов к FCM."""
+
+    def __init__(self, max_concurrency: int, max_retries: int) -> None:
+        self.max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+
+    async def __aexit__(self, *_: object) -> None:
+        self._semaphore.release()
+
+
+class FcmAuth:
+    """Учётные данные сервисного аккаунта и кэш OAuth-токена, общие для всего приложения."""
+
     TOKEN_URL = 'https://oauth2.googleapis.com/token'  # noqa: S105
     SCOPE = 'https://www.googleapis.com/auth/firebase.messaging'
 
-    def __init__(
-        self,
-        settings: Settings,
-        device_token_repository: DeviceTokenRepository,
-    ) -> None:
-        self.settings = settings
-        self.device_token_repository = device_token_repository
+    def __init__(self, settings: Settings, http_session: aiohttp.ClientSession) -> None:
+        self.http_session = http_session
         self._access_token = None
         self._token_expiry = None
-        with pathlib.Path(self.settings.firebase.credentials_file).open() as f:
+        # при протухшем токене параллельные рассылки ждут одного обновления, а не шлют каждая свой запрос
+        self._refresh_lock = asyncio.Lock()
+        with pathlib.Path(settings.firebase.credentials_file).open() as f:
             self.credentials = json.load(f)
         self.project_id = self.credentials['project_id']
-        self.fcm_url = self.FCM_URL.format(self.project_id)
 
-    async def _get_access_token(self) -> str:
-        if self._access_token and self._token_expiry and datetime.now(UTC) < self._token_expiry:
+    async def get_access_token(self) -> str:
+        if self._is_token_valid():
             return self._access_token
 
-        async with aiohttp.ClientSession() as session:
-            jwt_token = self._create_jwt_token()
-            data = {
-                'grant_type': 'urn:ietf:params:oauth:grant-type:jwt-bearer',
-                'assertion': jwt_token,
-            }
-            async with session.post(self.TOKEN_URL, data=data) as response:
-                if response.status != http.HTTPStatus.OK:
-                    msg = f'Failed to get access token: {await response.text()}'
-                    raise FCMServiceError(
-                        msg,
-                    )
-
-                token_data = await response.json()
-                self._access_token = token_data['access_token']
-                self._token_expiry = datetime.now(UTC) + timedelta(
-                    seconds=token_data['expires_in'] - 60,
-                )
+        async with self._refresh_lock:
+            # пока ждали блокировку, токен мог обновить другой запрос
+            if self._is_token_valid():
                 return self._access_token
+            return await self._refresh_access_token()
+
+    def _is_token_valid(self) -> bool:
+        return bool(self._access_token and self._token_expiry and datetime.now(UTC) < self._token_expiry)
+
+    async def _refresh_access_token(self) -> str:
+        jwt_token = self._create_jwt_token()
+        data = {
+            'grant_type': 'urn:ietf:params:oauth:grant-type:jwt-bearer',
+            'assertion': jwt_token,
+        }
+        async with self.http_session.post(self.TOKEN_URL, data=data) as response:
+            if response.status != http.HTTPStatus.OK:
+                msg = f'Failed to get access token: {await response.text()}'
+                raise FCMServiceError(
+                    msg,
+                )
+
+            token_data = await response.json()
+            self._access_token = token_data['access_token']
+            self._token_expiry = datetime.now(UTC) + timedelta(
+                seconds=token_data['expires_in'] - 60,
+            )
+            return self._access_token
 
     def _create_jwt_token(self) -> str:
         import jwt
@@ -73,6 +97,23 @@ class FCMNotificationService(FcmNotificationService):
         }
         return jwt.encode(payload, self.credentials['private_key'], algorithm='RS256')
 
+
+class FCMNotificationService(FcmNotificationService):
+    FCM_URL = 'https://fcm.googleapis.com/v1/projects/{}/messages:send'
+
+    def __init__(
+        self,
+        device_token_repository: DeviceTokenRepository,
+        auth: FcmAuth,
+        http_session: aiohttp.ClientSession,
+        quota: FcmQuota,
+    ) -> None:
+        self.device_token_repository = device_token_repository
+        self.auth = auth
+        self.http_session = http_session
+        self.quota = quota
+        self.fcm_url = self.FCM_URL.format(auth.project_id)
+
     async def send_notification(
         self,
         user_id: UUID,
@@ -88,61 +129,14 @@ class FCMNotificationService(FcmNotificationService):
                 logger.warning(f'No device tokens found for user {user_id}')
                 return False
 
-            access_token = await self._get_access_token()
-
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json',
-            }
-
-            message_data = {
-                'type': str(notification_type.value),
-                **({k: str(v) for k, v in data.items()} if data else {}),
-            }
-
-            success_count = 0
-            for device_token in device_tokens:
-                message = {
-                    'message': {
-                        'token': device_token.token,
-                        'notification': {'title': title, 'body': body},
-                        'data': message_data,
-                        'android': {'priority': 'high'},
-                        'apns': {'headers': {'apns-priority': '10'}},
-                    },
-                }
-
-                async with (
-                    aiohttp.ClientSession() as session,
-                    session.post(
-                        self.fcm_url,
-                        json=message,
-                        headers=headers,
-                    ) as response,
-                ):
-                    response_text = await response.text()
-
-                    if response.status == http.HTTPStatus.OK:
-                        success_count += 1
-                    else:
-                        error_data = json.loads(response_text)
-                        error_message = error_data.get('error', {}).get(
-                            'message',
-                            '',
-                        )
-
-                        if 'invalid-registration-token' in error_message.lower():
-                            try:
-                                await self.device_token_repository.delete_by_token(
-                                    device_token.token,
-                                )
-                                logger.info(
-                                    f'Removed invalid token {device_token.token}',
-                                )
-                            except Exception:
-                                logger.exception(
-                                    'Failed to remove invalid token',
-                                )
+            message_data = self._message_data(notification_type, data)
+            delivered, invalid_tokens = await self._deliver(
+                [device_token.token for device_token in device_tokens],
+                title,
+                body,
+                message_data,
+            )
+            await self._remove_invalid_tokens(invalid_tokens)
 
         except Exception as e:
             logger.exception('Failed to send notification')
@@ -150,7 +144,7 @@ class FCMNotificationService(FcmNotificationService):
             raise FCMServiceError(msg) from e
 
         else:
-            return success_count > 0
+            return delivered > 0
 
     async def send_notification_to_multiple_users(
         self,
@@ -160,18 +154,128 @@ class FCMNotificationService(FcmNotificationService):
         body: str,
         data: Optional[dict[str, str]] = None,
     ) -> dict[UUID, bool]:
-        results: dict[UUID, bool] = {}
-        for user_id in user_ids:
+        """Рассылает уведомление нескольким пользователям.
+
+        Недействительные токены удаляются в сессии запроса без коммита, поэтому вызывать
+        нужно внутри транзакции, как это делает NotificationsService.send_notification_to_users.
+        """
+        # токены всех получателей одним запросом и до рассылки: сессия БД не допускает параллельных запросов
+        device_tokens = await self.device_token_repository.get_by_user_ids(user_ids)
+        tokens_by_user = {
+            user_id: [device_token.token for device_token in tokens] for user_id, tokens in device_tokens.items()
+        }
+
+        message_data = self._message_data(notification_type, data)
+
+        async def deliver_to_user(user_id: UUID, tokens: list[str]) -> tuple[bool, list[str]]:
+            if not tokens:
+                logger.warning(f'No device tokens found for user {user_id}')
+                return False, []
             try:
-                success = await self.send_notification(
-                    user_id,
-                    notification_type,
-                    title,
-                    body,
-                    data,
-                )
-                results[user_id] = success
+                delivered, invalid_tokens = await self._deliver(tokens, title, body, message_data)
             except Exception:
                 logger.exception(f'Failed to send notification to user {user_id}')
-                results[user_id] = False
+                return False, []
+            return delivered > 0, invalid_tokens
+
+        outcomes = await asyncio.gather(
+            *(deliver_to_user(user_id, tokens) for user_id, tokens in tokens_by_user.items()),
+        )
+
+        results: dict[UUID, bool] = {}
+        invalid_tokens: list[str] = []
+        for user_id, (success, invalid) in zip(tokens_by_user, outcomes, strict=True):
+            results[user_id] = success
+            invalid_tokens.extend(invalid)
+
+        await self._remove_invalid_tokens(invalid_tokens)
+
         return results
+
+    @staticmethod
+    def _message_data(notification_type: NotificationType, data: Optional[dict[str, str]]) -> dict[str, str]:
+        return {
+            'type': str(notification_type.value),
+            **({k: str(v) for k, v in data.items()} if data else {}),
+        }
+
+    async def _deliver(
+        self,
+        tokens: list[str],
+        title: str,
+        body: str,
+        message_data: dict[str, str],
+    ) -> tuple[int, list[str]]:
+        """Отправляет сообщение на все токены параллельно в пределах квоты.
+
+        Возвращает число доставленных и список токенов, которые FCM признал недействительными.
+        """
+        access_token = await self.auth.get_access_token()
+
+        headers = {
+            'Authorization': f'Bearer {access_token}',
+            'Content-Type': 'application/json',
+        }
+
+        outcomes = await asyncio.gather(
+            *(self._post_message(headers, token, title, body, message_data) for token in tokens),
+        )
+
+        delivered = sum(1 for success, _ in outcomes if success)
+        invalid_tokens = [token for token, (_, invalid) in zip(tokens, outcomes, strict=True) if invalid]
+        return delivered, invalid_tokens
+
+    async def _post_message(
+        self,
+        headers: dict[str, str],
+        token: str,
+        title: str,
+        body: str,
+        message_data: dict[str, str],
+    ) -> tuple[bool, bool]:
+        message: dict[str, Any] = {
+            'message': {
+                'token': token,
+                'notification': {'title': title, 'body': body},
+                'data': message_data,
+                'android': {'priority': 'high'},
+                'apns': {'headers': {'apns-priority': '10'}},
+            },
+        }
+
+        for attempt in range(self.quota.max_retries + 1):
+            try:
+                async with self.quota, self.http_session.post(self.fcm_url, json=message, headers=headers) as response:
+                    if response.status == http.HTTPStatus.OK:
+                        return True, False
+
+                    response_text = await response.text()
+                    retry_after = response.headers.get('Retry-After')
+
+            except Exception:
+                logger.exception('Failed to send notification to device')
+                return False, False
+
+            if response.status in RETRYABLE_STATUSES and attempt < self.quota.max_retries:
+                # упёрлись в квоту FCM: ждём, сколько попросили, иначе экспоненциально
+                delay = float(retry_after) if retry_after and retry_after.isdigit() else 2**attempt
+                await asyncio.sleep(delay)
+                continue
+
+            try:
+                error_message = json.loads(response_text).get('error', {}).get('message', '')
+            except ValueError:
+                error_message = response_text
+
+            logger.warning(f'FCM rejected message with status {response.status}: {error_message}')
+            return False, 'invalid-registration-token' in error_message.lower()
+
+        return False, False
+
+    async def _remove_invalid_tokens(self, tokens: list[str]) -> None:
+        for token in tokens:
+            try:
+                await self.device_token_repository.delete_by_token(token)
+                logger.info(f'Removed invalid token {token}')
+            except Exception:
+                logger.exception('Failed to remove invalid token')
@@ -1,10 +1,12 @@
+import aiohttp
 from dishka import Provider, Scope, provide  # type: ignore
 
 from src.core.database import (
     AsyncSessionProtocol,
+    ReadOnlySessionProtocol,
     TransactionManager,
 )
-from src.core.events import EventBus
+from src.core.outbox import TransactionalEventBus
 from src.core.settings import Settings
 from src.modules.notifications.application.services import NotificationsService
 from src.modules.notifications.domain.repositories import DeviceTokenRepository, NotificationRepository
@@ -15,7 +17,11 @@ from src.modules.notifications.infrastructure.repositories.device_token_reposito
 from src.modules.notifications.infrastructure.repositories.notification_repository import (
     NotificationRepositoryImpl,
 )
-from src.modules.notifications.infrastructure.services.fcm_service import FCMNotificationService
+from src.modules.notifications.infrastructure.services.fcm_service import (
+    FCMNotificationService,
+    FcmAuth,
+    FcmQuota,
+)
 
 
 class NotificationsProvider(Provider):
@@ -33,13 +39,23 @@ class NotificationsProvider(Provider):
     ) -> NotificationRepository:
         return NotificationRepositoryImpl(session)
 
+    @provide(scope=Scope.APP)
+    def get_fcm_auth(self, settings: Settings, http_session: aiohttp.ClientSession) -> FcmAuth:
+        return FcmAuth(settings, http_session)
+
+    @provide(scope=Scope.APP)
+    def get_fcm_quota(self, settings: Settings) -> FcmQuota:
+        return FcmQuota(settings.firebase.max_concurrency, settings.firebase.max_retries)
+
     @provide(scope=Scope.REQUEST)
     def get_fcm_notification_service(
         self,
-        settings: Settings,
         device_token_repository: DeviceTokenRepository,
+        auth: FcmAuth,
+        http_session: aiohttp.ClientSession,
+        quota: FcmQuota,
     ) -> FcmNotificationService:
-        return FCMNotificationService(settings, device_token_repository)
+        return FCMNotificationService(device_token_repository, auth, http_session, quota)
 
     @provide(scope=Scope.REQUEST)
     def get_notification_service(
@@ -47,8 +63,9 @@ class NotificationsProvider(Provider):
         device_token_repo: DeviceTokenRepository,
         notification_repo: NotificationRepository,
         fcm_notification_service: FcmNotificationService,
-        event_bus: EventBus,
+        event_bus: TransactionalEventBus,
         transaction_manager: TransactionManager,
+        read_session: ReadOnlySessionProtocol,
     ) -> NotificationsService:
         return NotificationsService(
             device_token_repo,
@@ -56,4 +73,6 @@ class NotificationsProvider(Provider):
             fcm_notification_service,
             event_bus,
             transaction_manager,
+            read_device_token_repo=DeviceTokenRepositoryImpl(read_session),
+            read_notification_repo=NotificationRepositoryImpl(read_session),
         )
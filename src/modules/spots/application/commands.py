@@ -12,9 +12,8 @@ class CreateSpotsCommand:
     spots_data: list[dict]
 
     async def __call__(self) -> list[Spot]:
-        spots = []
-        for spot_data in self.spots_data:
-            spot = Spot(
+        spots = [
+            Spot(
                 id=uuid4(),
                 coworking_id=self.coworking_id,
                 name=spot_data['name'],
@@ -22,6 +21,6 @@ class CreateSpotsCommand:
                 position=spot_data['position'],
                 status='active',
             )
-            spots.append(spot)
-            await self.repo.create(spot)
-        return spots
+            for spot_data in self.spots_data
+        ]
+        return await self.repo.create_many(spots)
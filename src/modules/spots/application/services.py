@@ -25,13 +25,15 @@ class SpotService:
         repo: SpotRepository,
         transaction_manager: TransactionManager,
         booking_repo: Optional[BookingRepository] = None,
+        read_repo: Optional[SpotRepository] = None,
     ) -> None:
         self.repo = repo
         self.transaction_manager = transaction_manager
         self.booking_repo = booking_repo
+        self.read_repo = read_repo or repo
 
     async def get_spots_by_coworking_id(self, coworking_id: UUID) -> list[Spot]:
-        query = GetSpotsByCoworkingIdQuery(repo=self.repo)
+        query = GetSpotsByCoworkingIdQuery(repo=self.read_repo)
         return await query(coworking_id)
 
     async def create_spots(self, coworking_id: UUID, spots_data: list[dict[str, Any]]) -> list[Spot]:
@@ -2,9 +2,10 @@ from dishka import Provider, Scope, provide  # type: ignore
 
 from src.core.database import (
     AsyncSessionProtocol,
+    ReadOnlySessionProtocol,
     TransactionManager,
 )
-from src.modules.bookings.domain.repositories import BookingRepository
+from src.modules.bookings.infrastructure.repositories.booking_repository import BookingRepositoryImpl
 from src.modules.spots.application.services import SpotService
 from src.modules.spots.domain.repositories import SpotRepository
 from src.modules.spots.infrastructure.repositories.spot_repository import SpotRepositoryImpl
@@ -20,6 +21,12 @@ class SpotProvider(Provider):
         self,
         repo: SpotRepository,
         transaction_manager: TransactionManager,
-        booking_repo: BookingRepository,
+        read_session: ReadOnlySessionProtocol,
     ) -> SpotService:
-        return SpotService(repo, transaction_manager, booking_repo)
+        # сервис читает бронирования только для проверки занятости, поэтому им хватает реплики
+        return SpotService(
+            repo,
+            transaction_manager,
+            BookingRepositoryImpl(read_session),
+            read_repo=SpotRepositoryImpl(read_session),
+        )
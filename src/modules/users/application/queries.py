@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import KeysetPagination, Page, Pagination
 from src.modules.users.domain.entities import User
 from src.modules.users.domain.repositories import UserRepository
 
@@ -19,3 +19,11 @@ class ListUsersQuery:
 
     async def __call__(self, pagination: Pagination) -> list[User]:
         return await self.repo.get_all_paginated(pagination)
+
+
+class ListUsersPageQuery:
+    def __init__(self, repo: UserRepository) -> None:
+        self.repo = repo
+
+    async def __call__(self, pagination: KeysetPagination) -> Page[User]:
+        return await self.repo.get_page(pagination)
@@ -1,3 +1,5 @@
+from datetime import UTC, datetime
+from typing import Optional
 from uuid import UUID
 
 import fastapi
@@ -5,15 +7,16 @@ import fastapi
 from src.core.database import TransactionManager
 from src.core.events import EventBus
 from src.modules.auth.domain.services import PasswordHasher
-from src.modules.base.domain.value_objects import Pagination
+from src.modules.base.domain.value_objects import KeysetPagination, Page, Pagination
 from src.modules.storage.application.services import StorageService
 from src.modules.users.application.commands import (
     CreateUserCommand,
     UpdateUserCommand,
     UpdateUserEmailCommand,
 )
-from src.modules.users.application.queries import GetUserByIdQuery, ListUsersQuery
+from src.modules.users.application.queries import GetUserByIdQuery, ListUsersPageQuery, ListUsersQuery
 from src.modules.users.domain.entities import User
+from src.modules.users.domain.events import UserBanned, UserUnbanned
 from src.modules.users.domain.repositories import UserRepository
 
 
@@ -25,8 +28,10 @@ class UserService:
         event_bus: EventBus,
         transaction_manager: TransactionManager,
         storage_service: StorageService,
+        read_repo: Optional[UserRepository] = None,
     ) -> None:
         self.repo = repo
+        self.read_repo = read_repo or repo
         self.password_hasher = password_hasher
         self.event_bus = event_bus
         self.transaction_manager = transaction_manager
@@ -64,25 +69,31 @@ class UserService:
             return await command()
 
     async def get_user(self, user_id: UUID) -> User:
-        query = GetUserByIdQuery(repo=self.repo)
+        query = GetUserByIdQuery(repo=self.read_repo)
         return await query(user_id)
 
     async def get_user_by_email(self, email: str) -> User | None:
         return await self.repo.get_by_email(email)
 
     async def list_users(self, pagination: Pagination) -> list[User]:
-        query = ListUsersQuery(repo=self.repo)
+        query = ListUsersQuery(repo=self.read_repo)
+        return await query(pagination)
+
+    async def list_users_page(self, pagination: KeysetPagination) -> Page[User]:
+        query = ListUsersPageQuery(repo=self.read_repo)
         return await query(pagination)
 
     async def ban_user(self, user_id: UUID) -> None:
-        user = await self.repo.get_by_id(user_id)
-        user.is_banned = True
-        await self.repo.update(user)
+        async with self.transaction_manager:
+            await self.repo.update_fields(user_id, is_banned=True)
+
+            await self.event_bus.publish(UserBanned(user_id=user_id, timestamp=datetime.now(UTC)))
 
     async def unban_user(self, user_id: UUID) -> None:
-        user = await self.repo.get_by_id(user_id)
-        user.is_banned = False
-        await self.repo.update(user)
+        async with self.transaction_manager:
+            await self.repo.update_fields(user_id, is_banned=False)
+
+            await self.event_bus.publish(UserUnbanned(user_id=user_id, timestamp=datetime.now(UTC)))
 
     async def update_user(
         self,
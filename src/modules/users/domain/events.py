@@ -24,3 +24,15 @@ class UserPasswordChanged:
     user_id: UUID
     email: str
     timestamp: datetime
+
+
+@dataclass(frozen=True)
+class UserBanned:
+    user_id: UUID
+    timestamp: datetime
+
+
+@dataclass(frozen=True)
+class UserUnbanned:
+    user_id: UUID
+    timestamp: datetime
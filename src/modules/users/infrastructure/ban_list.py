@@ -0,0 +1,18 @@
+from collections.abc import Iterable
+from uuid import UUID
+
+
+class BanList:
+    """Забаненные пользователи в памяти процесса, чтобы не ходить в базу на каждый запрос."""
+
+    def __init__(self, user_ids: Iterable[UUID] = ()) -> None:
+        self._user_ids = set(user_ids)
+
+    def __contains__(self, user_id: UUID) -> bool:
+        return user_id in self._user_ids
+
+    def add(self, user_id: UUID) -> None:
+        self._user_ids.add(user_id)
+
+    def discard(self, user_id: UUID) -> None:
+        self._user_ids.discard(user_id)
@@ -2,10 +2,13 @@ from typing import Any
 
 from src.core.logging import get_logger, log_extra
 from src.modules.users.domain.events import (
+    UserBanned,
     UserCreated,
     UserEmailChanged,
     UserPasswordChanged,
+    UserUnbanned,
 )
+from src.modules.users.infrastructure.ban_list import BanList
 
 logger = get_logger(__name__)
 
@@ -41,3 +44,14 @@ class UserEventLogger:
                     timestamp=event.timestamp.isoformat(),
                 ),
             )
+
+
+class BanListUpdater:
+    def __init__(self, ban_list: BanList) -> None:
+        self.ban_list = ban_list
+
+    async def handle(self, event: Any) -> None:
+        if isinstance(event, UserBanned):
+            self.ban_list.add(event.user_id)
+        elif isinstance(event, UserUnbanned):
+            self.ban_list.discard(event.user_id)
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from sqlalchemy import select
 
 from src.core.exceptions import NotFoundError
@@ -38,3 +40,7 @@ class UserRepositoryImpl(BaseRepositoryImpl[User, UserModel], UserRepository):
         if result is None:
             raise NotFoundError
         return self._map_to_domain(result)
+
+    async def get_banned_ids(self) -> list[UUID]:
+        stmt = select(self.model_type.id).where(self.model_type.is_banned.is_(True))
+        return list((await self.db.execute(stmt)).scalars().all())
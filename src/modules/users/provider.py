@@ -1,22 +1,46 @@
 from dishka import Provider, Scope, provide  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.core.database import (
     AsyncSessionProtocol,
+    ReadOnlySessionProtocol,
     TransactionManager,
 )
 from src.core.events import EventBus
+from src.core.outbox import TransactionalEventBus
 from src.modules.auth.domain.services import (
     PasswordHasher,
 )
 from src.modules.storage.application.services import StorageService
 from src.modules.users.application.services import UserService
+from src.modules.users.domain.events import UserBanned, UserUnbanned
 from src.modules.users.domain.repositories import UserRepository
+from src.modules.users.infrastructure.ban_list import BanList
+from src.modules.users.infrastructure.event_handlers import BanListUpdater
 from src.modules.users.infrastructure.repositories.user_repository import (
     UserRepositoryImpl,
 )
 
 
 class UserProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def get_ban_list(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        event_bus: EventBus,
+    ) -> BanList:
+        # сначала подписка, потом снимок: бан из другого процесса, пришедший во время загрузки, не потеряется
+        ban_list = BanList()
+        updater = BanListUpdater(ban_list)
+        await event_bus.subscribe(UserBanned, updater.handle, broadcast=True)
+        await event_bus.subscribe(UserUnbanned, updater.handle, broadcast=True)
+
+        async with session_maker() as session:
+            for user_id in await UserRepositoryImpl(session).get_banned_ids():
+                ban_list.add(user_id)
+
+        return ban_list
+
     @provide(scope=Scope.REQUEST)
     def get_user_repository(self, session: AsyncSessionProtocol) -> UserRepository:
         return UserRepositoryImpl(session)
@@ -26,8 +50,16 @@ class UserProvider(Provider):
         self,
         repo: UserRepository,
         password_hasher: PasswordHasher,
-        event_bus: EventBus,
+        event_bus: TransactionalEventBus,
         transaction_manager: TransactionManager,
         storage_service: StorageService,
+        read_session: ReadOnlySessionProtocol,
     ) -> UserService:
-        return UserService(repo, password_hasher, event_bus, transaction_manager, storage_service)
+        return UserService(
+            repo,
+            password_hasher,
+            event_bus,
+            transaction_manager,
+            storage_service,
+            read_repo=UserRepositoryImpl(read_session),
+        )
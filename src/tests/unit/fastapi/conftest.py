@@ -1,7 +1,14 @@
+import os
+
 import fastapi.testclient
 import pytest
 
-from src.entrypoints.rest.main import create_app
+# TestClient поднимает отдельный event loop на каждый запрос, пул соединений между ними не переживёт
+os.environ.setdefault('POSTGRES__USE_POOL', 'false')
+# по той же причине события в памяти обрабатываются прямо в запросе, фоновые диспетчеры умерли бы вместе с loop
+os.environ.setdefault('DISPATCHER__WORKERS', '0')
+
+from src.entrypoints.rest.main import create_app  # noqa: E402
 
 
 @pytest.fixture(scope='session')
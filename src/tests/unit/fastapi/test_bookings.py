@@ -0,0 +1,121 @@
+import datetime
+import typing
+
+import fastapi.testclient
+import httpx  # noqa
+import pytest
+import sqlalchemy
+from sqlalchemy.engine import Engine
+
+from src.entrypoints.mock.main import faker
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        self.count += 1
+
+    def __enter__(self) -> 'StatementCounter':
+        sqlalchemy.event.listen(Engine, 'before_cursor_execute', self)
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        sqlalchemy.event.remove(Engine, 'before_cursor_execute', self)
+
+
+@pytest.mark.asyncio
+class TestBookings:
+    @pytest.fixture(autouse=True)
+    def setup(self, client: fastapi.testclient.TestClient) -> None:
+        self.client = client
+
+    def _login(self) -> dict[str, str]:
+        email = faker.email()
+        body = {
+            'email': email,
+            'full_name': 'string',
+            'password': 'string',
+        }
+        response: httpx.Response = self.client.post('/users', json=body)
+        assert response.status_code == fastapi.status.HTTP_201_CREATED
+
+        response: httpx.Response = self.client.post('/auth/login', json={'email': email, 'password': 'string'})
+        assert response.status_code == fastapi.status.HTTP_200_OK
+
+        return {'Authorization': f'Bearer {response.json()["access_token"]}'}
+
+    def _create_spots(self, amount: int) -> list[str]:
+        body = {
+            'name': 'string',
+            'description': 'string',
+            'address': 'string',
+            'opens_at': datetime.time(hour=0, tzinfo=datetime.UTC).isoformat(),
+            'closes_at': datetime.time(hour=23, tzinfo=datetime.UTC).isoformat(),
+        }
+        response: httpx.Response = self.client.post('/coworkings/', json=body)
+        assert response.status_code == fastapi.status.HTTP_200_OK
+
+        coworking_id = response.json()['id']
+
+        body = [{'name': f'№{i}', 'description': 'string', 'position': i} for i in range(amount)]
+        response: httpx.Response = self.client.post(f'/coworkings/{coworking_id}/spots', json=body)
+        assert response.status_code == fastapi.status.HTTP_200_OK
+
+        return [spot['id'] for spot in response.json()]
+
+    def _book(self, headers: dict[str, str], spot_id: str) -> None:
+        time_from = datetime.datetime.now(datetime.UTC) + datetime.timedelta(days=1)
+        body = {
+            'spot_id': spot_id,
+            'time_from': time_from.isoformat(),
+            'time_until': (time_from + datetime.timedelta(hours=1)).isoformat(),
+        }
+        response: httpx.Response = self.client.post('/bookings', json=body, headers=headers)
+        assert response.status_code == fastapi.status.HTTP_201_CREATED
+
+    async def test_user_bookings_constant_queries(self) -> None:
+        headers = self._login()
+        spot_ids = self._create_spots(5)
+
+        self._book(headers, spot_ids[0])
+
+        with StatementCounter() as single:
+            response: httpx.Response = self.client.get('/users/me/bookings', headers=headers)
+
+        assert response.status_code == fastapi.status.HTTP_200_OK
+        assert len(response.json()) == 1
+
+        for spot_id in spot_ids[1:]:
+            self._book(headers, spot_id)
+
+        with StatementCounter() as many:
+            response: httpx.Response = self.client.get('/users/me/bookings', headers=headers)
+
+        assert response.status_code == fastapi.status.HTTP_200_OK
+        assert len(response.json()) == len(spot_ids)
+        assert all(booking['coworking']['spot']['id'] in spot_ids for booking in response.json())
+
+        assert many.count == single.count
+
+    async def test_overlapping_booking_conflicts(self) -> None:
+        headers = self._login()
+        (spot_id,) = self._create_spots(1)
+
+        self._book(headers, spot_id)
+
+        time_from = datetime.datetime.now(datetime.UTC) + datetime.timedelta(days=1, minutes=30)
+        body = {
+            'spot_id': spot_id,
+            'time_from': time_from.isoformat(),
+            'time_until': (time_from + datetime.timedelta(hours=1)).isoformat(),
+        }
+        response: httpx.Response = self.client.post('/bookings', json=body, headers=headers)
+
+        assert response.status_code == fastapi.status.HTTP_409_CONFLICT
+
+        response: httpx.Response = self.client.get('/users/me/bookings', headers=headers)
+
+        assert response.status_code == fastapi.status.HTTP_200_OK
+        assert len(response.json()) == 1
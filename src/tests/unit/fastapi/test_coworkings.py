@@ -43,3 +43,34 @@ class TestCoworkings:
         assert response.json().get('address') is not None
         assert response.json().get('opens_at') is not None
         assert response.json().get('closes_at') is not None
+
+    async def test_list_coworkings_by_cursor(self) -> None:
+        body = {
+            'name': 'string',
+            'description': 'string',
+            'address': 'string',
+            'opens_at': datetime.time(hour=8, tzinfo=datetime.UTC).isoformat(),
+            'closes_at': datetime.time(hour=22, tzinfo=datetime.UTC).isoformat(),
+        }
+        for _ in range(3):
+            response: httpx.Response = self.client.post('/coworkings/', json=body)
+            assert response.status_code == fastapi.status.HTTP_200_OK
+
+        seen: list[uuid.UUID] = []
+        cursor = ''
+
+        while cursor is not None:
+            response: httpx.Response = self.client.get('/coworkings/', params={'count': 2, 'cursor': cursor})
+
+            assert response.status_code == fastapi.status.HTTP_200_OK
+            assert len(response.json()) <= 2
+
+            seen.extend(uuid.UUID(coworking['id']) for coworking in response.json())
+            cursor = response.headers.get('X-Next-Cursor')
+
+        assert len(seen) >= 3
+        assert seen == sorted(set(seen))
+
+        response: httpx.Response = self.client.get('/coworkings/', params={'cursor': 'not-a-cursor'})
+
+        assert response.status_code == fastapi.status.HTTP_422_UNPROCESSABLE_ENTITY
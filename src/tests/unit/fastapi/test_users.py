@@ -62,3 +62,41 @@ class TestUsers:
         assert response.json().get('full_name') is not None
         assert response.json().get('is_business') is not None
         assert response.json().get('is_banned') is False
+
+    def _login(self, is_business: bool = False) -> tuple[str, dict[str, str]]:
+        email = faker.email()
+        body = {
+            'email': email,
+            'full_name': 'string',
+            'password': 'string',
+            'is_business': is_business,
+        }
+        response: httpx.Response = self.client.post('/users', json=body)
+        assert response.status_code == fastapi.status.HTTP_201_CREATED
+
+        response: httpx.Response = self.client.post('/auth/login', json={'email': email, 'password': 'string'})
+        assert response.status_code == fastapi.status.HTTP_200_OK
+
+        headers = {'Authorization': f'Bearer {response.json()["access_token"]}'}
+
+        response: httpx.Response = self.client.get('/users/me', headers=headers)
+        assert response.status_code == fastapi.status.HTTP_200_OK
+
+        return response.json()['id'], headers
+
+    async def test_ban_and_unban_user(self) -> None:
+        _, admin_headers = self._login(is_business=True)
+        user_id, headers = self._login()
+
+        response: httpx.Response = self.client.post(f'/users/{user_id}/ban', headers=admin_headers)
+        assert response.status_code == fastapi.status.HTTP_204_NO_CONTENT
+
+        response: httpx.Response = self.client.get('/users/me', headers=headers)
+        assert response.status_code == fastapi.status.HTTP_403_FORBIDDEN
+
+        response: httpx.Response = self.client.post(f'/users/{user_id}/unban', headers=admin_headers)
+        assert response.status_code == fastapi.status.HTTP_204_NO_CONTENT
+
+        response: httpx.Response = self.client.get('/users/me', headers=headers)
+        assert response.status_code == fastapi.status.HTTP_200_OK
+        assert response.json().get('is_banned') is False
@@ -0,0 +1,245 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import pytest
+
+from src.core.event_codec import EVENT_CONTENT_TYPE, encode_event
+from src.core.events import (
+    ATTEMPT_HEADER,
+    ERROR_HEADER,
+    HANDLED_HEADER,
+    EventSubscription,
+    InMemoryEventBus,
+    RabbitMQEventBus,
+)
+from src.core.settings import DispatchOverflow
+
+
+@dataclass(frozen=True)
+class Pinged:
+    value: int
+
+
+class FakeExchange:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.published: list[tuple[Any, str]] = []
+
+    async def publish(self, message: Any, routing_key: str) -> None:
+        if self.fail:
+            msg = 'message was nacked'
+            raise RuntimeError(msg)
+        self.published.append((message, routing_key))
+
+
+class FakeChannel:
+    def __init__(self, fail: bool = False) -> None:
+        self.default_exchange = FakeExchange(fail)
+        self.exchanges: dict[str, FakeExchange] = {}
+        self.fail = fail
+
+    async def get_exchange(self, name: str, *, ensure: bool = True) -> FakeExchange:
+        return self.exchanges.setdefault(name, FakeExchange(self.fail))
+
+
+class FakeMessage:
+    def __init__(self, event: Any, headers: Optional[dict[str, Any]] = None) -> None:
+        self.body = encode_event(event)
+        self.headers = headers or {}
+        self.content_type = EVENT_CONTENT_TYPE
+        self.acked = False
+        self.requeued = False
+
+    @asynccontextmanager
+    async def process(self, requeue: bool = False) -> AsyncIterator[None]:
+        try:
+            yield
+        except Exception:
+            self.requeued = requeue
+            raise
+        self.acked = True
+
+
+class Handler:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.calls = 0
+
+    async def handle(self, event: Pinged) -> None:
+        self.calls += 1
+        if self.fail:
+            msg = 'handler failed'
+            raise RuntimeError(msg)
+
+
+class FailingHandler(Handler):
+    pass
+
+
+@pytest.mark.asyncio
+class TestRabbitMQRetries:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.bus = RabbitMQEventBus(SimpleNamespace())  # type: ignore
+        self.channel = FakeChannel()
+        self.bus._channel = self.channel  # type: ignore  # noqa: SLF001
+
+        self.ok = Handler()
+        self.failing = FailingHandler(fail=True)
+        self.bus._subscriptions['Pinged'] = [  # noqa: SLF001
+            EventSubscription(Pinged, self.ok.handle),
+            EventSubscription(Pinged, self.failing.handle),
+        ]
+
+    async def _process(self, message: FakeMessage, retry_queues: tuple[str, ...] = ('retry.1', 'retry.2')) -> None:
+        process_message = await self.bus._create_message_processor(  # noqa: SLF001
+            Pinged,
+            'Pinged',
+            1,
+            'Pinged_dlx',
+            retry_queues,
+        )
+        await process_message(message)
+
+    async def test_retry_skips_handlers_that_succeeded(self) -> None:
+        message = FakeMessage(Pinged(1))
+        await self._process(message)
+
+        [(retry, routing_key)] = self.channel.default_exchange.published
+        assert routing_key == 'retry.1'
+        assert retry.headers[ATTEMPT_HEADER] == 2
+        assert retry.headers[HANDLED_HEADER] == [f'{__name__}.Handler.handle']
+        assert message.acked
+
+        await self._process(FakeMessage(Pinged(1), retry.headers))
+
+        assert self.ok.calls == 1
+        assert self.failing.calls == 2
+
+    async def test_last_attempt_is_dead_lettered_with_progress(self) -> None:
+        message = FakeMessage(Pinged(1), {ATTEMPT_HEADER: 3})
+        await self._process(message)
+
+        assert not self.channel.default_exchange.published
+        [(dead, routing_key)] = self.channel.exchanges['Pinged_dlx'].published
+        assert routing_key == ''
+        assert dead.headers[ERROR_HEADER] == 'RuntimeError: handler failed'
+        assert dead.headers[HANDLED_HEADER] == [f'{__name__}.Handler.handle']
+        assert message.acked
+
+    async def test_message_is_requeued_when_copy_is_not_confirmed(self) -> None:
+        self.bus._channel = FakeChannel(fail=True)  # type: ignore  # noqa: SLF001
+        message = FakeMessage(Pinged(1))
+
+        with pytest.raises(RuntimeError):
+            await self._process(message)
+
+        assert not message.acked
+        assert message.requeued
+
+    async def test_successful_message_is_not_copied(self) -> None:
+        self.failing.fail = False
+        message = FakeMessage(Pinged(1))
+        await self._process(message)
+
+        assert not self.channel.default_exchange.published
+        assert message.acked
+
+
+class BlockingHandler:
+    def __init__(self) -> None:
+        self.handled: list[int] = []
+        self.release = asyncio.Event()
+
+    async def handle(self, event: Pinged) -> None:
+        await self.release.wait()
+        self.handled.append(event.value)
+
+
+@pytest.mark.asyncio
+class TestInMemoryDispatcher:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.handler = BlockingHandler()
+
+    async def _bus(self, overflow: DispatchOverflow, drain_timeout: float = 1) -> InMemoryEventBus:
+        # один диспетчер и место в очереди под одно событие: первое забирает диспетчер, второе ждёт в очереди
+        bus = InMemoryEventBus(workers=1, max_queue=1, overflow=overflow, drain_timeout=drain_timeout)
+        await bus.subscribe(Pinged, self.handler.handle)
+        await bus.publish(Pinged(1))
+        await asyncio.sleep(0)
+        await bus.publish(Pinged(2))
+        return bus
+
+    async def test_block_waits_for_free_slot(self) -> None:
+        bus = await self._bus(DispatchOverflow.BLOCK)
+
+        publish = asyncio.create_task(bus.publish(Pinged(3)))
+        await asyncio.sleep(0.01)
+        assert not publish.done()
+
+        self.handler.release.set()
+        await asyncio.wait_for(publish, 1)
+        await bus.disconnect()
+
+        assert self.handler.handled == [1, 2, 3]
+
+    async def test_drop_new_discards_incoming_event(self) -> None:
+        bus = await self._bus(DispatchOverflow.DROP_NEW)
+
+        await asyncio.wait_for(bus.publish(Pinged(3)), 1)
+        self.handler.release.set()
+        await bus.disconnect()
+
+        assert self.handler.handled == [1, 2]
+
+    async def test_drop_oldest_discards_queued_event(self) -> None:
+        bus = await self._bus(DispatchOverflow.DROP_OLDEST)
+
+        await asyncio.wait_for(bus.publish(Pinged(3)), 1)
+        self.handler.release.set()
+        await bus.disconnect()
+
+        assert self.handler.handled == [1, 3]
+
+    async def test_disconnect_drains_queue(self) -> None:
+        bus = await self._bus(DispatchOverflow.BLOCK)
+
+        disconnect = asyncio.create_task(bus.disconnect())
+        await asyncio.sleep(0.01)
+        assert not disconnect.done()
+
+        self.handler.release.set()
+        await asyncio.wait_for(disconnect, 1)
+
+        assert self.handler.handled == [1, 2]
+
+    async def test_disconnect_gives_up_after_drain_timeout(self) -> None:
+        bus = await self._bus(DispatchOverflow.BLOCK, drain_timeout=0.01)
+        workers = list(bus._workers)  # noqa: SLF001
+
+        await asyncio.wait_for(bus.disconnect(), 1)
+
+        assert self.handler.handled == []
+        assert all(worker.cancelled() for worker in workers)
+        assert bus._queue is None  # noqa: SLF001
+
+    async def test_pending_events_move_to_dispatchers_of_new_loop(self) -> None:
+        self.handler.release.set()
+        bus = InMemoryEventBus(workers=1)
+        await bus.subscribe(Pinged, self.handler.handle)
+
+        # очередь, оставшаяся от закрытого loop: её диспетчеров уже нет
+        stale: asyncio.Queue[tuple[EventSubscription, Any]] = asyncio.Queue()
+        stale.put_nowait((EventSubscription(Pinged, self.handler.handle), Pinged(1)))
+        bus._queue = stale  # noqa: SLF001
+        bus._loop = object()  # type: ignore  # noqa: SLF001
+
+        await bus.publish(Pinged(2))
+        await bus.disconnect()
+
+        assert self.handler.handled == [1, 2]
@@ -0,0 +1,54 @@
+import asyncio
+import json
+import pathlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.modules.notifications.infrastructure.services.fcm_service import FcmAuth
+
+
+class FakeTokenResponse:
+    status = 200
+
+    async def json(self) -> dict[str, Any]:
+        return {'access_token': 'access-token', 'expires_in': 3600}
+
+
+class FakeHttpSession:
+    def __init__(self) -> None:
+        self.requests = 0
+
+    @asynccontextmanager
+    async def post(self, url: str, data: dict[str, str]) -> AsyncIterator[FakeTokenResponse]:
+        self.requests += 1
+        await asyncio.sleep(0.01)
+        yield FakeTokenResponse()
+
+
+@pytest.mark.asyncio
+class TestFcmAuth:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path: pathlib.Path) -> None:
+        credentials = tmp_path / 'firebase.json'
+        credentials.write_text(json.dumps({'project_id': 'project', 'client_email': 'fcm@example.com'}))
+
+        self.http_session = FakeHttpSession()
+        settings = SimpleNamespace(firebase=SimpleNamespace(credentials_file=str(credentials)))
+        self.auth = FcmAuth(settings, self.http_session)  # type: ignore
+        self.auth._create_jwt_token = lambda: 'assertion'  # type: ignore  # noqa: SLF001
+
+    async def test_concurrent_callers_share_one_refresh(self) -> None:
+        tokens = await asyncio.gather(*[self.auth.get_access_token() for _ in range(100)])
+
+        assert set(tokens) == {'access-token'}
+        assert self.http_session.requests == 1
+
+    async def test_valid_token_is_reused(self) -> None:
+        await self.auth.get_access_token()
+        await self.auth.get_access_token()
+
+        assert self.http_session.requests == 1
@@ -0,0 +1,98 @@
+import hashlib
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.modules.auth.domain.exceptions import TokenValidationError
+from src.modules.auth.infrastructure.services import jwt_service
+from src.modules.auth.infrastructure.services.jwt_service import JWTTokenService
+
+
+@pytest.mark.asyncio
+class TestJWTTokenCache:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        settings = SimpleNamespace(jwt=SimpleNamespace(secret='secret', algorithm='HS256', expire=60, cache_size=2))
+        self.service = JWTTokenService(settings)  # type: ignore
+
+        self.decoded: list[str] = []
+        decode = self.service._decode  # noqa: SLF001
+
+        def counting_decode(token: str) -> dict[str, Any]:
+            self.decoded.append(token)
+            return decode(token)
+
+        self.service._decode = counting_decode  # type: ignore  # noqa: SLF001
+
+    async def _token(self, sub: str, expires_delta: timedelta = timedelta(minutes=5)) -> str:
+        token = await self.service.create_token({'sub': sub}, expires_delta)
+        return token.access_token
+
+    def _cached(self, token: str) -> bool:
+        return hashlib.sha256(token.encode()).digest() in self.service._cache  # noqa: SLF001
+
+    async def test_repeated_token_is_served_from_cache(self) -> None:
+        token = await self._token('user')
+
+        first = await self.service.verify_token(token)
+        second = await self.service.verify_token(token)
+
+        assert first == second
+        assert first['sub'] == 'user'
+        assert self.decoded == [token]
+
+    async def test_cached_claims_are_copied(self) -> None:
+        token = await self._token('user')
+
+        claims = await self.service.verify_token(token)
+        claims['sub'] = 'changed'
+
+        assert (await self.service.verify_token(token))['sub'] == 'user'
+
+    async def test_least_recently_used_token_is_evicted(self) -> None:
+        first, second, third = [await self._token(sub) for sub in ('first', 'second', 'third')]
+
+        await self.service.verify_token(first)
+        await self.service.verify_token(second)
+        # first становится самым свежим, вытеснен должен быть second
+        await self.service.verify_token(first)
+        await self.service.verify_token(third)
+
+        assert len(self.service._cache) == 2  # noqa: SLF001
+        assert self._cached(first)
+        assert not self._cached(second)
+        assert self._cached(third)
+
+        await self.service.verify_token(second)
+        assert self.decoded == [first, second, third, second]
+
+    async def test_expired_entry_is_not_served(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        token = await self._token('user')
+        claims = await self.service.verify_token(token)
+
+        # токен для jose ещё действителен, но запись в кэше уже протухла
+        monkeypatch.setattr(jwt_service, 'time', SimpleNamespace(time=lambda: claims['exp'] + 1))
+
+        await self.service.verify_token(token)
+
+        assert self.decoded == [token, token]
+
+    async def test_expired_token_is_rejected_and_not_cached(self) -> None:
+        token = await self._token('user', timedelta(minutes=-1))
+
+        with pytest.raises(TokenValidationError):
+            await self.service.verify_token(token)
+
+        assert not self._cached(token)
+
+    async def test_token_is_not_cached_when_cache_is_disabled(self) -> None:
+        self.service.settings.jwt.cache_size = 0
+        token = await self._token('user')
+
+        await self.service.verify_token(token)
+        await self.service.verify_token(token)
+
+        assert self.decoded == [token, token]
+        assert not self.service._cache  # noqa: SLF001
@@ -0,0 +1,265 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.entrypoints.runner.reminders import BookingReminderScheduler, Reminder, ReminderKind
+from src.modules.bookings.domain.entities import Booking
+from src.modules.bookings.domain.events import BookingCancelled, BookingCreated, BookingRescheduled
+from src.modules.bookings.domain.repositories import BookingRepository
+from src.modules.notifications.application.services import NotificationsService
+
+
+class FakeBookingRepository:
+    def __init__(self, bookings: list[Booking]) -> None:
+        self.bookings = bookings
+
+    async def get_active_starting_between(self, start: datetime, end: datetime) -> list[Booking]:
+        return [b for b in self.bookings if b.status == 'active' and start <= b.time_from < end]
+
+    async def get_active_ending_between(self, start: datetime, end: datetime) -> list[Booking]:
+        return [b for b in self.bookings if b.status == 'active' and start <= b.time_until < end]
+
+    async def get_by_ids(self, ids: list[UUID]) -> list[Booking]:
+        return [b for b in self.bookings if b.id in ids]
+
+
+class FakeNotificationsService:
+    def __init__(self) -> None:
+        self.sent: list[tuple[UUID, str]] = []
+        self.failing: set[UUID] = set()
+        self.active = 0
+        self.max_active = 0
+
+    async def send_notification(
+        self,
+        user_id: UUID,
+        notification_type: Any,
+        title: str,
+        body: str,
+        data: Optional[dict[str, str]] = None,
+    ) -> bool:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0)
+            if user_id in self.failing:
+                msg = 'FCM is unavailable'
+                raise RuntimeError(msg)
+            self.sent.append((user_id, data['kind']))
+            return True
+        finally:
+            self.active -= 1
+
+
+class FakeContainer:
+    def __init__(self, repo: FakeBookingRepository, service: FakeNotificationsService) -> None:
+        self.dependencies = {BookingRepository: repo, NotificationsService: service}
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator['FakeContainer']:
+        yield self
+
+    async def get(self, dependency: type[Any]) -> Any:
+        return self.dependencies[dependency]
+
+
+def make_booking(time_from: datetime, duration: timedelta = timedelta(hours=1), status: str = 'active') -> Booking:
+    return Booking(
+        id=uuid4(),
+        user_id=uuid4(),
+        spot_id=uuid4(),
+        time_from=time_from,
+        time_until=time_from + duration,
+        status=status,
+    )
+
+
+@pytest.mark.asyncio
+class TestBookingReminderScheduler:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.now = datetime.now(UTC).replace(microsecond=0)
+        self.repo = FakeBookingRepository([])
+        self.service = FakeNotificationsService()
+
+        settings = SimpleNamespace(
+            reminders=SimpleNamespace(
+                before_start=15,
+                before_end=10,
+                horizon=3600,
+                batch_size=100,
+                concurrency=2,
+                max_attempts=2,
+                retry_delay=30,
+            ),
+        )
+        self.scheduler = BookingReminderScheduler(FakeContainer(self.repo, self.service), settings)  # type: ignore
+
+    def _reminder(self, booking: Booking, kind: ReminderKind = ReminderKind.STARTS) -> Reminder:
+        return self.scheduler._reminder(  # noqa: SLF001
+            kind,
+            booking.id,
+            booking.user_id,
+            booking.time_from,
+            booking.time_until,
+        )
+
+    def _event(self, event_type: type[Any], booking: Booking) -> Any:
+        return event_type(
+            booking_id=booking.id,
+            user_id=booking.user_id,
+            spot_id=booking.spot_id,
+            time_from=booking.time_from,
+            time_until=booking.time_until,
+            timestamp=self.now,
+        )
+
+    def _pending(self) -> list[tuple[UUID, ReminderKind]]:
+        return [(r.booking_id, r.kind) for r in sorted(self.scheduler._heap)]  # noqa: SLF001
+
+    async def test_reminders_are_popped_in_fire_order(self) -> None:
+        bookings = [make_booking(self.now + timedelta(minutes=minutes)) for minutes in (50, 20, 35)]
+        for booking in bookings:
+            self.scheduler._push(self._reminder(booking))  # noqa: SLF001
+
+        due = self.scheduler._pop_due(self.now + timedelta(hours=1))  # noqa: SLF001
+
+        assert [r.booking_id for r in due] == [bookings[1].id, bookings[2].id, bookings[0].id]
+
+    async def test_batch_size_limits_popped_reminders(self) -> None:
+        self.scheduler.batch_size = 2
+        for minutes in (20, 25, 30):
+            self.scheduler._push(self._reminder(make_booking(self.now + timedelta(minutes=minutes))))  # noqa: SLF001
+
+        assert len(self.scheduler._pop_due(self.now + timedelta(hours=1))) == 2  # noqa: SLF001
+        assert len(self.scheduler._pop_due(self.now + timedelta(hours=1))) == 1  # noqa: SLF001
+
+    async def test_cancelled_booking_is_skipped(self) -> None:
+        booking = make_booking(self.now + timedelta(minutes=30))
+        self.scheduler._accept_until = self.now + timedelta(hours=1)  # noqa: SLF001
+
+        await self.scheduler.handle(self._event(BookingCreated, booking))
+        assert len(self.scheduler._heap) == 1  # noqa: SLF001
+
+        await self.scheduler.handle(self._event(BookingCancelled, booking))
+
+        assert self.scheduler._pop_due(self.now + timedelta(hours=1)) == []  # noqa: SLF001
+
+    async def test_rescheduled_booking_is_reminded_at_new_time(self) -> None:
+        booking = make_booking(self.now + timedelta(minutes=30), timedelta(minutes=20))
+        self.repo.bookings = [booking]
+        await self.scheduler._load_window(self.now)  # noqa: SLF001
+
+        # перенос внутрь уже загруженного окна: старые напоминания остаются в куче, новые приходят событием
+        booking.time_from += timedelta(minutes=15)
+        booking.time_until += timedelta(minutes=15)
+        await self.scheduler.handle(self._event(BookingRescheduled, booking))
+
+        await self.scheduler._fire(self.scheduler._pop_due(self.now + timedelta(hours=2)))  # noqa: SLF001
+
+        assert self.service.sent == [
+            (booking.user_id, ReminderKind.STARTS.value),
+            (booking.user_id, ReminderKind.ENDS.value),
+        ]
+
+    async def test_rescheduled_booking_is_reminded_after_window_reload(self) -> None:
+        booking = make_booking(self.now + timedelta(minutes=30))
+        self.repo.bookings = [booking]
+        await self.scheduler._load_window(self.now)  # noqa: SLF001
+
+        # перенос за пределы окна: бронь найдёт следующая подгрузка, устаревший ключ ей не мешает
+        booking.time_from += timedelta(minutes=60)
+        booking.time_until += timedelta(minutes=60)
+        await self.scheduler.handle(self._event(BookingRescheduled, booking))
+        await self.scheduler._load_window(self.now + timedelta(minutes=40))  # noqa: SLF001
+
+        await self.scheduler._fire(self.scheduler._pop_due(self.now + timedelta(hours=3)))  # noqa: SLF001
+
+        assert self.service.sent == [(booking.user_id, ReminderKind.STARTS.value)]
+
+    async def test_window_loads_only_reminders_within_horizon(self) -> None:
+        inside = make_booking(self.now + timedelta(minutes=30), timedelta(minutes=20))
+        outside = make_booking(self.now + timedelta(hours=3))
+        self.repo.bookings = [inside, outside]
+
+        await self.scheduler._load_window(self.now)  # noqa: SLF001
+
+        assert self._pending() == [(inside.id, ReminderKind.STARTS), (inside.id, ReminderKind.ENDS)]
+        assert self.scheduler._loaded_until == self.now + timedelta(hours=1)  # noqa: SLF001
+
+    async def test_window_reload_continues_where_previous_ended(self) -> None:
+        booking = make_booking(self.now + timedelta(minutes=30), timedelta(minutes=20))
+        later = make_booking(self.now + timedelta(minutes=100), timedelta(minutes=20))
+        self.repo.bookings = [booking, later]
+
+        await self.scheduler._load_window(self.now)  # noqa: SLF001
+        await self.scheduler._load_window(self.now + timedelta(minutes=40))  # noqa: SLF001
+
+        assert self._pending() == [
+            (booking.id, ReminderKind.STARTS),
+            (booking.id, ReminderKind.ENDS),
+            (later.id, ReminderKind.STARTS),
+        ]
+
+    async def test_late_window_sends_pending_reminders_immediately(self) -> None:
+        # окно должно было подгрузиться 10 минут назад
+        self.scheduler._loaded_until = self.now - timedelta(minutes=10)  # noqa: SLF001
+        upcoming = make_booking(self.now + timedelta(minutes=10))
+        started = make_booking(self.now - timedelta(minutes=2))
+        self.repo.bookings = [upcoming, started]
+
+        await self.scheduler._load_window(self.now)  # noqa: SLF001
+        due = self.scheduler._pop_due(self.now)  # noqa: SLF001
+
+        assert [(r.booking_id, r.kind) for r in due] == [(upcoming.id, ReminderKind.STARTS)]
+
+    async def test_is_actual(self) -> None:
+        booking = make_booking(self.now + timedelta(minutes=30))
+        reminder = self._reminder(booking)
+        moved = make_booking(booking.time_from + timedelta(hours=1))
+        moved.id = booking.id
+
+        assert self.scheduler._is_actual(reminder, booking)  # noqa: SLF001
+        assert not self.scheduler._is_actual(reminder, None)  # noqa: SLF001
+        assert not self.scheduler._is_actual(reminder, moved)  # noqa: SLF001
+        booking.status = 'cancelled'
+        assert not self.scheduler._is_actual(reminder, booking)  # noqa: SLF001
+
+    async def test_fire_sends_only_actual_reminders(self) -> None:
+        active = make_booking(self.now + timedelta(minutes=10))
+        cancelled = make_booking(self.now + timedelta(minutes=10), status='cancelled')
+        self.repo.bookings = [active, cancelled]
+
+        await self.scheduler._fire([self._reminder(active), self._reminder(cancelled)])  # noqa: SLF001
+
+        assert self.service.sent == [(active.user_id, ReminderKind.STARTS.value)]
+
+    async def test_fire_limits_concurrent_sends(self) -> None:
+        self.repo.bookings = [make_booking(self.now + timedelta(minutes=10)) for _ in range(10)]
+
+        await self.scheduler._fire([self._reminder(booking) for booking in self.repo.bookings])  # noqa: SLF001
+
+        assert len(self.service.sent) == 10
+        assert self.service.max_active == 2
+
+    async def test_failed_reminder_is_retried_until_attempts_run_out(self) -> None:
+        booking = make_booking(self.now + timedelta(minutes=15))
+        self.repo.bookings = [booking]
+        self.service.failing.add(booking.user_id)
+
+        await self.scheduler._fire([self._reminder(booking)])  # noqa: SLF001
+
+        [retry] = self.scheduler._heap  # noqa: SLF001
+        assert retry.attempt == 2
+        assert retry.fire_at > datetime.now(UTC)
+
+        await self.scheduler._fire(self.scheduler._pop_due(retry.fire_at))  # noqa: SLF001
+
+        assert self.scheduler._heap == []  # noqa: SLF001
+        assert self.service.sent == []
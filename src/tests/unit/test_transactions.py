@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from src.core.database import TransactionManager
+from src.core.outbox import AfterCommitEventBus, OutboxEventBus
+
+
+@dataclass(frozen=True)
+class Pinged:
+    value: int
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.log: list[str] = []
+
+    async def commit(self) -> None:
+        self.log.append('commit')
+
+    async def rollback(self) -> None:
+        self.log.append('rollback')
+
+    def add(self, instance: Any) -> None:
+        self.log.append(f'add {instance.event_type}')
+
+
+class RecordingEventBus:
+    def __init__(self, session: FakeSession, fail: bool = False) -> None:
+        self.session = session
+        self.fail = fail
+
+    async def publish(self, event: Any) -> None:
+        if self.fail:
+            msg = 'broker is down'
+            raise ConnectionError(msg)
+        self.session.log.append(f'publish {event.value}')
+
+
+@pytest.mark.asyncio
+class TestAfterCommitEventBus:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.session = FakeSession()
+        self.transaction_manager = TransactionManager(self.session)  # type: ignore
+
+    def _bus(self, fail: bool = False) -> AfterCommitEventBus:
+        return AfterCommitEventBus(self.transaction_manager, RecordingEventBus(self.session, fail))  # type: ignore
+
+    async def test_event_is_published_after_commit(self) -> None:
+        bus = self._bus()
+
+        async with self.transaction_manager:
+            await bus.publish(Pinged(1))
+            assert self.session.log == []
+
+        assert self.session.log == ['commit', 'publish 1']
+
+    async def test_event_is_dropped_on_rollback(self) -> None:
+        bus = self._bus()
+
+        with pytest.raises(ValueError, match='invalid'):
+            async with self.transaction_manager:
+                await bus.publish(Pinged(1))
+                msg = 'invalid'
+                raise ValueError(msg)
+
+        assert self.session.log == ['rollback']
+
+    async def test_failed_publish_does_not_fail_committed_write(self) -> None:
+        failing = self._bus(fail=True)
+        bus = self._bus()
+
+        async with self.transaction_manager:
+            await failing.publish(Pinged(1))
+            await bus.publish(Pinged(2))
+
+        assert self.session.log == ['commit', 'publish 2']
+
+    async def test_event_outside_transaction_is_published_immediately(self) -> None:
+        await self._bus().publish(Pinged(1))
+
+        assert self.session.log == ['publish 1']
+
+
+@pytest.mark.asyncio
+class TestOutboxEventBus:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.session = FakeSession()
+        self.transaction_manager = TransactionManager(self.session)  # type: ignore
+        self.bus = OutboxEventBus(self.transaction_manager, RecordingEventBus(self.session))  # type: ignore
+
+    async def test_event_is_written_in_request_transaction(self) -> None:
+        async with self.transaction_manager:
+            await self.bus.publish(Pinged(1))
+
+        assert self.session.log == ['add Pinged', 'commit']
+
+    async def test_event_outside_transaction_is_committed_in_its_own(self) -> None:
+        await self.bus.publish_many([Pinged(1), Pinged(2)])
+
+        assert self.session.log == ['add Pinged', 'add Pinged', 'commit']